@@ -1,22 +1,71 @@
+import asyncio
 import logging
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
 
-from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.exceptions import TransactionNotFound
+from web3.types import RPCEndpoint
 
+from src.adapters.blockchain.clients import get_web3
+from src.adapters.blockchain.gas_oracle import GAS_ORACLE
 from src.domain.model import Address, RPC, ID, Wallet
 from src.core.exceptions.exceptions import BlockchainTransactionError
 
 logger = logging.getLogger(__name__)
 
+# JSON-RPC error code eth_sendRawTransactionSync (EIP-7966) returns when the
+# transaction was accepted but not mined within the node's timeout
+_SYNC_SEND_TIMEOUT = 4
+
+# JSON-RPC error codes providers use for a method they do not implement
+# (-32601 method not found, -32004 method not supported)
+_METHOD_UNSUPPORTED_CODES = {-32601, -32004}
+# Providers that answer with a generic code still say so in the message
+_METHOD_UNSUPPORTED_MESSAGE = re.compile(
+    r"method.*(not found|not supported|unsupported|does not exist|not available)|unsupported method",
+    re.IGNORECASE,
+)
+
+# RPC endpoints that answered eth_sendRawTransactionSync with "method not found/unsupported"
+_SYNC_SEND_UNSUPPORTED: Set[str] = set()
+
+# Buffered gas price per RPC endpoint as (fetched_at, price); the price moves per block
+# (~2s on Avalanche), so transactions sent within one block share a single eth_gasPrice
+_GAS_PRICE_TTL = 2.0
+_GAS_PRICES: Dict[str, Tuple[float, int]] = {}
+
+# Contract objects per (client, protocol class, address); building one parses the ABI,
+# and handlers create a protocol per command. Router and factory addresses come from
+# request bodies, so only the most recently used contracts are kept.
+_CONTRACTS: "OrderedDict[Tuple[Any, type, str], Any]" = OrderedDict()
+_CONTRACTS_MAXSIZE = 256
+
+def _is_method_unsupported(error: Dict[str, Any]) -> bool:
+    """Return whether a JSON-RPC error means the node does not implement the method."""
+    return (
+        error.get("code") in _METHOD_UNSUPPORTED_CODES
+        or bool(_METHOD_UNSUPPORTED_MESSAGE.search(str(error.get("message", ""))))
+    )
+
 class Protocol(ABC):
     """Abstract base class for protocol implementations."""
 
     def __init__(self, contract_address: Address, chain_id: ID, rpc_url: RPC):
         self.contract_address = contract_address
         self.chain_id = chain_id
-        self.chain = AsyncWeb3(AsyncHTTPProvider(rpc_url.value))
-        self.contract = self.chain.eth.contract(address=self.contract_address.value, abi=self.abi)
+        self.chain = get_web3(rpc_url)
+        key = (self.chain, type(self), self.contract_address.value)
+        self.contract = _CONTRACTS.get(key)
+        if self.contract is not None:
+            _CONTRACTS.move_to_end(key)
+        else:
+            self.contract = self.chain.eth.contract(address=self.contract_address.value, abi=self.abi)
+            _CONTRACTS[key] = self.contract
+            if len(_CONTRACTS) > _CONTRACTS_MAXSIZE:
+                _CONTRACTS.popitem(last=False)
 
     @property
     @abstractmethod
@@ -34,12 +83,148 @@ class Protocol(ABC):
         """Ensure protocol is bound to a chain and connected."""
         return await self.chain.is_connected()
 
+    async def get_gas_price(self) -> int:
+        """Return the current gas price with a 10% safety buffer.
+
+        The connectivity check and the gas price request are independent, so
+        they are sent concurrently rather than back to back. The result is
+        reused for calls to the same endpoint within _GAS_PRICE_TTL seconds.
+        """
+        endpoint = self.chain.provider.endpoint_uri
+        cached = _GAS_PRICES.get(endpoint)
+        if cached is not None and time.monotonic() - cached[0] < _GAS_PRICE_TTL:
+            return cached[1]
+
+        _, gas_price = await asyncio.gather(self.ensure_chain(), self.chain.eth.gas_price)
+        buffered = int(gas_price * 1.1)  # 10% buffer
+        _GAS_PRICES[endpoint] = (time.monotonic(), buffered)
+        return buffered
+
+    async def send_raw_transaction(self, raw_transaction: bytes) -> Optional[Dict[str, int]]:
+        """Broadcast a signed transaction, returning its receipt when the node can wait for it.
+
+        Nodes implementing eth_sendRawTransactionSync return the receipt in the
+        same round-trip, which saves the receipt polling afterwards. Only a
+        JSON-RPC "method not found/unsupported" answer falls back to a plain
+        eth_sendRawTransaction, and the endpoint skips the sync call from then
+        on. Any other JSON-RPC error is the node rejecting the transaction.
+
+        A transport failure (timeout, HTTP error, dropped connection) says
+        nothing about whether the node took the transaction, so it is looked
+        up by hash first and only resent when the node does not know it. The
+        endpoint is not marked unsupported for a transport failure.
+
+        Returns:
+            Optional[Dict[str, int]]: status, blockNumber and gasUsed of the mined
+                transaction, or None when the receipt still has to be tracked
+
+        Raises:
+            ValueError: If the node rejects the transaction
+        """
+        endpoint = self.chain.provider.endpoint_uri
+        if endpoint in _SYNC_SEND_UNSUPPORTED:
+            await self.chain.eth.send_raw_transaction(raw_transaction)
+            return None
+
+        try:
+            response = await self.chain.provider.make_request(
+                RPCEndpoint("eth_sendRawTransactionSync"), [f"0x{raw_transaction.hex()}"]
+            )
+        except Exception as e:
+            logger.warning(f"eth_sendRawTransactionSync to {endpoint} failed in transport: {e}")
+            if not await self._is_known_transaction(raw_transaction):
+                await self.chain.eth.send_raw_transaction(raw_transaction)
+            return None
+
+        error = response.get("error")
+        if error is None:
+            receipt = response["result"]
+            return {
+                "status": int(receipt["status"], 16),
+                "blockNumber": int(receipt["blockNumber"], 16),
+                "gasUsed": int(receipt["gasUsed"], 16),
+            }
+        if error.get("code") == _SYNC_SEND_TIMEOUT:
+            # Accepted but not mined within the node's timeout; track it as usual
+            return None
+        if not _is_method_unsupported(error):
+            raise ValueError(error.get("message", str(error)))
+
+        logger.info(
+            f"{endpoint} does not support eth_sendRawTransactionSync ({error.get('message', error)}), "
+            f"using eth_sendRawTransaction"
+        )
+        _SYNC_SEND_UNSUPPORTED.add(endpoint)
+        await self.chain.eth.send_raw_transaction(raw_transaction)
+        return None
+
+    async def _is_known_transaction(self, raw_transaction: bytes) -> bool:
+        """Return whether the node already has the signed transaction, pending or mined."""
+        try:
+            await self.chain.eth.get_transaction(self.chain.keccak(raw_transaction))
+        except TransactionNotFound:
+            return False
+        return True
+
+    async def prepare_transaction(
+        self,
+        function_name: str,
+        args: Tuple[Any, ...],
+        params: Dict[str, Any],
+        gas_price: Optional[int] = None,
+        gas_key: Hashable = None
+    ) -> Dict[str, Any]:
+        """Encode a contract call into a transaction with gas price and gas limit set.
+
+        web3's build_transaction runs its own eth_estimateGas when no limit is
+        given, so the call data is encoded directly instead. The gas estimate
+        (unless the gas oracle answers) and the gas price (unless cached) are
+        independent requests and are sent concurrently.
+
+        Args:
+            function_name (str): Name of the contract function to call
+            args (Tuple[Any, ...]): Arguments to pass to the contract function
+            params (Dict[str, Any]): Transaction fields such as from, nonce,
+                chainId and value
+            gas_price (Optional[int]): Buffered gas price fetched by the caller
+            gas_key (Hashable): Extra gas oracle key for calls whose cost depends
+                on their arguments
+
+        Returns:
+            Dict[str, Any]: The unsigned transaction
+        """
+        tx = {
+            'value': 0,
+            **params,
+            'to': self.contract_address.value,
+            'data': self.contract.encode_abi(function_name, args=args),
+        }
+
+        oracle_key = (self.chain_id.value, self.contract_address.value, function_name, gas_key)
+        gas = GAS_ORACLE.get(oracle_key) if GAS_ORACLE is not None else None
+
+        if gas is None:
+            if gas_price is None:
+                gas, gas_price = await asyncio.gather(self.chain.eth.estimate_gas(tx), self.get_gas_price())
+            else:
+                gas = await self.chain.eth.estimate_gas(tx)
+            if GAS_ORACLE is not None:
+                GAS_ORACLE.record(oracle_key, gas)
+        elif gas_price is None:
+            gas_price = await self.get_gas_price()
+
+        tx['gasPrice'] = gas_price
+        tx['gas'] = gas
+        return tx
+
     async def _build_and_send_transaction(
         self,
         function_name: str,
         sender: Wallet,
         nonce: int,
-        *args
+        *args,
+        gas_price: Optional[int] = None,
+        gas_key: Hashable = None
     ) -> dict[str, Any]:
         """Helper method to build and send transactions for nonpayable functions.
 
@@ -48,39 +233,40 @@ class Protocol(ABC):
             sender (Wallet): The wallet initiating the transaction
             nonce (int): Transaction nonce
             *args: Arguments to pass to the contract function
+            gas_price (Optional[int]): Buffered gas price fetched by the caller;
+                fetched here when omitted
+            gas_key (Hashable): Extra gas oracle key for calls whose cost depends
+                on their arguments, such as the token path of a swap
 
         Returns:
-            dict[str, Any]: Transaction details including hash
+            dict[str, Any]: Transaction details including hash, plus the receipt
+                when the node returned it synchronously
 
         Raises:
             BlockchainTransactionError: If the transaction fails
         """
-        await self.ensure_chain()
-
-        # Get the current gas price with safety multiplier
-        gas_price = await self.chain.eth.gas_price
-        gas_price = int(gas_price * 1.1)  # 10% buffer
-
         # Build the transaction
-        contract_function = getattr(self.contract.functions, function_name)
-        tx = await contract_function(*args).build_transaction(
+        tx = await self.prepare_transaction(
+            function_name,
+            args,
             {
                 'from': sender.address.value,
                 'nonce': nonce,
                 'chainId': int(self.chain_id.value),
-                'gasPrice': gas_price,
-            }
+            },
+            gas_price=gas_price,
+            gas_key=gas_key
         )
 
         try:
-            # Estimate gas
-            tx['gas'] = await self.chain.eth.estimate_gas(tx)
             logger.info(f"Gas estimation successful for {function_name} transaction: {tx['gas']} units")
 
             # Sign and send transaction
             signed_tx = sender.account.sign_transaction(tx)
-            tx_hash =await self.chain.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx['txHash'] = f"0x{tx_hash.hex()}"
+            receipt = await self.send_raw_transaction(signed_tx.raw_transaction)
+            tx['txHash'] = f"0x{signed_tx.hash.hex()}"
+            if receipt:
+                tx['receipt'] = receipt
 
             logger.info(f"{function_name} transaction sent with hash: {tx['txHash']}")
             return tx
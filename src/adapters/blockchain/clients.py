@@ -0,0 +1,43 @@
+"""
+Shared Web3 clients, one per RPC endpoint.
+
+Each AsyncHTTPProvider owns its own aiohttp session, so building a provider per
+protocol instance or per receipt poll paid a fresh TCP+TLS handshake every time.
+Protocols and trackers look their client up here instead and reuse the
+keep-alive connections of the provider already bound to that endpoint.
+"""
+
+import logging
+from typing import Dict
+
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from src.domain.model import RPC
+
+logger = logging.getLogger(__name__)
+
+_CLIENTS: Dict[str, AsyncWeb3] = {}
+
+
+def get_web3(rpc_url: RPC) -> AsyncWeb3:
+    """
+    Returns the shared client for `rpc_url`, creating it on first use.
+    """
+    w3 = _CLIENTS.get(rpc_url.value)
+    if w3 is None:
+        w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url.value))
+        _CLIENTS[rpc_url.value] = w3
+    return w3
+
+
+async def close_all() -> None:
+    """
+    Closes the HTTP sessions of every shared client. Called on application shutdown.
+    """
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for w3 in clients:
+        try:
+            await w3.provider.disconnect()
+        except Exception:
+            logger.exception(f"Failed to close Web3 client for {w3.provider.endpoint_uri}")
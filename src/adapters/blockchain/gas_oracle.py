@@ -0,0 +1,82 @@
+"""
+Observed gas limits for well-known contract calls.
+
+eth_estimateGas makes the node binary-search the gas limit by re-executing the
+call, which dominates swap submission time. Calls to the same function on the
+same router and path use a stable amount of gas, so once enough estimates have
+been seen the oracle answers with a high percentile plus headroom instead.
+
+Skipping the estimate also skips the node's revert check, so the oracle is
+opt-in (GAS_ORACLE_ENABLED) and still sends a share of calls to the node to
+keep its samples current.
+"""
+
+import math
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Hashable, Optional
+
+from src import config
+
+
+class GasOracle:
+    """
+    Sliding window of gas estimates per call key.
+
+    Args:
+        window (int): Estimates kept per key.
+        min_samples (int): Estimates required before the oracle answers for a key.
+        headroom (float): Multiplier applied to the observed percentile.
+        refresh_every (int): Every n-th lookup for a key misses on purpose so a
+            fresh estimate is recorded.
+        maxsize (int): Keys tracked at most. Keys include the router address and
+            token path from the request body, so the least recently used key is
+            dropped once the oracle is full.
+    """
+
+    def __init__(
+        self, window: int = 100, min_samples: int = 20, headroom: float = 1.2, refresh_every: int = 10,
+        maxsize: int = 1024
+    ):
+        self._window = window
+        self._min_samples = min_samples
+        self._headroom = headroom
+        self._refresh_every = refresh_every
+        self._maxsize = maxsize
+        self._samples: "OrderedDict[Hashable, Deque[int]]" = OrderedDict()
+        self._lookups: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """
+        Returns the gas limit to use for `key`, or None when the node should estimate it.
+        """
+        samples = self._samples.get(key)
+        if samples is None:
+            return None
+        self._samples.move_to_end(key)
+        if len(samples) < self._min_samples:
+            return None
+        lookups = self._lookups.get(key, 0) + 1
+        self._lookups[key] = lookups
+        if lookups % self._refresh_every == 0:
+            return None
+        p95 = sorted(samples)[math.ceil(len(samples) * 0.95) - 1]
+        return int(p95 * self._headroom)
+
+    def record(self, key: Hashable, gas: int) -> None:
+        """
+        Adds a node estimate for `key`.
+        """
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._window)
+            if len(self._samples) > self._maxsize:
+                evicted, _ = self._samples.popitem(last=False)
+                self._lookups.pop(evicted, None)
+        else:
+            self._samples.move_to_end(key)
+        samples.append(gas)
+
+
+GAS_ORACLE: Optional[GasOracle] = (
+    GasOracle(headroom=config.get_gas_oracle_headroom()) if config.is_gas_oracle_enabled() else None
+)
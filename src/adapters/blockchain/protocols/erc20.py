@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 from src.domain.model import Wallet, Address, Transaction
@@ -6,6 +6,10 @@ from src.adapters.blockchain.base import Protocol
 
 logger = logging.getLogger(__name__)
 
+# name/symbol/decimals never change for a deployed token, so each is read once
+# per (chain, contract) and shared by every protocol instance in the process
+_TOKEN_METADATA: Dict[Tuple[str, str, str], Any] = {}
+
 class ERC20Protocol(Protocol):
     """ERC20 Token Protocol Implementation."""
 
@@ -74,10 +78,7 @@ class ERC20Protocol(Protocol):
         Returns:
             int: The number of decimals for the token
         """
-        await self.ensure_chain()
-        decimals = await self.contract.functions.decimals().call()
-        logger.info(f"Token decimals retrieved: {decimals}")
-        return decimals
+        return await self._get_metadata("decimals")
 
     async def get_name(self) -> str:
         """Get a token name.
@@ -85,10 +86,7 @@ class ERC20Protocol(Protocol):
         Returns:
             str: The name of the token
         """
-        await self.ensure_chain()
-        name = await self.contract.functions.name().call()
-        logger.info(f"Token name retrieved: {name}")
-        return name
+        return await self._get_metadata("name")
 
     async def get_symbol(self) -> str:
         """Get token symbol.
@@ -96,10 +94,16 @@ class ERC20Protocol(Protocol):
         Returns:
             str: The symbol of the token
         """
-        await self.ensure_chain()
-        symbol = await self.contract.functions.symbol().call()
-        logger.info(f"Token symbol retrieved: {symbol}")
-        return symbol
+        return await self._get_metadata("symbol")
+
+    async def _get_metadata(self, function_name: str) -> Any:
+        key = (self.chain_id.value, self.contract_address.value, function_name)
+        if key not in _TOKEN_METADATA:
+            await self.ensure_chain()
+            value = await getattr(self.contract.functions, function_name)().call()
+            logger.info(f"Token {function_name} retrieved: {value}")
+            _TOKEN_METADATA[key] = value
+        return _TOKEN_METADATA[key]
 
     async def get_total_supply(self) -> int:
         """Get the total supply of the token.
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 import logging
 
@@ -138,7 +139,10 @@ class TraderJoeProtocol(Protocol):
     ) -> Dict[str, Any]:
         """Execute swap based on strategy - consolidated logic."""
         amount_out_min = int(amount_in * (1 - max_slippage_percent / 100))
-        wnative_address = await self.get_wnative_address()
+        # Independent RPCs: resolve WNATIVE and price gas concurrently
+        wnative_address, gas_price = await asyncio.gather(
+            self.get_wnative_address(), self.get_gas_price()
+        )
 
         # Convert "NATIVE" to WNATIVE address
         actual_token_from = wnative_address if token_from == "NATIVE" else token_from
@@ -156,17 +160,20 @@ class TraderJoeProtocol(Protocol):
         if token_from == "NATIVE" and token_to != "NATIVE":
             return await self.swap_executor.execute_native_for_tokens(
                 amount_out_min, token_path, pair_bin_steps, versions,
-                deadline, to_address, sender, latest_tx, amount_in
+                deadline, to_address, sender, latest_tx, amount_in,
+                gas_price=gas_price
             )
         elif token_from != "NATIVE" and token_to == "NATIVE":
             return await self.swap_executor.execute_tokens_for_native(
                 amount_in, amount_out_min, token_path, pair_bin_steps,
-                versions, deadline, to_address, sender, latest_tx
+                versions, deadline, to_address, sender, latest_tx,
+                gas_price=gas_price
             )
         else:
             return await self.swap_executor.execute_tokens_for_tokens(
                 amount_in, amount_out_min, token_path, pair_bin_steps,
-                versions, deadline, to_address, sender, latest_tx
+                versions, deadline, to_address, sender, latest_tx,
+                gas_price=gas_price
             )
 
     async def get_wnative_address(self) -> str:
@@ -21,31 +21,31 @@ class SwapExecutor:
         to_address: Address,
         sender: Wallet,
         latest_tx: Optional[Transaction],
-        native_amount: int
+        native_amount: int,
+        gas_price: Optional[int] = None
     ) -> Dict[str, Any]:
         """Execute native to tokens swap."""
-        await self.protocol.ensure_chain()
-
-        gas_price = await self.protocol.chain.eth.gas_price
-        gas_price = int(gas_price * 1.1)
-
         path = (pair_bin_steps, versions, token_path)
 
-        tx = await self.protocol.contract.functions.swapExactNATIVEForTokens(
-            amount_out_min, path, to_address.value, deadline
-        ).build_transaction({
-            'from': sender.address.value,
-            'nonce': latest_tx.nonce.value + 1 if latest_tx else 0,
-            'chainId': int(self.protocol.chain_id.value),
-            'gasPrice': gas_price,
-            'value': native_amount
-        })
+        tx = await self.protocol.prepare_transaction(
+            'swapExactNATIVEForTokens',
+            (amount_out_min, path, to_address.value, deadline),
+            {
+                'from': sender.address.value,
+                'nonce': latest_tx.nonce.value + 1 if latest_tx else 0,
+                'chainId': int(self.protocol.chain_id.value),
+                'value': native_amount
+            },
+            gas_price=gas_price,
+            gas_key=tuple(token_path)
+        )
 
         try:
-            tx['gas'] = await self.protocol.chain.eth.estimate_gas(tx)
             signed_tx = sender.account.sign_transaction(tx)
-            tx_hash = await self.protocol.chain.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx['txHash'] = f"0x{tx_hash.hex()}"
+            receipt = await self.protocol.send_raw_transaction(signed_tx.raw_transaction)
+            tx['txHash'] = f"0x{signed_tx.hash.hex()}"
+            if receipt:
+                tx['receipt'] = receipt
 
             logger.info(f"Native to tokens swap executed: {tx['txHash']}")
             return tx
@@ -64,7 +64,8 @@ class SwapExecutor:
         deadline: int,
         to_address: Address,
         sender: Wallet,
-        latest_tx: Optional[Transaction]
+        latest_tx: Optional[Transaction],
+        gas_price: Optional[int] = None
     ) -> Dict[str, Any]:
         """Execute tokens to native swap."""
         path = (pair_bin_steps, versions, token_path)
@@ -77,7 +78,9 @@ class SwapExecutor:
             amount_out_min,
             path,
             to_address.value,
-            deadline
+            deadline,
+            gas_price=gas_price,
+            gas_key=tuple(token_path)
         )
 
     async def execute_tokens_for_tokens(
@@ -90,7 +93,8 @@ class SwapExecutor:
         deadline: int,
         to_address: Address,
         sender: Wallet,
-        latest_tx: Optional[Transaction]
+        latest_tx: Optional[Transaction],
+        gas_price: Optional[int] = None
     ) -> Dict[str, Any]:
         """Execute tokens to tokens swap."""
         path = (pair_bin_steps, versions, token_path)
@@ -103,5 +107,7 @@ class SwapExecutor:
             amount_out_min,
             path,
             to_address.value,
-            deadline
+            deadline,
+            gas_price=gas_price,
+            gas_key=tuple(token_path)
         )
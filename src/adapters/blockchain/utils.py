@@ -1,10 +1,10 @@
 from typing import Union, Optional
 
-from web3 import AsyncHTTPProvider, AsyncWeb3
 from web3.types import TxReceipt
 from web3.exceptions import TimeExhausted
 import asyncio
 import logging
+from src.adapters.blockchain.clients import get_web3
 from src.adapters.blockchain.protocols.erc20 import ERC20Protocol
 from src.domain.model import Address, ID, RPC, TransactionHash
 from src.core.exceptions.exceptions import BlockchainTransactionError
@@ -30,7 +30,7 @@ async def track_transaction(rpc_url: RPC, tx_hash: TransactionHash, timeout: int
     Raises:
         BlockchainTransactionError: If transaction fails or times out
     """
-    w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url.value))
+    w3 = get_web3(rpc_url)
     try:
         receipt = await w3.eth.wait_for_transaction_receipt(tx_hash.value, timeout=timeout)
 
@@ -46,3 +46,4 @@ async def track_transaction(rpc_url: RPC, tx_hash: TransactionHash, timeout: int
             tx_hash=tx_hash.value,
             error_message=f"Transaction failed: {str(e)}"
         )
+
@@ -48,8 +48,8 @@ wallet_table = Table(
     Column("address", String(42), key="db_address", nullable=False, unique=True),
     Column("private_key_encrypted", Encryption, key="db_private_key_encrypted", nullable=False),
     Column("is_active", Boolean, key="db_is_active", nullable=False, default=True),
-    Column("created_at", DateTime, key="db_created_at", nullable=False, default=func.now()),
-    Index("ix_wallet_user_id", "db_userid"),
+    Column("created_at", DateTime(timezone=True), key="db_created_at", nullable=False, default=func.now()),
+    # userid and address lookups use the indexes behind their unique constraints
 )
 
 # Token table (TraderJoe Avalanche tokens only)
@@ -99,7 +99,8 @@ transaction_table = Table(
     Index("ix_transaction_wallet", "db_wallet_id"),
     Index("ix_transaction_hash", "db_hash"),
     Index("ix_transaction_status", "db_status"),
-    Index("ix_transaction_status_updated_at", "db_status", "db_updated_at")
+    Index("ix_transaction_status_updated_at", "db_status", "db_updated_at"),
+    Index("ix_transaction_wallet_type_created_at", "db_wallet_id", "db_type", "db_created_at")  # per-user history by type, newest first
 )
 
 # Approval transaction table (approval/revoke history)
@@ -257,6 +258,6 @@ def init_orm_mappers():
             "amount_out_actual": composite(Amount, swap_transaction_table.c.db_amount_out_actual),
             "slippage_tolerance": composite(SlippageTolerance, swap_transaction_table.c.db_slippage_tolerance),
             "deadline": swap_transaction_table.c.db_deadline,
-            "router_address": swap_transaction_table.c.db_router_address,
+            "router_address": composite(Address, swap_transaction_table.c.db_router_address),
         },
     )
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Set, Union, List
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple, Union, List
 from sqlalchemy.ext.asyncio import async_session
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.adapters.database.orm import (
+    chain_table, token_table, transaction_table, swap_transaction_table, wallet_table, token_approval_table
+)
 from src.domain.model import (
     ID,
     Wallet,
@@ -10,7 +14,14 @@ from src.domain.model import (
     Swap,
     Approval, ApprovalAmount,
     ApprovalTransaction, ApprovalType,
-    SwapTransaction, SwapType, Chain, TransactionStatus
+    SwapTransaction, SwapType, Chain, TransactionStatus, TransactionType
+)
+
+_SWAP_TRANSACTION_TYPES = (
+    TransactionType.SWAP_NATIVE_TO_TOKEN,
+    TransactionType.SWAP_TOKEN_TO_NATIVE,
+    TransactionType.SWAP_TOKEN_TO_TOKEN,
+    TransactionType.TRADERJOE_SWAP,
 )
 
 
@@ -32,6 +43,17 @@ class AbstractRepository(ABC):
         self._add_wallet(wallet)
         self.seen.add(wallet)
 
+    async def add_wallet_if_absent(self, wallet: Wallet) -> bool:
+        """
+        Inserts a wallet unless one with the same id, userid or address exists.
+
+        Returns True and marks the wallet as seen when it was inserted.
+        """
+        inserted = await self._add_wallet_if_absent(wallet)
+        if inserted:
+            self.seen.add(wallet)
+        return inserted
+
     async def get_wallet(self, wallet_id: Union[ID, str]) -> Wallet | None:
         """Retrieves a wallet by its ID and marks it as seen if found."""
         wallet = await self._get_wallet(wallet_id)
@@ -53,11 +75,37 @@ class AbstractRepository(ABC):
             self.seen.add(wallet)
         return wallet
 
+    async def get_wallet_summary_by_userid(self, userid: Union[ID, str]) -> Dict[str, Any] | None:
+        """Retrieves a user's wallet as a plain column dict, without the key; nothing is hydrated or marked as seen."""
+        return await self._get_wallet_summary_by_userid(userid)
+
     def add_chain(self, chain: Chain):
         """Adds a token to the repository and marks it as seen."""
         self._add_chain(chain)
         self.seen.add(chain)
 
+    async def add_chain_if_absent(self, chain: Chain) -> bool:
+        """
+        Inserts a chain unless one with the same id, name, symbol or RPC URL exists.
+
+        Returns True and marks the chain as seen when it was inserted.
+        """
+        inserted = await self._add_chain_if_absent(chain)
+        if inserted:
+            self.seen.add(chain)
+        return inserted
+
+    async def bulk_add_chains_if_absent(self, chains: List[Chain]) -> int:
+        """
+        Inserts all chains in a single statement, skipping conflicting ones.
+
+        Returns the number of chains inserted. Chains are not marked as seen,
+        so no ChainAdded events are raised for bulk (seed) inserts.
+        """
+        if not chains:
+            return 0
+        return await self._bulk_add_chains_if_absent(chains)
+
     async def get_chain(self, chain_id: Union[ID, str]) -> Chain | None:
         """Retrieves a token by its ID and marks it as seen if found."""
         chain = await self._get_chain(chain_id)
@@ -77,12 +125,38 @@ class AbstractRepository(ABC):
         for chain in chains:
             self.seen.add(chain)
         return chains
+
+    async def list_chains_projection(self) -> List[Dict[str, Any]]:
+        """Retrieves all chains as plain column dicts; nothing is hydrated or marked as seen."""
+        return await self._list_chains_projection()
     # Token methods
     def add_token(self, token: Token):
         """Adds a token to the repository and marks it as seen."""
         self._add_token(token)
         self.seen.add(token)
 
+    async def add_token_if_absent(self, token: Token) -> bool:
+        """
+        Inserts a token unless one with the same symbol exists.
+
+        Returns True and marks the token as seen when it was inserted.
+        """
+        inserted = await self._add_token_if_absent(token)
+        if inserted:
+            self.seen.add(token)
+        return inserted
+
+    async def bulk_add_tokens_if_absent(self, tokens: List[Token]) -> int:
+        """
+        Inserts all tokens in a single statement, skipping symbols that already exist.
+
+        Returns the number of tokens inserted. Tokens are not marked as seen,
+        so no TokenAdded events are raised for bulk (seed) inserts.
+        """
+        if not tokens:
+            return 0
+        return await self._bulk_add_tokens_if_absent(tokens)
+
     async def get_token(self, token_id: Union[ID, str]) -> Token | None:
         """Retrieves a token by its ID and marks it as seen if found."""
         token = await self._get_token(token_id)
@@ -90,6 +164,15 @@ class AbstractRepository(ABC):
             self.seen.add(token)
         return token
 
+    async def get_token_with_chain(self, token_id: Union[ID, str]) -> Tuple[Token, Chain] | None:
+        """Retrieves a token together with its chain in one query and marks both as seen."""
+        row = await self._get_token_with_chain(token_id)
+        if row:
+            token, chain = row
+            self.seen.add(token)
+            self.seen.add(chain)
+        return row
+
     async def get_token_by_symbol(self, symbol: Union[Symbol, str]) -> Token | None:
         """Retrieves a token by its symbol and network."""
         token = await self._get_token_by_symbol(symbol)
@@ -111,6 +194,10 @@ class AbstractRepository(ABC):
             self.seen.add(token)
         return tokens
 
+    async def list_tokens_projection(self) -> List[Dict[str, Any]]:
+        """Retrieves all supported tokens as plain column dicts; nothing is hydrated or marked as seen."""
+        return await self._list_tokens_projection()
+
     # Transaction methods
     def add_transaction(self, transaction: Transaction):
         """Adds a transaction to the repository and marks it as seen."""
@@ -138,6 +225,12 @@ class AbstractRepository(ABC):
             self.seen.add(transaction)
         return transactions
 
+    async def iter_user_transactions(self, userid: Union[ID, str], limit: int = 50) -> AsyncIterator[Transaction]:
+        """Streams transactions for a user, newest first, marking each as seen as it arrives."""
+        async for transaction in self._iter_user_transactions(userid, limit):
+            self.seen.add(transaction)
+            yield transaction
+
     async def get_pending_transactions(self) -> List[Transaction]:
         """Retrieves all pending transactions for monitoring."""
         transactions = await self._get_pending_transactions()
@@ -165,6 +258,10 @@ class AbstractRepository(ABC):
             self.seen.add(swap)
         return swap
 
+    async def get_user_swap_history(self, userid: Union[ID, str], limit: int = 50) -> List[Dict[str, Any]]:
+        """Retrieves a user's swap transactions, newest first, as plain column dicts; nothing is hydrated or marked as seen."""
+        return await self._get_user_swap_history(userid, limit)
+
     # Token Approval methods
     def add_token_approval(self, token_approval: Approval):
         """Adds a token approval to the repository and marks it as seen."""
@@ -180,6 +277,15 @@ class AbstractRepository(ABC):
 
 
     # Approval Transaction methods
+    async def get_user_approved_amount(
+            self, userid: Union[ID, str], token_id: Union[ID, str]
+    ) -> Tuple[bool, Optional[int]]:
+        """
+        Returns whether the user has a wallet and its approved amount for the token (None when
+        never approved) in one query; nothing is hydrated or marked as seen.
+        """
+        return await self._get_user_approved_amount(userid, token_id)
+
     def add_approval_transaction(self, approval_transaction: ApprovalTransaction):
         """Adds an approval transaction to the repository and marks it as seen."""
         self._add_approval_transaction(approval_transaction)
@@ -202,6 +308,10 @@ class AbstractRepository(ABC):
     def _add_wallet(self, wallet: Wallet):
         raise NotImplementedError
 
+    @abstractmethod
+    async def _add_wallet_if_absent(self, wallet: Wallet) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     async def _get_wallet(self, wallet_id: Union[ID, str]) -> Wallet | None:
         raise NotImplementedError
@@ -214,6 +324,10 @@ class AbstractRepository(ABC):
     async def _get_wallet_by_userid(self, userid: Union[ID, str]) -> Wallet | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def _get_wallet_summary_by_userid(self, userid: Union[ID, str]) -> Dict[str, Any] | None:
+        raise NotImplementedError
+
     @abstractmethod
     def _add_chain(self, chain: Chain):
         raise NotImplementedError
@@ -266,6 +380,10 @@ class AbstractRepository(ABC):
     async def _get_user_transactions(self, userid: Union[ID, str], limit: int) -> List[Transaction]:
         raise NotImplementedError
 
+    @abstractmethod
+    def _iter_user_transactions(self, userid: Union[ID, str], limit: int) -> AsyncIterator[Transaction]:
+        raise NotImplementedError
+
     @abstractmethod
     async def _get_pending_transactions(self) -> List[Transaction]:
         raise NotImplementedError
@@ -282,6 +400,10 @@ class AbstractRepository(ABC):
     async def _get_swap_by_transaction_id(self, transaction_id: Union[ID, str]) -> Swap | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def _get_user_swap_history(self, userid: Union[ID, str], limit: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
     @abstractmethod
     def _add_token_approval(self, token_approval: Approval):
         raise NotImplementedError
@@ -290,6 +412,12 @@ class AbstractRepository(ABC):
     async def _get_token_approval(self, approval_id: Union[ID, str]) -> Approval | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def _get_user_approved_amount(
+            self, userid: Union[ID, str], token_id: Union[ID, str]
+    ) -> Tuple[bool, Optional[int]]:
+        raise NotImplementedError
+
     @abstractmethod
     def _add_approval_transaction(self, approval_transaction: ApprovalTransaction):
         raise NotImplementedError
@@ -302,6 +430,34 @@ class AbstractRepository(ABC):
     async def _get_last_confirmed_transaction(self, chain_id: Union[ID, str], wallet_id: Union[ID, str]) -> Transaction:
         raise NotImplementedError
 
+    @abstractmethod
+    async def _add_chain_if_absent(self, chain: Chain) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _get_token_with_chain(self, token_id: Union[ID, str]) -> Tuple[Token, Chain] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _add_token_if_absent(self, token: Token) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _bulk_add_chains_if_absent(self, chains: List[Chain]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _bulk_add_tokens_if_absent(self, tokens: List[Token]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _list_chains_projection(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _list_tokens_projection(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
 
 class SqlAlchemyRepository(AbstractRepository):
     """
@@ -319,6 +475,23 @@ class SqlAlchemyRepository(AbstractRepository):
     def _add_wallet(self, wallet: Wallet):
         self.session.add(wallet)
 
+    async def _add_wallet_if_absent(self, wallet: Wallet) -> bool:
+        stmt = (
+            pg_insert(wallet_table)
+            .values(
+                db_id=wallet.wallet_id.value,
+                db_userid=wallet.userid.value,
+                db_address=wallet.address.value,
+                db_private_key_encrypted=wallet.account,
+                db_is_active=wallet.is_active,
+                db_created_at=wallet.created_at,
+            )
+            .on_conflict_do_nothing()
+            .returning(wallet_table.c.db_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
     async def _get_wallet(self, wallet_id: Union[ID, str]) -> Wallet | None:
         wallet_id = wallet_id if isinstance(wallet_id, ID) else ID(wallet_id)
         stmt = select(Wallet).where(Wallet.wallet_id == wallet_id)
@@ -337,9 +510,50 @@ class SqlAlchemyRepository(AbstractRepository):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def _get_wallet_summary_by_userid(self, userid: Union[ID, str]) -> Dict[str, Any] | None:
+        userid = userid.value if isinstance(userid, ID) else userid
+        stmt = select(
+            wallet_table.c.db_id.label("wallet_id"),
+            wallet_table.c.db_userid.label("userid"),
+            wallet_table.c.db_address.label("address"),
+            wallet_table.c.db_is_active.label("is_active"),
+            wallet_table.c.db_created_at.label("created_at"),
+        ).where(wallet_table.c.db_userid == userid)
+        row = (await self.session.execute(stmt)).mappings().first()
+        return dict(row) if row else None
+
     def _add_chain(self, chain: Chain):
         self.session.add(chain)
 
+    @staticmethod
+    def _chain_row(chain: Chain) -> Dict[str, Any]:
+        return dict(
+            db_id=chain.chain_id.value,
+            db_name=chain.name.value,
+            db_symbol=chain.symbol.value,
+            db_rpc_url=chain.rpc_url.value,
+        )
+
+    async def _add_chain_if_absent(self, chain: Chain) -> bool:
+        stmt = (
+            pg_insert(chain_table)
+            .values(**self._chain_row(chain))
+            .on_conflict_do_nothing()
+            .returning(chain_table.c.db_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def _bulk_add_chains_if_absent(self, chains: List[Chain]) -> int:
+        stmt = (
+            pg_insert(chain_table)
+            .values([self._chain_row(chain) for chain in chains])
+            .on_conflict_do_nothing()
+            .returning(chain_table.c.db_id)
+        )
+        result = await self.session.execute(stmt)
+        return len(result.all())
+
     async def _get_chain(self, chain_id: Union[ID, str]) -> Chain | None:
         chain_id = chain_id if isinstance(chain_id, ID) else ID(chain_id)
         stmt = select(Chain).where(Chain.chain_id == chain_id)
@@ -357,16 +571,68 @@ class SqlAlchemyRepository(AbstractRepository):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def _list_chains_projection(self) -> List[Dict[str, Any]]:
+        stmt = select(
+            chain_table.c.db_id.label("chain_id"),
+            chain_table.c.db_name.label("name"),
+            chain_table.c.db_symbol.label("symbol"),
+            chain_table.c.db_rpc_url.label("rpc_url"),
+        )
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     # Token implementations
     def _add_token(self, token: Token):
         self.session.add(token)
 
+    @staticmethod
+    def _token_row(token: Token) -> Dict[str, Any]:
+        return dict(
+            db_id=token.token_id.value,
+            db_chain_id=token.chain_id.value,
+            db_symbol=token.symbol.value,
+            db_name=token.name.value,
+            db_contract_address=token.contract_address.value,
+            db_decimals=token.decimals.value,
+        )
+
+    async def _add_token_if_absent(self, token: Token) -> bool:
+        stmt = (
+            pg_insert(token_table)
+            .values(**self._token_row(token))
+            .on_conflict_do_nothing(index_elements=[token_table.c.db_symbol])
+            .returning(token_table.c.db_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def _bulk_add_tokens_if_absent(self, tokens: List[Token]) -> int:
+        stmt = (
+            pg_insert(token_table)
+            .values([self._token_row(token) for token in tokens])
+            .on_conflict_do_nothing(index_elements=[token_table.c.db_symbol])
+            .returning(token_table.c.db_id)
+        )
+        result = await self.session.execute(stmt)
+        return len(result.all())
+
     async def _get_token(self, token_id: Union[ID, str]) -> Token | None:
         token_id = token_id if isinstance(token_id, ID) else ID(token_id)
         stmt = select(Token).where(Token.token_id == token_id)
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def _get_token_with_chain(self, token_id: Union[ID, str]) -> Tuple[Token, Chain] | None:
+        token_id = token_id if isinstance(token_id, ID) else ID(token_id)
+        stmt = (
+            select(Token, Chain)
+            .join(chain_table, token_table.c.db_chain_id == chain_table.c.db_id)
+            .where(Token.token_id == token_id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        return tuple(row) if row else None
+
     async def _get_token_by_symbol(self, symbol: Union[Symbol, str]) -> Token | None:
         symbol = symbol if isinstance(symbol, Symbol) else Symbol(symbol)
         stmt = select(Token).where(Token.symbol == symbol)
@@ -384,6 +650,18 @@ class SqlAlchemyRepository(AbstractRepository):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def _list_tokens_projection(self) -> List[Dict[str, Any]]:
+        stmt = select(
+            token_table.c.db_id.label("token_id"),
+            token_table.c.db_chain_id.label("chain_id"),
+            token_table.c.db_symbol.label("symbol"),
+            token_table.c.db_name.label("name"),
+            token_table.c.db_contract_address.label("contract_address"),
+            token_table.c.db_decimals.label("decimals"),
+        )
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     # Transaction implementations
     def _add_transaction(self, transaction: Transaction):
         self.session.add(transaction)
@@ -402,18 +680,34 @@ class SqlAlchemyRepository(AbstractRepository):
         return result.scalars().first()
 
     async def _get_user_transactions(self, userid: Union[ID, str], limit: int) -> List[Transaction]:
-        userid = userid if isinstance(userid, ID) else ID(userid)
+        userid = userid.value if isinstance(userid, ID) else userid
+        # Transactions reference their wallet only; the user is reached through it
         stmt = (
             select(Transaction)
-            .where(Transaction.userid == userid)
+            .join(wallet_table, wallet_table.c.db_id == transaction_table.c.db_wallet_id)
+            .where(wallet_table.c.db_userid == userid)
             .order_by(Transaction.created_at.desc())
             .limit(limit)
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def _iter_user_transactions(self, userid: Union[ID, str], limit: int) -> AsyncIterator[Transaction]:
+        userid = userid.value if isinstance(userid, ID) else userid
+        # Transactions reference their wallet only; the user is reached through it
+        stmt = (
+            select(Transaction)
+            .join(wallet_table, wallet_table.c.db_id == transaction_table.c.db_wallet_id)
+            .where(wallet_table.c.db_userid == userid)
+            .order_by(Transaction.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for transaction in result:
+            yield transaction
+
     async def _get_pending_transactions(self) -> List[Transaction]:
-        stmt = select(Transaction).where(Transaction.status == TransactionStatus.PENDING)
+        stmt = select(Transaction).where(Transaction.transaction_status == TransactionStatus.PENDING)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -433,6 +727,37 @@ class SqlAlchemyRepository(AbstractRepository):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def _get_user_swap_history(self, userid: Union[ID, str], limit: int) -> List[Dict[str, Any]]:
+        userid = userid.value if isinstance(userid, ID) else userid
+        stmt = (
+            select(
+                swap_transaction_table.c.db_id.label("swap_transaction_id"),
+                swap_transaction_table.c.db_transaction_id.label("transaction_id"),
+                transaction_table.c.db_type.label("swap_type"),
+                swap_transaction_table.c.db_token_in_id.label("token_in_id"),
+                swap_transaction_table.c.db_token_out_id.label("token_out_id"),
+                swap_transaction_table.c.db_amount_in.label("amount_in"),
+                swap_transaction_table.c.db_amount_out_expected.label("amount_out_expected"),
+                swap_transaction_table.c.db_amount_out_actual.label("amount_out_actual"),
+                swap_transaction_table.c.db_slippage_tolerance.label("slippage_tolerance"),
+                swap_transaction_table.c.db_deadline.label("deadline"),
+                swap_transaction_table.c.db_router_address.label("router_address"),
+            )
+            .select_from(
+                transaction_table
+                .join(swap_transaction_table, swap_transaction_table.c.db_transaction_id == transaction_table.c.db_id)
+                .join(wallet_table, wallet_table.c.db_id == transaction_table.c.db_wallet_id)
+            )
+            .where(
+                wallet_table.c.db_userid == userid,
+                transaction_table.c.db_type.in_(_SWAP_TRANSACTION_TYPES),
+            )
+            .order_by(transaction_table.c.db_created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     # Token Approval implementations
     def _add_token_approval(self, token_approval: Approval):
         self.session.add(token_approval)
@@ -444,6 +769,28 @@ class SqlAlchemyRepository(AbstractRepository):
         return result.scalars().first()
 
     # Approval Transaction implementations
+    async def _get_user_approved_amount(
+            self, userid: Union[ID, str], token_id: Union[ID, str]
+    ) -> Tuple[bool, Optional[int]]:
+        userid = userid.value if isinstance(userid, ID) else userid
+        token_id = token_id.value if isinstance(token_id, ID) else token_id
+        stmt = (
+            select(wallet_table.c.db_id, token_approval_table.c.db_approved_amount)
+            .select_from(
+                wallet_table.outerjoin(
+                    token_approval_table,
+                    (token_approval_table.c.db_wallet_id == wallet_table.c.db_id)
+                    & (token_approval_table.c.db_token_id == token_id),
+                )
+            )
+            .where(wallet_table.c.db_userid == userid)
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return False, None
+        _, approved_amount = row
+        return True, int(approved_amount) if approved_amount is not None else None
+
     def _add_approval_transaction(self, approval_transaction: ApprovalTransaction):
         self.session.add(approval_transaction)
 
@@ -2,12 +2,13 @@ import json
 import time
 import asyncio
 import logging
+import weakref
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 import aio_pika
-from aio_pika.abc import DeliveryMode
+from aio_pika.abc import DeliveryMode, AbstractChannel, AbstractExchange
 from src.adapters.message_broker.connection_manager import AbstractConnectionManager
 from src.core.correlation.context import get_correlation_id
 from src.core.exceptions.exceptions import EventSerializationException, ConnectionClosedException
@@ -125,6 +126,11 @@ class EventPublisher(AbstractEventPublisher):
         self._batch_size = batch_size
         self._publish_timeout = publish_timeout
         self._closed = False
+        # Exchanges already declared on each pooled channel, so a publish does not
+        # pay a declare round-trip every time. Entries go away with their channel.
+        self._declared_exchanges: "weakref.WeakKeyDictionary[AbstractChannel, Dict[str, AbstractExchange]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         logger.info("RabbitMQ Event Publisher initialized.")
 
@@ -192,6 +198,28 @@ class EventPublisher(AbstractEventPublisher):
 
         return aio_pika_message, options
 
+    async def _get_exchange(self, channel: AbstractChannel, exchange_name: str) -> AbstractExchange:
+        """
+        Returns the exchange for a channel, declaring it only on first use.
+
+        Args:
+            channel (AbstractChannel): The channel to publish on.
+            exchange_name (str): Name of the topic exchange.
+
+        Returns:
+            AbstractExchange: The declared exchange.
+        """
+        exchanges = self._declared_exchanges.setdefault(channel, {})
+        exchange = exchanges.get(exchange_name)
+        if exchange is None:
+            exchange = await channel.declare_exchange(
+                exchange_name,
+                aio_pika.ExchangeType.TOPIC,
+                durable=True
+            )
+            exchanges[exchange_name] = exchange
+        return exchange
+
     async def _publish_with_retry(
             self,
             event: Any,
@@ -214,11 +242,7 @@ class EventPublisher(AbstractEventPublisher):
             try:
                 start_time = time.time()
                 async with self._connection_manager.get_channel() as channel:
-                    exchange = await channel.declare_exchange(
-                        exchange_name,
-                        aio_pika.ExchangeType.TOPIC,
-                        durable=True
-                    )
+                    exchange = await self._get_exchange(channel, exchange_name)
 
                     await exchange.publish(
                         aio_pika_message,
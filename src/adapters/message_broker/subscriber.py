@@ -6,7 +6,7 @@ import aio_pika
 from enum import Enum
 from src.core.events import events # Assuming this module contains base Event and specific event classes
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, Tuple, Type
+from typing import Any, Dict, Optional, List, Set, Tuple, Type
 from src.service_layer.messagebus import MessageBus
 from src.core.correlation.context import set_correlation_id
 from src.adapters.message_broker.connection_manager import AbstractConnectionManager
@@ -62,6 +62,8 @@ class EventSubscriber(AbstractEventSubscriber):
         prefetch_count: int = 1,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        ack_batch_size: int = 32,
+        ack_batch_interval: float = 0.05,
         event_registry: Optional[Dict[str, Type[events.Event]]] = None
     ):
         """
@@ -78,6 +80,8 @@ class EventSubscriber(AbstractEventSubscriber):
             prefetch_count (int): Max number of messages to process concurrently.
             max_retries (int): Max retries for failed messages.
             retry_delay (float): Initial delay in seconds for retries.
+            ack_batch_size (int): Successful messages to collect before a multi-ack is sent.
+            ack_batch_interval (float): Max seconds a successful message waits for its ack.
             event_registry (Optional[Dict[str, Type[events.Event]]]): Map of event type names to classes.
         """
         if exchange_name and not routing_key and exchange_type != ExchangeType.FANOUT:
@@ -98,6 +102,11 @@ class EventSubscriber(AbstractEventSubscriber):
         self._prefetch_count = prefetch_count
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._ack_batch_size = ack_batch_size
+        self._ack_batch_interval = ack_batch_interval
+        self._in_flight: Set[int] = set()
+        self._pending_acks: Dict[int, AbstractIncomingMessage] = {}
+        self._ack_lock = asyncio.Lock()
         self._event_registry = event_registry if event_registry is not None else EVENT_REGISTRY
 
         logger.info(f"EventSubscriber initialized for queue '{self._queue_name}'.")
@@ -179,13 +188,17 @@ class EventSubscriber(AbstractEventSubscriber):
             )
         set_correlation_id(correlation_id)
 
+        self._in_flight.add(message.delivery_tag)
         try:
             message.headers['x-retry-count'] = retry_count + 1
             result = await self._process_message(message.body, headers)
 
             if result == ProcessingResult.SUCCESS:
-                await message.ack()
-                logger.info(f"Message (ID: {message.delivery_tag}, CID: {correlation_id}) acknowledged.")
+                self._in_flight.discard(message.delivery_tag)
+                self._pending_acks[message.delivery_tag] = message
+                logger.debug(f"Message (ID: {message.delivery_tag}, CID: {correlation_id}) queued for ack.")
+                if len(self._pending_acks) >= self._ack_batch_size:
+                    await self._flush_acks()
             elif result == ProcessingResult.REJECTED:
                 await message.reject(requeue=False)
                 logger.warning(f"Message (ID: {message.delivery_tag}, CID: {correlation_id}) rejected permanently.")
@@ -198,6 +211,49 @@ class EventSubscriber(AbstractEventSubscriber):
                 "Rejecting permanently."
             )
             await message.reject(requeue=False)
+        finally:
+            self._in_flight.discard(message.delivery_tag)
+
+    async def _flush_acks(self) -> None:
+        """
+        Acknowledges buffered successful messages with a single multi-ack.
+
+        A multi-ack settles every outstanding delivery tag up to the one sent, so
+        only tags below the lowest still in-flight message are covered; anything
+        newer stays buffered until the messages before it have been settled.
+        Failed and rejected messages are always settled individually.
+        """
+        async with self._ack_lock:
+            if not self._pending_acks:
+                return
+
+            watermark = min(self._in_flight) if self._in_flight else None
+            ackable = [
+                tag for tag in self._pending_acks
+                if watermark is None or tag < watermark
+            ]
+            if not ackable:
+                return
+
+            last_tag = max(ackable)
+            last_message = self._pending_acks[last_tag]
+            for tag in ackable:
+                del self._pending_acks[tag]
+
+            try:
+                await last_message.ack(multiple=True)
+                logger.info(f"Acknowledged {len(ackable)} message(s) up to delivery tag {last_tag}.")
+            except Exception:
+                # The channel was likely re-established; the broker redelivers these.
+                logger.exception(f"Batch ack up to delivery tag {last_tag} failed.")
+
+    async def _ack_flusher(self) -> None:
+        """
+        Periodically flushes buffered acks so a partial batch is not held indefinitely.
+        """
+        while True:
+            await asyncio.sleep(self._ack_batch_interval)
+            await self._flush_acks()
 
     async def _process_message(self, message_body: bytes, headers: Dict[str, Any]) -> ProcessingResult:
         """
@@ -217,7 +273,8 @@ class EventSubscriber(AbstractEventSubscriber):
                 return ProcessingResult.REJECTED
 
             logger.info(f"Dispatching event: {type(event).__name__}.")
-            await self._messagebus.handle(event)
+            # A failed handler must fail the delivery so it is retried rather than batch-acked
+            await self._messagebus.handle(event, raise_event_errors=True)
 
             logger.info(f"Event '{type(event).__name__}' processed successfully.")
             return ProcessingResult.SUCCESS
@@ -313,8 +370,20 @@ class EventSubscriber(AbstractEventSubscriber):
                 logger.info(
                     f"Consumer started for queue '{self._queue_name}' (prefetch_count={self._prefetch_count})."
                 )
-                await queue.consume(self._handle_message, no_ack=False)
-                await self._stop_event.wait()
+                consumer_tag = await queue.consume(self._handle_message, no_ack=False)
+                ack_flusher = asyncio.create_task(self._ack_flusher())
+                try:
+                    await self._stop_event.wait()
+                finally:
+                    ack_flusher.cancel()
+                    # Stop deliveries first so nothing new is prefetched while
+                    # pending acks are flushed; unacked messages go back to the
+                    # broker when the channel closes.
+                    try:
+                        await queue.cancel(consumer_tag)
+                    except Exception as e:
+                        logger.warning(f"Failed to cancel consumer for queue '{self._queue_name}': {e}")
+                    await self._flush_acks()
 
         except asyncio.CancelledError:
             logger.info(f"Consumer for queue '{self._queue_name}' was cancelled.")
@@ -1,6 +1,15 @@
+import asyncio
 import inspect
+import json
+import logging
 from src.service_layer import handlers, messagebus, unit_of_work
+from src.service_layer.account_pool import AccountPool
 from src.adapters.message_broker import connection_manager, publisher
+from src.domain import commands
+from src.domain.model import Chain, Token, new_id
+from src.service_layer.reference_data import ReferenceDataCache
+
+logger = logging.getLogger(__name__)
 
 
 def bootstrap(
@@ -8,6 +17,10 @@ def bootstrap(
         suow: unit_of_work.AbstractUnitOfWork = None,
         conn: connection_manager.AbstractConnectionManager = None,
         pub: publisher.AbstractEventPublisher = None,
+        cache: ReferenceDataCache = None,
+        tracking_queue: asyncio.Queue = None,
+        wallet_cache: ReferenceDataCache = None,
+        account_pool: AccountPool = None,
 ) -> messagebus.MessageBus:
     """
         initializes and configures the message bus with dependency-injected handlers.
@@ -25,6 +38,17 @@ def bootstrap(
                 manager for message broker interactions. Defaults to None.
             pub (publisher.AbstractEventPublisher, optional): The event publisher
                 for sending domain events. Defaults to None.
+            cache (ReferenceDataCache, optional): The chain/token reference data
+                cache invalidated by the admin handlers. Defaults to None.
+            tracking_queue (asyncio.Queue, optional): The queue drained by the
+                transaction tracking workers. When omitted, transactions are
+                tracked inline by the event handler. Defaults to None.
+            wallet_cache (ReferenceDataCache, optional): The per-user wallet
+                summary cache dropped by the wallet activation handlers.
+                Defaults to None.
+            account_pool (AccountPool, optional): The pre-generated accounts
+                taken by the wallet creation handler. When omitted, keys are
+                derived per command. Defaults to None.
             w3 (AbstractBlockchainAdapter, optional): The blockchain
                 adapter for Web3 interactions. Defaults to None.
 
@@ -37,6 +61,10 @@ def bootstrap(
         "suow": suow, # Standby Unit of Work for reading database operations
         "conn": conn,
         "pub": pub,
+        "cache": cache,
+        "tracking_queue": tracking_queue,
+        "wallet_cache": wallet_cache,
+        "account_pool": account_pool,
     }
     injected_event_handlers = {
         event_type: [
@@ -82,3 +110,67 @@ def inject_dependencies(handler, dependencies):
         if name in params
     }
     return lambda message: handler(message, **deps)
+
+
+async def seed_reference_data(puow: unit_of_work.AbstractUnitOfWork, seed_path: str) -> None:
+    """
+    Inserts the supported chains and tokens listed in a JSON seed file.
+
+    The file holds a "chains" list (chain_id, name, symbol, rpc_url) and a
+    "tokens" list (chain_id, symbol, name, contract_address, decimals).
+    Each list is written with one multi-row insert in a single transaction,
+    and entries that already exist are skipped, so seeding is safe to run on
+    every startup. A missing or unreadable file is logged and skipped, leaving
+    the reference data already in the database as it is.
+
+    Args:
+        puow (unit_of_work.AbstractUnitOfWork): The Unit of Work instance
+            for primary database operations.
+        seed_path (str): Path of the JSON seed file.
+    """
+    try:
+        with open(seed_path, "rb") as seed_file:
+            seed = json.load(seed_file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skipping reference data seeding, could not load {seed_path}: {e}")
+        return
+
+    chains = [Chain.create(**entry) for entry in seed.get("chains", [])]
+    tokens = [Token.create(token_id=new_id(), **entry) for entry in seed.get("tokens", [])]
+
+    async with puow:
+        added_chains = await puow.repo.bulk_add_chains_if_absent(chains)
+        added_tokens = await puow.repo.bulk_add_tokens_if_absent(tokens)
+    logger.info(
+        f"Seeded reference data from {seed_path}: "
+        f"{added_chains}/{len(chains)} chains, {added_tokens}/{len(tokens)} tokens added"
+    )
+
+
+async def resume_transaction_tracking(puow: unit_of_work.AbstractUnitOfWork, tracking_queue: asyncio.Queue) -> int:
+    """
+    Queues a tracking job for every transaction still PENDING in the database.
+
+    Tracking jobs live only in memory, so those still queued when the previous
+    process stopped were lost. Running this on startup picks them back up;
+    transactions that were already being tracked elsewhere are skipped by the
+    handler once their status has moved on.
+
+    Args:
+        puow (unit_of_work.AbstractUnitOfWork): The Unit of Work instance
+            for primary database operations.
+        tracking_queue (asyncio.Queue): The queue drained by the tracking workers.
+
+    Returns:
+        int: The number of transactions queued.
+    """
+    async with puow.readonly():
+        pending = await puow.repo.get_pending_transactions()
+    for transaction in pending:
+        await messagebus.submit(
+            tracking_queue,
+            commands.TrackTransactionCommand(transaction_id=transaction.transaction_id.value)
+        )
+    if pending:
+        logger.info(f"Resumed tracking for {len(pending)} pending transactions")
+    return len(pending)
@@ -35,6 +35,36 @@ def get_primary_url(is_async: bool):
     return f"postgresql{'+asyncpg' if is_async else '+psycopg2'}://{quote(username)}{password_part}@{host}:{port}/{database}"
 
 
+def get_db_pool_size() -> int:
+    """
+    Get the number of persistent connections kept per database engine.
+
+    Returns:
+        int: Pool size, defaults to 20
+    """
+    return int(os.getenv('DB_POOL_SIZE', '20'))
+
+
+def get_db_max_overflow() -> int:
+    """
+    Get how many connections may be opened beyond the pool size under burst load.
+
+    Returns:
+        int: Max overflow, defaults to 10
+    """
+    return int(os.getenv('DB_MAX_OVERFLOW', '10'))
+
+
+def get_db_pool_recycle() -> int:
+    """
+    Get the age in seconds after which pooled connections are replaced.
+
+    Returns:
+        int: Recycle interval, defaults to 1800
+    """
+    return int(os.getenv('DB_POOL_RECYCLE', '1800'))
+
+
 def get_rabbitmq_url():
     if os.getenv('RABBITMQ_URL'):
         return os.getenv('RABBITMQ_URL')
@@ -72,6 +102,139 @@ def get_avalanche_rpc_url():
     return "https://api.avax.network/ext/bc/C/rpc"
 
 
+def get_command_worker_count() -> int:
+    """
+    Get the number of background workers draining the in-process command queue.
+
+    Returns:
+        int: Worker count, defaults to 4
+    """
+    return int(os.getenv('COMMAND_WORKERS', '4'))
+
+
+def get_tracking_worker_count() -> int:
+    """
+    Get the number of background workers waiting on transaction receipts.
+
+    Returns:
+        int: Worker count, defaults to 16
+    """
+    return int(os.getenv('TRACKING_WORKERS', '16'))
+
+
+def get_tracking_concurrency_per_rpc() -> int:
+    """
+    Get the maximum number of receipts awaited concurrently against one RPC endpoint.
+
+    Returns:
+        int: Concurrent receipt polls per RPC URL, defaults to 8
+    """
+    return int(os.getenv('TRACKING_CONCURRENCY_PER_RPC', '8'))
+
+
+def get_prefetch_count() -> int:
+    """
+    Get the RabbitMQ consumer prefetch (QoS) count.
+
+    Returns:
+        int: Max unacknowledged messages in flight per consumer, defaults to 100
+    """
+    return int(os.getenv('RABBITMQ_PREFETCH_COUNT', '100'))
+
+
+def get_reference_cache_ttl() -> float:
+    """
+    Get how long chain and token reference data is cached in-process.
+
+    Returns:
+        float: TTL in seconds, defaults to 60
+    """
+    return float(os.getenv('REFERENCE_CACHE_TTL', '60'))
+
+
+def get_wallet_cache_ttl() -> float:
+    """
+    Get how long a user's wallet summary is cached in-process.
+
+    Kept short because other service instances may activate or deactivate the
+    wallet; this instance's own wallet commands drop the entry immediately.
+
+    Returns:
+        float: TTL in seconds, defaults to 5
+    """
+    return float(os.getenv('WALLET_CACHE_TTL', '5'))
+
+
+def get_wallet_cache_maxsize() -> int:
+    """
+    Get how many wallet summaries are cached in-process at most.
+
+    Returns:
+        int: Maximum number of cached users, defaults to 10000
+    """
+    return int(os.getenv('WALLET_CACHE_MAXSIZE', '10000'))
+
+
+def get_account_pool_size() -> int:
+    """
+    Get the number of accounts generated ahead of wallet creation.
+
+    Returns:
+        int: Pool size, defaults to 16; 0 derives keys per command instead
+    """
+    return int(os.getenv('ACCOUNT_POOL_SIZE', '16'))
+
+
+def get_openapi_schema_path():
+    """
+    Get the path of a pre-generated OpenAPI schema file.
+
+    Returns:
+        str | None: Schema file path, or None to generate the schema at startup
+    """
+    return os.getenv('OPENAPI_SCHEMA_PATH')
+
+
+def get_reference_seed_path():
+    """
+    Get the path of the JSON file listing chains and tokens to seed at startup.
+
+    Returns:
+        str | None: Seed file path, or None to skip seeding
+    """
+    return os.getenv('REFERENCE_SEED_PATH')
+
+
+def get_sql_echo() -> bool:
+    """
+    Get whether the database engines echo every SQL statement to the log.
+
+    Returns:
+        bool: True when SQL_ECHO is "true", "1" or "yes", defaults to False
+    """
+    return os.getenv('SQL_ECHO', 'false').lower() in ('true', '1', 'yes')
+
+
+def is_gas_oracle_enabled() -> bool:
+    """
+    Get whether gas limits for repeated contract calls come from observed estimates.
+
+    Returns:
+        bool: True when GAS_ORACLE_ENABLED is "true", "1" or "yes", defaults to False
+    """
+    return os.getenv('GAS_ORACLE_ENABLED', 'false').lower() in ('true', '1', 'yes')
+
+
+def get_gas_oracle_headroom() -> float:
+    """
+    Get the multiplier applied to the observed 95th percentile gas estimate.
+
+    Returns:
+        float: Headroom multiplier, defaults to 1.2
+    """
+    return float(os.getenv('GAS_ORACLE_HEADROOM', '1.2'))
+
+
 def get_sqlite_url():
     return "sqlite:///:memory:"
 
@@ -102,6 +265,7 @@ def setup_logger():
         print(f"ERROR: Logging configuration file not found: {log_config_yaml_path}", flush=True)
         # Fallback to basic logging if the config file is missing
         logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
         return
 
     try:
@@ -1,20 +1,25 @@
+import logging
 from fastapi import Request
 from fastapi import HTTPException
 from fastapi.exceptions import RequestValidationError
-from pydantic import ValidationError
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi.responses import JSONResponse
 from src.core.exceptions.exceptions import *
 from aio_pika.exceptions import AMQPError
 
+logger = logging.getLogger(__name__)
+
+
 async def generic_error_handler(request: Request, exc: Error):
+    logger.warning("%s %s failed: %s", request.method, request.url.path, exc.msg)
     return JSONResponse(
         status_code=exc.code,
         content={
         "detail": exc.detail,
     })
 
-async def pydantic_validation_error_handler(request: Request, exc: ValidationError):
+async def pydantic_validation_error_handler(request: Request, exc: PydanticValidationError):
     return JSONResponse(
         status_code=422,
         content={
@@ -62,6 +67,21 @@ async def fastapi_http_exception_handler(request: Request, exc: HTTPException):
         }
     )
 
+async def value_error_handler(request: Request, exc: ValueError):
+    logger.warning("%s %s failed: %s", request.method, request.url.path, exc)
+    return JSONResponse(
+        status_code=400,
+        content={
+            "detail": [
+                {
+                    "loc": ["route"],
+                    "msg": str(exc),
+                    "type": "http_error.400"
+                }
+            ]
+        }
+    )
+
 async def fastapi_validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
         status_code=422,
@@ -71,9 +91,9 @@ async def fastapi_validation_exception_handler(request: Request, exc: RequestVal
     )
 
 EXCEPTION_HANDLERS = {
-    EmailAlreadyRegisteredException: generic_error_handler,
-    UsernameAlreadyRegisteredException: generic_error_handler,
-    ValidationError: pydantic_validation_error_handler,
+    Error: generic_error_handler,
+    ValueError: value_error_handler,
+    PydanticValidationError: pydantic_validation_error_handler,
     SQLAlchemyError: sqlalchemy_error_handler,
     AMQPError: aio_pika_exception_handler,
     HTTPException: fastapi_http_exception_handler,
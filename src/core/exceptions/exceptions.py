@@ -106,6 +106,62 @@ class WalletNotFoundError(Error):
     type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.AGGREGATE_STATE_INVALID)
 
 
+@dataclass(frozen=True)
+class WalletAlreadyExistsError(Error):
+    code: int = HTTPStatus.CONFLICT
+    loc: List[str] = Field(default=["userid"])
+    msg: str = Field(default="User already has a wallet. Only one wallet per user is allowed.")
+    type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.BUSINESS_RULE_VIOLATION)
+
+
+@dataclass(frozen=True)
+class WalletInactiveError(Error):
+    code: int = HTTPStatus.CONFLICT
+    loc: List[str] = Field(default=["userid"])
+    msg: str = Field(default="Wallet is not active.")
+    type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.AGGREGATE_STATE_INVALID)
+
+
+@dataclass(frozen=True)
+class TokenNotFoundError(Error):
+    code: int = HTTPStatus.NOT_FOUND
+    loc: List[str] = Field(default=["body", "token_id"])
+    msg: str = Field(default="Token not found.")
+    type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.AGGREGATE_STATE_INVALID)
+
+
+@dataclass(frozen=True)
+class TokenAlreadyExistsError(Error):
+    code: int = HTTPStatus.CONFLICT
+    loc: List[str] = Field(default=["body", "symbol"])
+    msg: str = Field(default="Token already exists.")
+    type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.BUSINESS_RULE_VIOLATION)
+
+
+@dataclass(frozen=True)
+class ChainNotFoundError(Error):
+    code: int = HTTPStatus.NOT_FOUND
+    loc: List[str] = Field(default=["body", "chain_id"])
+    msg: str = Field(default="Chain not found.")
+    type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.AGGREGATE_STATE_INVALID)
+
+
+@dataclass(frozen=True)
+class ChainAlreadyExistsError(Error):
+    code: int = HTTPStatus.CONFLICT
+    loc: List[str] = Field(default=["body", "chain_id"])
+    msg: str = Field(default="Chain already exists.")
+    type: ErrorCategory.DomainError = Field(default=ErrorCategory.DomainError.BUSINESS_RULE_VIOLATION)
+
+
+@dataclass(frozen=True)
+class InvalidSwapStrategyError(Error):
+    code: int = HTTPStatus.BAD_REQUEST
+    loc: List[str] = Field(default=["body", "strategy"])
+    msg: str = Field(default="Invalid swap strategy.")
+    type: ErrorCategory.ApplicationError = Field(default=ErrorCategory.ApplicationError.VALIDATION_ERROR)
+
+
 @dataclass(frozen=True)
 class TransactionNotFoundError(Error):
     code: int = HTTPStatus.NOT_FOUND
@@ -0,0 +1,18 @@
+import json
+from typing import Any
+
+import orjson
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes, keeping wei amounts as native integers.
+
+    orjson only encodes integers inside the 64-bit range, so payloads carrying
+    uint256 amounts (e.g. unlimited approvals) fall back to the stdlib encoder,
+    which handles arbitrary precision integers.
+    """
+    try:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC)
+    except orjson.JSONEncodeError:
+        return json.dumps(content, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
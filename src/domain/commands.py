@@ -159,6 +159,10 @@ class CreateTransactionCommand(Command):
     max_fee_per_gas: str = None
     max_priority_fee_per_gas: str = None
 
+@dataclass(frozen=True)
+class TrackTransactionCommand(Command):
+    transaction_id: str
+
 # TraderJoe Swap commands
 @dataclass(frozen=True)
 class ExecuteSwapCommand(Command):
@@ -1,4 +1,6 @@
 import enum
+import os
+import time
 from datetime import datetime, timezone
 from typing import Annotated, Optional
 
@@ -13,112 +15,124 @@ from sqlalchemy.orm import reconstructor
 def normalize_fullname(fullname: str) -> str:
     return " ".join(name.capitalize() for name in fullname.split())
 
+def new_id() -> str:
+    """
+    A UUIDv7-layout id as 32 hex chars: a 48-bit millisecond timestamp followed by
+    74 random bits, so ids created later sort later and primary-key inserts land on
+    the right edge of the index instead of splitting random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return f"{value:032x}"
+
 class TransactionType(enum.Enum):
     GIVE_APPROVAL = "GIVE_APPROVAL"
     REVOKE_APPROVAL = "REVOKE_APPROVAL"
     SWAP_NATIVE_TO_TOKEN = "SWAP_NATIVE_TO_TOKEN"
     SWAP_TOKEN_TO_NATIVE = "SWAP_TOKEN_TO_NATIVE"
     SWAP_TOKEN_TO_TOKEN = "SWAP_TOKEN_TO_TOKEN"
+    TRADERJOE_SWAP = "TRADERJOE_SWAP"
 
 class TransactionStatus(enum.Enum):
     PENDING = "PENDING"
     CONFIRMED = "CONFIRMED"
     FAILED = "FAILED"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseValueObject:
     ...
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Account(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^0x[a-fA-F0-9]{40}$")  # Ethereum address format
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RPC(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^https://[a-zA-Z0-9.-]+(:[0-9]+)?(/.*)?$")  # Basic URL validation
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EncryptedPrivateKey(BaseValueObject):
     value: str  # Encrypted private key as string
 
 # Token value objects
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ID(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^[0-9a-f]{5,32}$")
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Symbol(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^[A-Z]{1,20}$")
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Name(BaseValueObject):
     value: Annotated[
         str,
         Field(min_length=1, max_length=100)
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Address(BaseValueObject):
     value: Annotated[
         Optional[str],
         Field(pattern=r"^0x[a-fA-F0-9]{40}$")  # Null for native tokens
     ] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenDecimals(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^[0-9]{1,3}$")  # Usually 18 for most tokens
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionHash(BaseValueObject):
     value: Annotated[
         Optional[str],
         Field(pattern=r"^0x[a-fA-F0-9]{64}$")
     ] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockNumber(BaseValueObject):
     value: Annotated[
         Optional[int],
         Field(ge=0)
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nonce(BaseValueObject):
     value: Annotated[
         int,
         Field(ge=0)
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Gas(BaseValueObject):
     value: Annotated[
         Optional[int],
         Field(ge=0)
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GasUsed(BaseValueObject):
     value: Annotated[
         Optional[int],
         Field(ge=0)
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GasPrice(BaseValueObject):
     value: Annotated[
         int,
@@ -126,21 +140,21 @@ class GasPrice(BaseValueObject):
     ]
 
 # Swap value objects
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwapID(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^[0-9a-f]{32}$")
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Amount(BaseValueObject):
     value: Annotated[
         int,
         Field(ge=0)
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlippageTolerance(BaseValueObject):
     value: Annotated[
         str,
@@ -148,21 +162,21 @@ class SlippageTolerance(BaseValueObject):
     ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApprovalAmount(BaseValueObject):
     value: Annotated[
         int,
         Field(ge=0)  # Large number as string to handle wei amounts
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApprovalType(BaseValueObject):
     value: Annotated[
         str,
         Field(pattern=r"^(GIVE_APPROVAL|REMOVE_APPROVAL)$")
     ]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwapType(BaseValueObject):
     value: Annotated[
         str,
@@ -205,14 +219,14 @@ class Wallet:
                userid: str,
                address: str,
                account: LocalAccount,
-               created_at: datetime):
+               created_at: Optional[datetime] = None):
         """Factory method to create a new wallet for a user."""
         wallet = cls(
             ID(wallet_id),
             ID(userid),
             Address(address),
             account,
-            created_at
+            created_at or datetime.now(timezone.utc)
         )
 
         wallet.events.append(
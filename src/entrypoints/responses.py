@@ -0,0 +1,12 @@
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from src.core.serialization.encoder import dumps
+
+
+class WeiJSONResponse(ORJSONResponse):
+    """ORJSON response that keeps wei amounts as native integers on the wire."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,15 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Request, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Request, Query, Response
 from fastapi.security import HTTPBearer
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
-import logging
 
+from src.core.exceptions.exceptions import WalletAlreadyExistsError, WalletInactiveError, WalletNotFoundError
 from src.domain import commands
 from src.domain.model import Address
 from src.service_layer import messagebus, views, unit_of_work
-
-logger = logging.getLogger(__name__)
+from src.service_layer.reference_data import ReferenceDataCache
 
 router = APIRouter(prefix="/transaction", tags=["Transactions"])
 security = HTTPBearer()
@@ -22,6 +22,8 @@ class CreateWalletRequest(BaseModel):
     pass  # No additional fields needed - one wallet per user
 
 class WalletResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     wallet_id: str
     userid: str
     address: str
@@ -37,6 +39,8 @@ class AddTokenRequest(BaseModel):
     decimals: str = Field("18", description="Token decimals")
 
 class TokenResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     token_id: str
     chain_id: str
     symbol: str
@@ -52,6 +56,8 @@ class AddChainRequest(BaseModel):
     rpc_url: str = Field(..., description="RPC URL for interacting with the chain")
 
 class ChainResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     chain_id: str
     name: str
     symbol: str
@@ -69,25 +75,31 @@ class RevokeApprovalRequest(BaseModel):
     amount: Optional[str] = Field(None, description="Amount to revoke (None means revoke all)")
 
 class ApprovalResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     approval_id: str
     wallet_id: str
     token_id: str
-    approved_amount: str
+    approved_amount: int
     updated_at: str
 
 class ApprovalHistoryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     approval_transaction_id: str
     transaction_id: str
     token_id: str
     approval_type: str
-    amount: str
-    previous_amount: str
-    new_amount: str
+    amount: int
+    previous_amount: int
+    new_amount: int
 
 class ApprovalStatusResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     sufficient: bool
-    current_amount: str
-    required_amount: str
+    current_amount: int
+    required_amount: int
     error: Optional[str] = None
 
 # Swap Models
@@ -128,6 +140,8 @@ class SwapQuoteRequest(BaseModel):
     slippage_tolerance: str = Field("0.5", description="Slippage tolerance percentage")
 
 class SwapQuoteResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     token_in: Dict[str, Any]
     token_out: Dict[str, Any]
     amount_in: str
@@ -137,19 +151,23 @@ class SwapQuoteResponse(BaseModel):
     slippage_tolerance: str
 
 class SwapTransactionResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     swap_transaction_id: str
     transaction_id: str
     swap_type: str
     token_in_id: str
     token_out_id: str
-    amount_in: str
-    amount_out_expected: str
-    amount_out_actual: Optional[str]
+    amount_in: int
+    amount_out_expected: int
+    amount_out_actual: Optional[int]
     slippage_tolerance: str
     deadline: str
     router_address: str
 
 class TransactionResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     transaction_id: str
     transaction_hash: Optional[str]
     transaction_type: str
@@ -172,37 +190,45 @@ class CreateSwapRequest(BaseModel):
     network: str = Field(default="avalanche", description="Target blockchain network for the swap")
 
 class CreateSwapResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     transaction_id: str
     swap_id: str
     status: str
     estimated_gas: Dict[str, Any]
 
 class SwapResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     swap_id: str
     transaction_id: str
     token_in_symbol: str
     token_out_symbol: str
-    amount_in: str
-    amount_out_expected: str
-    amount_out_actual: Optional[str]
+    amount_in: int
+    amount_out_expected: int
+    amount_out_actual: Optional[int]
     slippage_tolerance: str
     deadline: str
     status: str
     transaction_hash: Optional[str]
 
 class SwapDetailResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     swap_id: str
     transaction_id: str
     token_in_id: str
     token_out_id: str
-    amount_in: str
-    amount_out_expected: str
-    amount_out_actual: Optional[str]
+    amount_in: int
+    amount_out_expected: int
+    amount_out_actual: Optional[int]
     slippage_tolerance: str
     trader_joe_router: str
     deadline: Optional[str]
 
 class TransactionStatusResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     transaction_id: str
     status: str
     transaction_hash: Optional[str]
@@ -211,6 +237,8 @@ class TransactionStatusResponse(BaseModel):
     error_message: Optional[str]
 
 class TokenBalanceInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     token_id: str
     symbol: str
     name: str
@@ -219,12 +247,16 @@ class TokenBalanceInfo(BaseModel):
     decimals: str
 
 class WalletBalanceSummaryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     wallet_id: str
     address: str
     network: str
     tokens: List[TokenBalanceInfo]
 
 class WalletBalanceResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     wallet_id: str
     token_id: Optional[str]
     token_symbol: str
@@ -244,6 +276,8 @@ class TraderJoeSwapRequest(BaseModel):
     factory_address: str = Field("0x8e42f2F4101563bF679975178e880FD87d3eFd4e", description="TraderJoe Factory address")
 
 class TraderJoeSwapResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     swap_id: str
     transaction_hash: str
     status: str
@@ -258,47 +292,72 @@ def get_suow(request: Request) -> unit_of_work.AbstractUnitOfWork:
     return request.app.state.suow
 
 
+# Dependency to get the shared chain/token reference data cache
+def get_reference_cache(request: Request) -> ReferenceDataCache:
+    return request.app.state.reference_cache
+
+
+# Dependency to get the per-user wallet summary cache
+def get_wallet_cache(request: Request) -> ReferenceDataCache:
+    return request.app.state.wallet_cache
+
+
 # Dependency to get messagebus from app state
 def get_messagebus(request: Request) -> messagebus.MessageBus:
     return request.app.state.messagebus
 
 
+# Dependency to get the background command queue from app state
+def get_command_queue(request: Request) -> asyncio.Queue:
+    return request.app.state.cmd_queue
+
+
+async def ensure_active_wallet(
+    userid: str = Depends(get_userid),
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_wallet_cache)
+) -> None:
+    """Rejects a queued command up front when the worker would fail it for lack of an active wallet."""
+    wallet = await views.get_user_wallet_view(userid, suow, cache)
+    if wallet is None:
+        raise WalletNotFoundError(loc=["userid"], msg=f"Wallet not found for user {userid}")
+    if not wallet["is_active"]:
+        raise WalletInactiveError(msg=f"Wallet is not active for user {userid}")
+
+
 # Wallet Endpoints
-@router.post("/wallets")
+@router.post("/wallets", status_code=202)
 async def create_wallet(
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_wallet_cache),
     userid: str = Depends(get_userid)
 ):
     """Create a new wallet for the authenticated user."""
-    try:
-        cmd = commands.CreateWalletCommand(
-            userid=userid,
-        )
+    if await views.get_user_wallet_view(userid, suow, cache) is not None:
+        raise WalletAlreadyExistsError(msg=f"User {userid} already has a wallet. Only one wallet per user is allowed.")
 
-        await bus.handle(cmd)
+    cmd = commands.CreateWalletCommand(
+        userid=userid,
+    )
 
-        return "OK"
-    except Exception as e:
-        logger.error(f"Error creating wallet: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    await messagebus.submit(cmd_queue, cmd, bus)
+
+    return "OK"
 
 
 @router.get("/wallet", response_model=WalletResponse)
 async def get_user_wallet(
     userid: str = Depends(get_userid),
-    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_wallet_cache)
 ):
     """Get the user's wallet (one wallet per user)."""
-    try:
-        wallet = await views.get_user_wallet_view(userid, suow)
-        if not wallet:
-            raise HTTPException(status_code=404, detail="User wallet not found")
-        return wallet
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting user wallet: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    content = await views.get_user_wallet_json(userid, suow, cache)
+    if content is None:
+        raise HTTPException(status_code=404, detail="User wallet not found")
+    return Response(content=content, media_type="application/json")
 
 
 # Wallet Management Endpoints
@@ -308,16 +367,12 @@ async def activate_wallet(
     userid: str = Depends(get_userid)
 ):
     """Activate a user's wallet."""
-    try:
-        cmd = commands.ActivateWalletCommand(
-            userid=userid
-        )
+    cmd = commands.ActivateWalletCommand(
+        userid=userid
+    )
 
-        await bus.handle(cmd)
-        return {"message": f"Wallet activated successfully"}
-    except Exception as e:
-        logger.error(f"Error activating wallet: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    await bus.handle(cmd)
+    return {"message": f"Wallet activated successfully"}
 
 
 @router.post("/wallet/deactivate")
@@ -326,16 +381,12 @@ async def deactivate_wallet(
     userid: str = Depends(get_userid)
 ):
     """Deactivate a user's wallet."""
-    try:
-        cmd = commands.DeactivateWalletCommand(
-            userid=userid
-        )
+    cmd = commands.DeactivateWalletCommand(
+        userid=userid
+    )
 
-        await bus.handle(cmd)
-        return {"message": f"Wallet deactivated successfully"}
-    except Exception as e:
-        logger.error(f"Error deactivating wallet: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    await bus.handle(cmd)
+    return {"message": f"Wallet deactivated successfully"}
 
 
 # ===== NEW TRADERJOE-SPECIFIC ENDPOINTS =====
@@ -347,52 +398,39 @@ async def add_token(
     bus: messagebus.MessageBus = Depends(get_messagebus)
 ):
     """Add a new supported token for TraderJoe swaps (Admin endpoint)."""
-    try:
-        cmd = commands.AddTokenCommand(
-            chain_id=token_request.chain_id,
-            symbol=token_request.symbol,
-            name=token_request.name,
-            contract_address=token_request.contract_address,
-            decimals=token_request.decimals,
-        )
-
-        await bus.handle(cmd)
-        return {"message": f"Token {token_request.symbol} added successfully"}
-    except Exception as e:
-        logger.error(f"Error adding token: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    cmd = commands.AddTokenCommand(
+        chain_id=token_request.chain_id,
+        symbol=token_request.symbol,
+        name=token_request.name,
+        contract_address=token_request.contract_address,
+        decimals=token_request.decimals,
+    )
+
+    await bus.handle(cmd)
+    return {"message": f"Token {token_request.symbol} added successfully"}
 
 
 # Token Query Endpoints
 @router.get("/tokens/avalanche", response_model=List[TokenResponse])
 async def get_supported_tokens(
-    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_reference_cache)
 ):
     """Get all supported tokens for TraderJoe swaps on Avalanche."""
-    try:
-        tokens = await views.get_supported_tokens_view(suow)
-        return tokens
-    except Exception as e:
-        logger.error(f"Error getting supported tokens: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=await views.get_supported_tokens_json(suow, cache), media_type="application/json")
 
 
 @router.get("/tokens/symbol/{symbol}", response_model=TokenResponse)
 async def get_token_by_symbol(
     symbol: str,
-    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_reference_cache)
 ):
     """Get token by symbol."""
-    try:
-        token = await views.get_token_by_symbol_view(symbol, suow)
-        if not token:
-            raise HTTPException(status_code=404, detail=f"Token '{symbol}' not found")
-        return token
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting token by symbol: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    token = await views.get_token_by_symbol_view(symbol, suow, cache)
+    if not token:
+        raise HTTPException(status_code=404, detail=f"Token '{symbol}' not found")
+    return token
 
 #Chain Management Endpoints
 @router.post("/admin/chains", response_model=Dict[str, str])
@@ -401,91 +439,72 @@ async def add_chain(
         bus: messagebus.MessageBus = Depends(get_messagebus)
 ):
     """Add a new blockchain chain (Admin endpoint)."""
-    try:
-        cmd = commands.AddChainCommand(
-            chain_id=chain_request.chain_id,
-            name=chain_request.name,
-            symbol=chain_request.symbol,
-            rpc_url=chain_request.rpc_url
-        )
-
-        await bus.handle(cmd)
-        return {"message": f"Chain {chain_request.name} added successfully"}
-    except Exception as e:
-        logger.error(f"Error adding chain: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    cmd = commands.AddChainCommand(
+        chain_id=chain_request.chain_id,
+        name=chain_request.name,
+        symbol=chain_request.symbol,
+        rpc_url=chain_request.rpc_url
+    )
+
+    await bus.handle(cmd)
+    return {"message": f"Chain {chain_request.name} added successfully"}
 
 @router.get("/chains/{chain_id}", response_model=ChainResponse)
 async def get_chain_by_symbol(
     symbol: str,
-    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_reference_cache)
 ):
     """Get blockchain by symbol."""
-    try:
-        chain = await views.get_chain_by_symbol_view(symbol, suow)
-        if not chain:
-            raise HTTPException(status_code=404, detail=f"Chain '{symbol}' not found")
-        return chain
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting chain by symbol: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    chain = await views.get_chain_by_symbol_view(symbol, suow, cache)
+    if not chain:
+        raise HTTPException(status_code=404, detail=f"Chain '{symbol}' not found")
+    return chain
 
 @router.get("/chains", response_model=List[ChainResponse])
 async def get_supported_chains(
-    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
+    suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow),
+    cache: ReferenceDataCache = Depends(get_reference_cache)
 ):
     """Get all supported blockchain chains."""
-    try:
-        chains = await views.get_supported_chains_view(suow)
-        return chains
-    except Exception as e:
-        logger.error(f"Error getting supported chains: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=await views.get_supported_chains_json(suow, cache), media_type="application/json")
 
 # Token Approval Endpoints
-@router.post("/approvals")
+@router.post("/approvals", status_code=202, dependencies=[Depends(ensure_active_wallet)])
 async def approve_token(
     approval_request: ApproveTokenRequest,
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
     userid: str = Depends(get_userid)
 ):
     """Manually approve a specific amount for a token."""
-    try:
-        cmd = commands.ApproveTokenCommand(
-            userid=userid,
-            token_id=approval_request.token_id,
-            spender_address=approval_request.spender_address,
-            amount=approval_request.amount
-        )
-
-        await bus.handle(cmd)
-        return {"message": "Token approval initiated successfully"}
-    except Exception as e:
-        logger.error(f"Error approving token: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/approvals/revoke")
+    cmd = commands.ApproveTokenCommand(
+        userid=userid,
+        token_id=approval_request.token_id,
+        spender_address=approval_request.spender_address,
+        amount=approval_request.amount
+    )
+
+    await messagebus.submit(cmd_queue, cmd, bus)
+    return {"message": "Token approval initiated successfully"}
+
+
+@router.post("/approvals/revoke", status_code=202, dependencies=[Depends(ensure_active_wallet)])
 async def revoke_approval(
     revoke_request: RevokeApprovalRequest,
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
     userid: str = Depends(get_userid)
 ):
     """Revoke token approval (set to 0 or reduce by amount)."""
-    try:
-        cmd = commands.RevokeApprovalCommand(
-            userid=userid,
-            token_id=revoke_request.token_id,
-            amount=revoke_request.amount
-        )
+    cmd = commands.RevokeApprovalCommand(
+        userid=userid,
+        token_id=revoke_request.token_id,
+        amount=revoke_request.amount
+    )
 
-        await bus.handle(cmd)
-        return {"message": "Token approval revocation initiated successfully"}
-    except Exception as e:
-        logger.error(f"Error revoking approval: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    await messagebus.submit(cmd_queue, cmd, bus)
+    return {"message": "Token approval revocation initiated successfully"}
 
 
 @router.get("/approvals", response_model=List[ApprovalResponse])
@@ -494,12 +513,7 @@ async def get_user_approvals(
     suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
 ):
     """Get all current token approvals for the authenticated user."""
-    try:
-        approvals = await views.get_user_approvals_view(userid, suow)
-        return approvals
-    except Exception as e:
-        logger.error(f"Error getting user approvals: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=await views.get_user_approvals_json(userid, suow), media_type="application/json")
 
 
 @router.get("/approvals/history", response_model=List[ApprovalHistoryResponse])
@@ -509,127 +523,106 @@ async def get_approval_history(
     suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
 ):
     """Get approval transaction history for the authenticated user."""
-    try:
-        history = await views.get_approval_history_view(userid, token_id, suow)
-        return history
-    except Exception as e:
-        logger.error(f"Error getting approval history: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=await views.get_approval_history_json(userid, token_id, suow), media_type="application/json")
 
 
 @router.get("/approvals/check", response_model=ApprovalStatusResponse)
 async def check_approval_status(
     token_id: str = Query(..., description="Token ID to check"),
-    required_amount: str = Query(..., description="Required amount in wei"),
+    required_amount: int = Query(..., ge=0, description="Required amount in wei"),
     userid: str = Depends(get_userid),
     suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
 ):
     """Check if user has sufficient approval for a token amount."""
-    try:
-        status = await views.check_approval_status_view(userid, token_id, required_amount, suow)
-        return status
-    except Exception as e:
-        logger.error(f"Error checking approval status: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    status = await views.check_approval_status_view(userid, token_id, required_amount, suow)
+    return status
 
 
 # TraderJoe Swap Endpoints
-@router.post("/swaps/exact-native-to-token")
+@router.post("/swaps/exact-native-to-token", status_code=202, dependencies=[Depends(ensure_active_wallet)])
 async def swap_exact_native_to_token(
     swap_request: SwapExactNativeToTokenRequest,
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
     userid: str = Depends(get_userid)
 ):
     """Execute EXACT_NATIVE_TO_TOKEN swap (AVAX -> Token)."""
-    try:
-        cmd = commands.SwapExactNativeToTokenCommand(
-            userid=userid,
-            token_out_id=swap_request.token_out_id,
-            amount_in=swap_request.amount_in,
-            amount_out_min=swap_request.amount_out_min,
-            slippage_tolerance=swap_request.slippage_tolerance,
-            deadline_minutes=swap_request.deadline_minutes
-        )
-
-        await bus.handle(cmd)
-        return {"message": "EXACT_NATIVE_TO_TOKEN swap initiated successfully"}
-    except Exception as e:
-        logger.error(f"Error executing native to token swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/swaps/token-to-exact-native")
+    cmd = commands.SwapExactNativeToTokenCommand(
+        userid=userid,
+        token_out_id=swap_request.token_out_id,
+        amount_in=swap_request.amount_in,
+        amount_out_min=swap_request.amount_out_min,
+        slippage_tolerance=swap_request.slippage_tolerance,
+        deadline_minutes=swap_request.deadline_minutes
+    )
+
+    await messagebus.submit(cmd_queue, cmd, bus)
+    return {"message": "EXACT_NATIVE_TO_TOKEN swap initiated successfully"}
+
+
+@router.post("/swaps/token-to-exact-native", status_code=202, dependencies=[Depends(ensure_active_wallet)])
 async def swap_token_to_exact_native(
     swap_request: SwapTokenToExactNativeRequest,
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
     userid: str = Depends(get_userid)
 ):
     """Execute TOKEN_TO_EXACT_NATIVE swap (Token -> AVAX)."""
-    try:
-        cmd = commands.SwapTokenToExactNativeCommand(
-            userid=userid,
-            token_in_id=swap_request.token_in_id,
-            amount_in=swap_request.amount_in,
-            amount_out_min=swap_request.amount_out_min,
-            slippage_tolerance=swap_request.slippage_tolerance,
-            deadline_minutes=swap_request.deadline_minutes
-        )
-
-        await bus.handle(cmd)
-        return {"message": "TOKEN_TO_EXACT_NATIVE swap initiated successfully"}
-    except Exception as e:
-        logger.error(f"Error executing token to native swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/swaps/exact-token-to-token")
+    cmd = commands.SwapTokenToExactNativeCommand(
+        userid=userid,
+        token_in_id=swap_request.token_in_id,
+        amount_in=swap_request.amount_in,
+        amount_out_min=swap_request.amount_out_min,
+        slippage_tolerance=swap_request.slippage_tolerance,
+        deadline_minutes=swap_request.deadline_minutes
+    )
+
+    await messagebus.submit(cmd_queue, cmd, bus)
+    return {"message": "TOKEN_TO_EXACT_NATIVE swap initiated successfully"}
+
+
+@router.post("/swaps/exact-token-to-token", status_code=202, dependencies=[Depends(ensure_active_wallet)])
 async def swap_exact_token_to_token(
     swap_request: SwapExactTokenToTokenRequest,
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
     userid: str = Depends(get_userid)
 ):
     """Execute EXACT_TOKEN_TO_TOKEN swap."""
-    try:
-        cmd = commands.SwapExactTokenToTokenCommand(
-            userid=userid,
-            token_in_id=swap_request.token_in_id,
-            token_out_id=swap_request.token_out_id,
-            amount_in=swap_request.amount_in,
-            amount_out_min=swap_request.amount_out_min,
-            slippage_tolerance=swap_request.slippage_tolerance,
-            deadline_minutes=swap_request.deadline_minutes
-        )
-
-        await bus.handle(cmd)
-        return {"message": "EXACT_TOKEN_TO_TOKEN swap initiated successfully"}
-    except Exception as e:
-        logger.error(f"Error executing token to token swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/swaps/token-to-exact-token")
+    cmd = commands.SwapExactTokenToTokenCommand(
+        userid=userid,
+        token_in_id=swap_request.token_in_id,
+        token_out_id=swap_request.token_out_id,
+        amount_in=swap_request.amount_in,
+        amount_out_min=swap_request.amount_out_min,
+        slippage_tolerance=swap_request.slippage_tolerance,
+        deadline_minutes=swap_request.deadline_minutes
+    )
+
+    await messagebus.submit(cmd_queue, cmd, bus)
+    return {"message": "EXACT_TOKEN_TO_TOKEN swap initiated successfully"}
+
+
+@router.post("/swaps/token-to-exact-token", status_code=202, dependencies=[Depends(ensure_active_wallet)])
 async def swap_token_to_exact_token(
     swap_request: SwapTokenToExactTokenRequest,
+    cmd_queue: asyncio.Queue = Depends(get_command_queue),
     bus: messagebus.MessageBus = Depends(get_messagebus),
     userid: str = Depends(get_userid)
 ):
     """Execute TOKEN_TO_EXACT_TOKEN swap."""
-    try:
-        cmd = commands.SwapTokenToExactTokenCommand(
-            userid=userid,
-            token_in_id=swap_request.token_in_id,
-            token_out_id=swap_request.token_out_id,
-            amount_in_max=swap_request.amount_in_max,
-            amount_out=swap_request.amount_out,
-            slippage_tolerance=swap_request.slippage_tolerance,
-            deadline_minutes=swap_request.deadline_minutes
-        )
-
-        await bus.handle(cmd)
-        return {"message": "TOKEN_TO_EXACT_TOKEN swap initiated successfully"}
-    except Exception as e:
-        logger.error(f"Error executing exact token swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    cmd = commands.SwapTokenToExactTokenCommand(
+        userid=userid,
+        token_in_id=swap_request.token_in_id,
+        token_out_id=swap_request.token_out_id,
+        amount_in_max=swap_request.amount_in_max,
+        amount_out=swap_request.amount_out,
+        slippage_tolerance=swap_request.slippage_tolerance,
+        deadline_minutes=swap_request.deadline_minutes
+    )
+
+    await messagebus.submit(cmd_queue, cmd, bus)
+    return {"message": "TOKEN_TO_EXACT_TOKEN swap initiated successfully"}
 
 
 # Swap History Endpoints
@@ -640,12 +633,7 @@ async def get_user_swap_transaction_history(
     suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
 ):
     """Get detailed swap transaction history for the authenticated user."""
-    try:
-        swaps = await views.get_user_swap_history_view(userid, limit, suow)
-        return swaps
-    except Exception as e:
-        logger.error(f"Error getting user swap transaction history: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=await views.get_user_swap_history_json(userid, limit, suow), media_type="application/json")
 
 
 @router.get("/tokens/{token_id}/swaps", response_model=List[SwapTransactionResponse])
@@ -655,12 +643,7 @@ async def get_token_swap_history(
     suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
 ):
     """Get swap history for a specific token."""
-    try:
-        swaps = await views.get_token_swap_history_view(token_id, limit, suow)
-        return swaps
-    except Exception as e:
-        logger.error(f"Error getting token swap history: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=await views.get_token_swap_history_json(token_id, limit, suow), media_type="application/json")
 
 
 @router.get("/transactions/{transaction_id}/status", response_model=TransactionStatusResponse)
@@ -670,29 +653,23 @@ async def get_transaction_status(
     suow: unit_of_work.AbstractUnitOfWork = Depends(get_suow)
 ):
     """Get status of a specific transaction."""
-    try:
-        transaction = await views.get_transaction_status(transaction_id, suow)
-        if not transaction:
-            raise HTTPException(status_code=404, detail="Transaction not found")
-
-        # Get the full transaction to check ownership
-        full_transaction = views.get_transaction_by_id(transaction_id, suow)
-        if full_transaction and full_transaction["userid"] != userid:
-            raise HTTPException(status_code=403, detail="Access denied")
-
-        return {
-            "transaction_id": transaction["transaction_id"],
-            "status": transaction["status"],
-            "transaction_hash": transaction["transaction_hash"],
-            "created_at": transaction["created_at"],
-            "confirmed_at": transaction["confirmed_at"],
-            "error_message": transaction["error_message"]
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting transaction status: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    transaction = await views.get_transaction_status(transaction_id, suow)
+    if not transaction:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+
+    # Get the full transaction to check ownership
+    full_transaction = await views.get_transaction_by_id(transaction_id, suow)
+    if full_transaction and full_transaction["userid"] != userid:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    return {
+        "transaction_id": transaction["transaction_id"],
+        "status": transaction["status"],
+        "transaction_hash": transaction["transaction_hash"],
+        "created_at": transaction["created_at"],
+        "confirmed_at": transaction["confirmed_at"],
+        "error_message": transaction["error_message"]
+    }
 
 
 # TraderJoe Strategy-Based Swap Endpoints
@@ -703,28 +680,24 @@ async def traderjoe_swap_fast(
     userid: str = Depends(get_userid)
 ):
     """Execute a fast TraderJoe swap optimized for speed."""
-    try:
-        cmd = commands.ExecuteSwapCommand(
-            userid=userid,
-            strategy="fast",
-            token_from=swap_request.token_from,
-            token_to=swap_request.token_to,
-            amount_in=swap_request.amount_in,
-            max_slippage_percent=swap_request.max_slippage_percent,
-            chain_id=swap_request.chain_id,
-            router_address=swap_request.router_address,
-            factory_address=swap_request.factory_address
-        )
-
-        result = await bus.handle(cmd)
-        return TraderJoeSwapResponse(
-            swap_id=result.get("swap_id", "unknown"),
-            transaction_hash=result.get("transaction_hash", "pending"),
-            status="initiated"
-        )
-    except Exception as e:
-        logger.error(f"Error executing fast TraderJoe swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    cmd = commands.ExecuteSwapCommand(
+        userid=userid,
+        strategy="fast",
+        token_from=swap_request.token_from,
+        token_to=swap_request.token_to,
+        amount_in=swap_request.amount_in,
+        max_slippage_percent=swap_request.max_slippage_percent,
+        chain_id=swap_request.chain_id,
+        router_address=swap_request.router_address,
+        factory_address=swap_request.factory_address
+    )
+
+    result = await bus.handle(cmd)
+    return TraderJoeSwapResponse(
+        swap_id=result["swap_id"],
+        transaction_hash=result["txHash"],
+        status="initiated"
+    )
 
 @router.post("/traderjoe/swap/cheap", response_model=TraderJoeSwapResponse)
 async def traderjoe_swap_cheap(
@@ -733,28 +706,24 @@ async def traderjoe_swap_cheap(
     userid: str = Depends(get_userid)
 ):
     """Execute a cheap TraderJoe swap optimized for lowest fees."""
-    try:
-        cmd = commands.ExecuteSwapCommand(
-            userid=userid,
-            strategy="cheap",
-            token_from=swap_request.token_from,
-            token_to=swap_request.token_to,
-            amount_in=swap_request.amount_in,
-            max_slippage_percent=swap_request.max_slippage_percent,
-            chain_id=swap_request.chain_id,
-            router_address=swap_request.router_address,
-            factory_address=swap_request.factory_address
-        )
-
-        result = await bus.handle(cmd)
-        return TraderJoeSwapResponse(
-            swap_id=result.get("swap_id", "unknown"),
-            transaction_hash=result.get("transaction_hash", "pending"),
-            status="initiated"
-        )
-    except Exception as e:
-        logger.error(f"Error executing cheap TraderJoe swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    cmd = commands.ExecuteSwapCommand(
+        userid=userid,
+        strategy="cheap",
+        token_from=swap_request.token_from,
+        token_to=swap_request.token_to,
+        amount_in=swap_request.amount_in,
+        max_slippage_percent=swap_request.max_slippage_percent,
+        chain_id=swap_request.chain_id,
+        router_address=swap_request.router_address,
+        factory_address=swap_request.factory_address
+    )
+
+    result = await bus.handle(cmd)
+    return TraderJoeSwapResponse(
+        swap_id=result["swap_id"],
+        transaction_hash=result["txHash"],
+        status="initiated"
+    )
 
 @router.post("/traderjoe/swap/secure", response_model=TraderJoeSwapResponse)
 async def traderjoe_swap_secure(
@@ -763,28 +732,24 @@ async def traderjoe_swap_secure(
     userid: str = Depends(get_userid)
 ):
     """Execute a secure TraderJoe swap optimized for safety and reliability."""
-    try:
-        cmd = commands.ExecuteSwapCommand(
-            userid=userid,
-            strategy="secure",
-            token_from=swap_request.token_from,
-            token_to=swap_request.token_to,
-            amount_in=swap_request.amount_in,
-            max_slippage_percent=swap_request.max_slippage_percent,
-            chain_id=swap_request.chain_id,
-            router_address=swap_request.router_address,
-            factory_address=swap_request.factory_address
-        )
-
-        result = await bus.handle(cmd)
-        return TraderJoeSwapResponse(
-            swap_id=result.get("swap_id", "unknown"),
-            transaction_hash=result.get("transaction_hash", "pending"),
-            status="initiated"
-        )
-    except Exception as e:
-        logger.error(f"Error executing secure TraderJoe swap: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+    cmd = commands.ExecuteSwapCommand(
+        userid=userid,
+        strategy="secure",
+        token_from=swap_request.token_from,
+        token_to=swap_request.token_to,
+        amount_in=swap_request.amount_in,
+        max_slippage_percent=swap_request.max_slippage_percent,
+        chain_id=swap_request.chain_id,
+        router_address=swap_request.router_address,
+        factory_address=swap_request.factory_address
+    )
+
+    result = await bus.handle(cmd)
+    return TraderJoeSwapResponse(
+        swap_id=result["swap_id"],
+        transaction_hash=result["txHash"],
+        status="initiated"
+    )
 
 
 # Health check endpoint
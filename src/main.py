@@ -2,10 +2,11 @@ from src import config
 config.setup_logger()
 
 import asyncio
+import json
 import logging
 from fastapi import FastAPI
 from datetime import datetime, timezone
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 
 logger = logging.getLogger("src.main")
@@ -20,68 +21,157 @@ async def lifespan(_app: FastAPI):
     and starts the message consumer. Ensures proper cleanup on application shutdown.
     """
     from src import bootstrap
-    from sqlalchemy import create_engine
     from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
     from src.adapters.database import orm
-    from src.service_layer import unit_of_work
+    from src.service_layer import messagebus, unit_of_work
+    from src.service_layer.reference_data import ReferenceDataCache
+    from src.service_layer.account_pool import AccountPool
     from src.adapters.message_broker import connection_manager, publisher, subscriber
+    from src.adapters.blockchain import clients as blockchain_clients
 
     logger.info("Application starting up...")
 
     orm.init_orm_mappers()
 
-
-    orm.metadata.create_all(
-        bind=create_engine(
-            config.get_primary_url(
-                is_async=False
-            ),
-            echo=True
-        )
+    pool_options = dict(
+        pool_size=config.get_db_pool_size(),
+        max_overflow=config.get_db_max_overflow(),
+        pool_pre_ping=True,
+        pool_recycle=config.get_db_pool_recycle(),
     )
 
     primary_engine = create_async_engine(
         config.get_primary_url(is_async=True),
-        echo=False
+        echo=config.get_sql_echo(),
+        **pool_options
     )
 
+    async with primary_engine.begin() as connection:
+        await connection.run_sync(orm.metadata.create_all)
+
     standby_engine = create_async_engine(
         config.get_standby_url(),
-        echo=False
+        echo=config.get_sql_echo(),
+        **pool_options
+    )
+
+    await asyncio.gather(
+        _warm_pool(primary_engine, config.get_db_pool_size()),
+        _warm_pool(standby_engine, config.get_db_pool_size()),
     )
 
-    primary_session_factory = async_sessionmaker(bind=primary_engine)
-    standby_session_factory = async_sessionmaker(bind=standby_engine)
+    # Nothing is read back through an entity after its unit of work commits,
+    # so skip expiring (and lazily reloading) every attribute on commit.
+    primary_session_factory = async_sessionmaker(bind=primary_engine, expire_on_commit=False)
+    standby_session_factory = async_sessionmaker(bind=standby_engine, expire_on_commit=False)
 
     puow = unit_of_work.SqlAlchemyUnitOfWork(primary_session_factory)
     suow = unit_of_work.SqlAlchemyUnitOfWork(standby_session_factory)
     conn = connection_manager.RabbitMQConnectionManager(connection_url=config.get_rabbitmq_url())
     pub = publisher.EventPublisher(connection_manager=conn)
 
-    mbus = bootstrap.bootstrap(puow=puow, pub=pub)
-    sub = subscriber.EventSubscriber(connection_manager=conn, messagebus=mbus)
+    seed_path = config.get_reference_seed_path()
+    if seed_path:
+        await bootstrap.seed_reference_data(puow, seed_path)
+
+    reference_cache = ReferenceDataCache(ttl=config.get_reference_cache_ttl())
+    wallet_cache = ReferenceDataCache(
+        ttl=config.get_wallet_cache_ttl(),
+        maxsize=config.get_wallet_cache_maxsize()
+    )
+
+    tracking_queue = asyncio.Queue()
+
+    account_pool = None
+    if config.get_account_pool_size() > 0:
+        account_pool = AccountPool(config.get_account_pool_size())
+        account_pool.start()
+
+    mbus = bootstrap.bootstrap(
+        puow=puow,
+        suow=suow,
+        pub=pub,
+        cache=reference_cache,
+        tracking_queue=tracking_queue,
+        wallet_cache=wallet_cache,
+        account_pool=account_pool
+    )
+    sub = subscriber.EventSubscriber(
+        connection_manager=conn,
+        messagebus=mbus,
+        prefetch_count=config.get_prefetch_count()
+    )
     _app.state.messagebus = mbus
     _app.state.conn = conn
     _app.state.suow = suow
+    _app.state.reference_cache = reference_cache
+    _app.state.wallet_cache = wallet_cache
     consume_task = asyncio.create_task(sub.start_consuming())
 
+    cmd_queue = asyncio.Queue()
+    command_workers = [
+        asyncio.create_task(messagebus.command_worker(cmd_queue, mbus))
+        for _ in range(config.get_command_worker_count())
+    ]
+    _app.state.cmd_queue = cmd_queue
+
+    tracking_workers = [
+        asyncio.create_task(messagebus.command_worker(tracking_queue, mbus))
+        for _ in range(config.get_tracking_worker_count())
+    ]
+    # Jobs queued when the previous process stopped were lost with it
+    await bootstrap.resume_transaction_tracking(puow, tracking_queue)
+
+    # Build the OpenAPI schema now rather than on the first /openapi.json hit.
+    _app.openapi()
 
     logger.info("Application started successfully and ready.")
     try:
         yield
     finally:
         logger.info("Application shutting down...")
-        await sub.stop_consuming()
         try:
-            await asyncio.wait_for(consume_task, timeout=30)
+            await asyncio.wait_for(cmd_queue.join(), timeout=30)
         except asyncio.TimeoutError:
+            logger.warning("Command queue drain timeout, dropping pending commands...")
+        for worker in command_workers:
+            worker.cancel()
+        await asyncio.gather(*command_workers, return_exceptions=True)
+        await sub.stop_consuming()
+        _, pending = await asyncio.wait({consume_task}, timeout=5)
+        if consume_task in pending:
             logger.warning("Consumer task timeout, cancelling...")
             consume_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await consume_task
+        if not tracking_queue.empty():
+            logger.warning(f"Dropping {tracking_queue.qsize()} queued transaction tracking jobs, they resume on next startup...")
+        for worker in tracking_workers:
+            worker.cancel()
+        await asyncio.gather(*tracking_workers, return_exceptions=True)
+        if account_pool:
+            await account_pool.close()
         await pub.close()
         await conn.close()
+        await blockchain_clients.close_all()
+        await primary_engine.dispose()
+        await standby_engine.dispose()
         logger.info("Application shut down successfully.")
 
 
+async def _warm_pool(engine, size: int):
+    """
+    Opens `size` connections concurrently so they are pooled before traffic arrives.
+    """
+    from sqlalchemy import text
+
+    async def checkout():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(checkout() for _ in range(size)))
+
+
 def create_app():
     """
     Creates and configures the FastAPI application instance.
@@ -95,6 +185,7 @@ def create_app():
     from src.core.exceptions.exception_handlers import EXCEPTION_HANDLERS
     from src.core.correlation.middleware import CorrelationIdMiddleware
     from src.core.security.middleware import JWTAuthMiddleware
+    from src.entrypoints.responses import WeiJSONResponse
 
     _app = FastAPI(
         title="Transaction Service API",
@@ -102,6 +193,7 @@ def create_app():
         version="1.0.0",
         docs_url="/documentation",
         redoc_url="/api-reference",
+        default_response_class=WeiJSONResponse,
         lifespan=lifespan
     )
 
@@ -115,8 +207,36 @@ def create_app():
     _app.include_router(broker_app.router)
     _app.include_router(transaction_app.router)
 
+    _app.openapi = _cached_openapi(_app)
+
     return _app
 
+
+def _cached_openapi(_app: FastAPI):
+    """
+    Wraps the app's schema generator so it runs at most once.
+
+    When OPENAPI_SCHEMA_PATH points to a schema written at build time
+    (see `make openapi`), that file is loaded instead of walking the routes.
+    A missing or unreadable file is logged and the schema is generated.
+    """
+    generate = _app.openapi
+
+    def openapi():
+        if _app.openapi_schema is None:
+            schema_path = config.get_openapi_schema_path()
+            if schema_path:
+                try:
+                    with open(schema_path, "rb") as schema_file:
+                        _app.openapi_schema = json.load(schema_file)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not load OpenAPI schema from {schema_path}, generating it: {e}")
+            if _app.openapi_schema is None:
+                generate()
+        return _app.openapi_schema
+
+    return openapi
+
 app = create_app()
 
 @app.get("/", summary="Root endpoint providing basic API information")
@@ -0,0 +1,74 @@
+"""
+Pre-generated accounts for wallet creation.
+
+Deriving a key pair is CPU work (secp256k1 plus keccak) and used to run inside
+the CreateWallet command. Accounts are interchangeable until one is assigned to
+a user, so a background task keeps a small queue of them topped up while the
+service is idle and the command only has to take one.
+"""
+
+import asyncio
+import logging
+import secrets
+from typing import Optional
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+
+logger = logging.getLogger(__name__)
+
+
+def generate_account() -> LocalAccount:
+    """
+    Creates an account from a fresh 32-byte private key.
+    """
+    return Account.from_key(secrets.token_bytes(32))
+
+
+class AccountPool:
+    """
+    Queue of up to `size` generated accounts, refilled by a background task.
+
+    Args:
+        size (int): Number of accounts kept ready.
+    """
+
+    def __init__(self, size: int):
+        self._accounts: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """
+        Starts filling the pool. Called on application startup.
+        """
+        self._task = asyncio.create_task(self._fill())
+
+    async def close(self) -> None:
+        """
+        Stops the fill task. Accounts still queued were never assigned and are dropped.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def get(self) -> LocalAccount:
+        """
+        Returns a pooled account, or generates one in a thread when the pool
+        has been drained by a burst of wallet creations.
+        """
+        try:
+            return self._accounts.get_nowait()
+        except asyncio.QueueEmpty:
+            return await asyncio.to_thread(generate_account)
+
+    async def _fill(self) -> None:
+        while True:
+            try:
+                account = await asyncio.to_thread(generate_account)
+            except Exception:
+                logger.exception("Failed to pre-generate an account")
+                await asyncio.sleep(1)
+                continue
+            # Blocks while the pool is full
+            await self._accounts.put(account)
@@ -10,8 +10,9 @@ from typing import Optional, Tuple, List, Union, Dict, Any
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from src.domain.model import Token, Chain, ID
-from src.core.exceptions.exceptions import BlockchainError
+from src.core.exceptions.exceptions import BlockchainError, ChainAlreadyExistsError
 from src.service_layer.unit_of_work import AbstractUnitOfWork
+from src.service_layer.reference_data import ReferenceDataCache, CHAINS
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,16 @@ class BlockchainService:
     Follows Single Responsibility Principle.
     """
 
-    def __init__(self, uow: AbstractUnitOfWork):
-        self.uow = uow
+    def __init__(
+        self,
+        puow: Optional[AbstractUnitOfWork] = None,
+        suow: Optional[AbstractUnitOfWork] = None,
+        cache: Optional[ReferenceDataCache] = None
+    ):
+        # Writes go to the primary; reads go to the standby, falling back to the primary
+        self.puow = puow
+        self.suow = suow or puow
+        self.cache = cache
 
     async def add_chain(
         self,
@@ -46,22 +55,19 @@ class BlockchainService:
         Returns:
             None
         """
-        async with self.uow:
-            # Validate chain doesn't already exist
-            existing_chain = await self.uow.repo.get_chain(chain_id)
-            if existing_chain:
-                raise ValueError(f"Chain {chain_id} already exists")
-
-            # Create and save new chain
+        async with self.puow:
             new_chain = Chain.create(
                 chain_id=chain_id,
                 name=name,
                 symbol=symbol,
                 rpc_url=rpc_url,
             )
-            self.uow.repo.add_chain(new_chain)
+            if not await self.puow.repo.add_chain_if_absent(new_chain):
+                raise ChainAlreadyExistsError(msg=f"Chain {chain_id} already exists")
+        if self.cache:
+            self.cache.invalidate(CHAINS)
 
-    async def get_chain(self, chain_id: Union[ID, str]) -> Dict[str, Any]:
+    async def get_chain(self, chain_id: Union[ID, str]) -> Optional[Dict[str, Any]]:
         """
         Get a blockchain chain by its ID.
 
@@ -71,16 +77,24 @@ class BlockchainService:
         Returns:
             Optional[Chain]: Chain object if found, None otherwise
         """
-        async with self.uow:
-            chain = await self.uow.repo.get_chain(chain_id)
-            return {
-                    "chain_id": chain.chain_id,
-                    "name": chain.name,
-                    "symbol": chain.symbol,
-                    "rpc_url": chain.rpc_url
-                }
-
-    async def get_chain_by_symbol(self, symbol: str) -> Dict[str, Any]:
+        key = ("id", str(chain_id.value if isinstance(chain_id, ID) else chain_id))
+        if self.cache and (cached := self.cache.get(CHAINS, key)) is not None:
+            return cached
+        async with self.suow:
+            chain = await self.suow.repo.get_chain(chain_id)
+            if not chain:
+                return None
+            result = {
+                "chain_id": chain.chain_id.value,
+                "name": chain.name.value,
+                "symbol": chain.symbol.value,
+                "rpc_url": chain.rpc_url.value
+            }
+        if self.cache:
+            self.cache.set(CHAINS, key, result)
+        return result
+
+    async def get_chain_by_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get a blockchain chain by its symbol.
 
@@ -90,14 +104,22 @@ class BlockchainService:
         Returns:
             Optional[Chain]: Chain object if found, None otherwise
         """
-        async with self.uow:
-            chain = await self.uow.repo.get_chain_by_symbol(symbol)
-            return {
+        key = ("symbol", symbol)
+        if self.cache and (cached := self.cache.get(CHAINS, key)) is not None:
+            return cached
+        async with self.suow:
+            chain = await self.suow.repo.get_chain_by_symbol(symbol)
+            if not chain:
+                return None
+            result = {
                 "chain_id": chain.chain_id.value,
                 "name": chain.name.value,
                 "symbol": chain.symbol.value,
                 "rpc_url": chain.rpc_url.value
             }
+        if self.cache:
+            self.cache.set(CHAINS, key, result)
+        return result
 
     async def get_supported_chains(self) -> List[Dict[str, Any]]:
         """
@@ -106,13 +128,10 @@ class BlockchainService:
         Returns:
             List[Chain]: List of supported chains
         """
-        async with self.uow:
-            chains = await self.uow.repo.get_supported_chains()
-            return [
-                {
-                    "chain_id": chain.chain_id.value,
-                    "name": chain.name.value,
-                    "symbol": chain.symbol.value,
-                    "rpc_url": chain.rpc_url.value
-                } for chain in chains
-            ]
+        if self.cache and (cached := self.cache.get(CHAINS, "all")) is not None:
+            return cached
+        async with self.suow:
+            result = await self.suow.repo.list_chains_projection()
+        if self.cache:
+            self.cache.set(CHAINS, "all", result)
+        return result
@@ -1,14 +1,23 @@
+import asyncio
 import logging
-from datetime import datetime
-from uuid import uuid4
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Set, Tuple, TYPE_CHECKING
 
-from eth_account import Account
 
-from src.adapters.blockchain.utils import create_protocol, track_transaction
+from src.core.exceptions.exceptions import (
+    WalletNotFoundError, WalletAlreadyExistsError, WalletInactiveError,
+    TokenNotFoundError, TokenAlreadyExistsError,
+    ChainNotFoundError, ChainAlreadyExistsError,
+    InvalidSwapStrategyError, TransactionNotFoundError,
+)
+from src import config
 from src.domain import commands
 from src.domain.model import Wallet, Chain, Token, Transaction, TransactionStatus, TransactionType, ID, GasPrice, Gas, \
-    Nonce, GasUsed, BlockNumber, TransactionHash
-from src.service_layer import unit_of_work
+    Nonce, GasUsed, BlockNumber, TransactionHash, Address, RPC, new_id
+from src.service_layer import messagebus, unit_of_work
+from src.service_layer.account_pool import AccountPool, generate_account
+from src.service_layer.reference_data import ReferenceDataCache, CHAINS, TOKENS, WALLETS
 
 # Import event classes for handler mappings
 from src.core.events.events import (
@@ -17,6 +26,9 @@ from src.core.events.events import (
     TokenAdded, ChainAdded,
 )
 
+if TYPE_CHECKING:
+    from src.adapters.blockchain.protocols.traderjoe import TraderJoeProtocol
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,94 +36,96 @@ logger = logging.getLogger(__name__)
 async def create_wallet_handler(
         cmd: commands.CreateWalletCommand,
         puow: unit_of_work.AbstractUnitOfWork,
+        account_pool: AccountPool = None,
 ):
     """Create a new wallet for a user using WalletService."""
-    async with puow:
-        # Check if user already has a wallet
-        existing_wallet = await puow.repo.get_wallet_by_userid(cmd.userid)
-        if existing_wallet:
-            raise ValueError(f"User {cmd.userid} already has a wallet. Only one wallet per user is allowed.")
-
-        # Create wallet on blockchain
-        acct = Account.create()
-
-        # Create wallet domain entity
-        wallet = Wallet.create(
-            wallet_id=uuid4().hex,
-            userid=cmd.userid,
-            address=acct.address,
-            account=acct,
-            created_at=datetime.now()
-        )
+    # Key derivation is CPU work: take a pre-generated account, or derive one off the event loop
+    if account_pool:
+        acct = await account_pool.get()
+    else:
+        acct = await asyncio.to_thread(generate_account)
+
+    # Create wallet domain entity
+    wallet = Wallet.create(
+        wallet_id=new_id(),
+        userid=cmd.userid,
+        address=acct.address,
+        account=acct,
+        created_at=datetime.now(timezone.utc)
+    )
 
-        puow.repo.add_wallet(wallet)
+    async with puow:
+        # The unique userid column enforces one wallet per user in the same statement
+        if not await puow.repo.add_wallet_if_absent(wallet):
+            raise WalletAlreadyExistsError(msg=f"User {cmd.userid} already has a wallet. Only one wallet per user is allowed.")
         logger.info(f"Wallet created for user {cmd.userid}: {acct.address}")
 
 
 async def activate_wallet_handler(
         cmd: commands.ActivateWalletCommand,
         puow: unit_of_work.AbstractUnitOfWork,
+        wallet_cache: ReferenceDataCache = None
 ):
     """Activate a user's wallet using WalletService."""
     async with puow:
         wallet = await puow.repo.get_wallet_by_userid(cmd.userid)
         if not wallet:
-            raise ValueError(f"Wallet not found")
+            raise WalletNotFoundError()
 
         wallet.activate()
         logger.info(f"Wallet {wallet.wallet_id} activated for user {wallet.userid}")
+    if wallet_cache:
+        wallet_cache.discard(WALLETS, cmd.userid)
 
 
 async def deactivate_wallet_handler(
         cmd: commands.DeactivateWalletCommand,
         puow: unit_of_work.AbstractUnitOfWork,
+        wallet_cache: ReferenceDataCache = None
 ):
     """Deactivate a user's wallet using WalletService."""
     async with puow:
         wallet = await puow.repo.get_wallet_by_userid(cmd.userid)
         if not wallet:
-            raise ValueError(f"Wallet not found")
+            raise WalletNotFoundError()
 
         wallet.deactivate()
         logger.info(f"Wallet {wallet.wallet_id} deactivated for user {wallet.userid}")
+    if wallet_cache:
+        wallet_cache.discard(WALLETS, cmd.userid)
 
 
 
 async def add_chain_handler(
         cmd: commands.AddChainCommand,
-        puow: unit_of_work.AbstractUnitOfWork
+        puow: unit_of_work.AbstractUnitOfWork,
+        cache: ReferenceDataCache = None
 ):
     """Add a new supported token for TraderJoe swaps."""
     async with puow:
-        # Validate chain doesn't already exist
-        existing_chain = await puow.repo.get_chain(cmd.chain_id)
-        if existing_chain:
-            raise ValueError(f"Chain {cmd.chain_id} already exists")
-
-        # Create and save new chain
         new_chain = Chain.create(
             chain_id=cmd.chain_id,
             name=cmd.name,
             symbol=cmd.symbol,
             rpc_url=cmd.rpc_url,
         )
-        puow.repo.add_chain(new_chain)
+        # Existence check and insert happen in a single statement
+        if not await puow.repo.add_chain_if_absent(new_chain):
+            raise ChainAlreadyExistsError(msg=f"Chain {cmd.chain_id} already exists")
+    if cache:
+        cache.invalidate(CHAINS)
 
 
 async def add_token_handler(
         cmd: commands.AddTokenCommand,
-        puow: unit_of_work.AbstractUnitOfWork
+        puow: unit_of_work.AbstractUnitOfWork,
+        cache: ReferenceDataCache = None
 ):
     """Add a new supported token for TraderJoe swaps."""
     async with puow:
-        # Validate token doesn't already exist
-        existing_token = await puow.repo.get_token_by_symbol(cmd.symbol)
-        if existing_token:
-            raise ValueError(f"Token {cmd.symbol} already exists")
-
         # Create token using appropriate factory method
         token = Token.create(
-            token_id=uuid4().hex,
+            token_id=new_id(),
             chain_id=cmd.chain_id,
             symbol=cmd.symbol,
             name=cmd.name,
@@ -119,33 +133,72 @@ async def add_token_handler(
             decimals=cmd.decimals,
         )
 
-        puow.repo.add_token(token)
+        # Existence check and insert happen in a single statement
+        if not await puow.repo.add_token_if_absent(token):
+            raise TokenAlreadyExistsError(msg=f"Token {cmd.symbol} already exists")
         logger.info(f"Token {cmd.symbol} added successfully with ID {token.token_id}")
-        return token.token_id
+    if cache:
+        cache.invalidate(TOKENS)
+    return token.token_id
 
 
 # Token Approval Handlers
+async def _get_token_route(
+        puow: unit_of_work.AbstractUnitOfWork,
+        token_id: str,
+        cache: ReferenceDataCache = None,
+) -> Dict[str, Any]:
+    """Resolve the contract and chain details a token's on-chain calls need.
+
+    Tokens are reference data, so the immutable value objects are cached per
+    token id and the joined lookup is skipped on a hit. Adding a token
+    invalidates the namespace.
+    """
+    key = ("route", token_id)
+    if cache and (cached := cache.get(TOKENS, key)) is not None:
+        return cached
+    # Token and its chain come back from a single joined query
+    token_and_chain = await puow.repo.get_token_with_chain(token_id)
+    if not token_and_chain:
+        raise TokenNotFoundError(msg=f"Token {token_id} not found")
+    token, chain = token_and_chain
+    route = {
+        "contract_address": token.contract_address,
+        "token_name": token.name.value,
+        "chain_id": chain.chain_id,
+        "chain_name": chain.name.value,
+        "rpc_url": chain.rpc_url,
+    }
+    if cache:
+        cache.set(TOKENS, key, route)
+    return route
+
+
 async def approve_token_handler(
         cmd: commands.ApproveTokenCommand,
         puow: unit_of_work.AbstractUnitOfWork,
+        cache: ReferenceDataCache = None,
 ):
     async with puow:
         wallet = await puow.repo.get_wallet_by_userid(cmd.userid)
         if not wallet:
-            raise ValueError(f"Wallet not found for user {cmd.userid}")
+            raise WalletNotFoundError(loc=["userid"], msg=f"Wallet not found for user {cmd.userid}")
         if not wallet.is_active:
-            raise ValueError(f"Wallet {wallet.wallet_id} is not active")
-        token = await puow.repo.get_token(cmd.token_id)
-        if not token:
-            raise ValueError(f"Token {cmd.token_id} not found")
-        chain = await puow.repo.get_chain(token.chain_id)
-        erc20_protocol = await create_protocol(token.contract_address, chain.chain_id, chain.rpc_url)
-        latest_tx = await puow.repo.get_last_confirmed_transaction(chain.chain_id, wallet.wallet_id)
-        tx = await erc20_protocol.approve(cmd.spender_address, cmd.amount, wallet, latest_tx=latest_tx)
+            raise WalletInactiveError(msg=f"Wallet {wallet.wallet_id} is not active")
+        route = await _get_token_route(puow, cmd.token_id, cache)
+        latest_tx = await puow.repo.get_last_confirmed_transaction(route["chain_id"], wallet.wallet_id)
+
+    # Broadcast outside the unit of work: a synchronous send waits for the block,
+    # and no database transaction should stay open for that long
+    from src.adapters.blockchain.utils import create_protocol
+    erc20_protocol = await create_protocol(route["contract_address"], route["chain_id"], route["rpc_url"])
+    tx = await erc20_protocol.approve(cmd.spender_address, cmd.amount, wallet, latest_tx=latest_tx)
+
+    async with puow:
         approval_tx = Transaction.create(
-            transaction_id=ID(uuid4().hex),
+            transaction_id=ID(new_id()),
             wallet_id=wallet.wallet_id,
-            chain_id=token.chain_id,
+            chain_id=route["chain_id"],
             transaction_type=TransactionType.GIVE_APPROVAL,
             transaction_hash=TransactionHash(tx['txHash']),
             transaction_status=TransactionStatus.PENDING,
@@ -153,115 +206,226 @@ async def approve_token_handler(
             gas=Gas(tx['gas']),
             nonce=Nonce(tx['nonce'])
         )
+        if 'receipt' in tx:
+            # Mined during a synchronous send; no tracking needed
+            _record_receipt(approval_tx, tx['receipt'])
         puow.repo.add_transaction(approval_tx)
-        logger.info(f"Approval transaction created: {approval_tx.transaction_id.value} for token {token.name.value} on chain {chain.name.value}")
+        logger.info(f"Approval transaction created: {approval_tx.transaction_id.value} for token {route['token_name']} on chain {route['chain_name']}")
 
 
 # TraderJoe Swap Handler
+# Strategy name -> TraderJoeProtocol method
+_SWAP_STRATEGIES = {
+    "fast": "swap_fast",
+    "cheap": "swap_cheap",
+    "secure": "swap_secure",
+}
+
+# Protocol instances keyed by (router, chain, rpc, factory); building one constructs
+# Web3 providers and contract bindings, so they are reused across swaps. The router,
+# chain and factory come from the request body, so only the most recently used are kept.
+_TRADERJOE_PROTOCOLS: "OrderedDict[Tuple[str, str, str, str], TraderJoeProtocol]" = OrderedDict()
+_TRADERJOE_PROTOCOLS_MAXSIZE = 16
+
+
+def _get_traderjoe_protocol(router_address: str, chain_id: str, rpc_url: str, factory_address: str) -> "TraderJoeProtocol":
+    key = (router_address, chain_id, rpc_url, factory_address)
+    protocol = _TRADERJOE_PROTOCOLS.get(key)
+    if protocol is not None:
+        _TRADERJOE_PROTOCOLS.move_to_end(key)
+    else:
+        from src.adapters.blockchain.protocols.traderjoe import TraderJoeProtocol
+
+        protocol = TraderJoeProtocol(
+            contract_address=Address(router_address),
+            chain_id=ID(chain_id),
+            rpc_url=RPC(rpc_url),
+            factory_address=Address(factory_address)
+        )
+        _TRADERJOE_PROTOCOLS[key] = protocol
+        if len(_TRADERJOE_PROTOCOLS) > _TRADERJOE_PROTOCOLS_MAXSIZE:
+            _TRADERJOE_PROTOCOLS.popitem(last=False)
+    return protocol
+
+
 async def execute_traderjoe_swap_handler(
         cmd: commands.ExecuteSwapCommand,
         puow: unit_of_work.AbstractUnitOfWork,
 ):
     """Execute a TraderJoe swap using the specified strategy."""
+    swap_method_name = _SWAP_STRATEGIES.get(cmd.strategy)
+    if swap_method_name is None:
+        raise InvalidSwapStrategyError(msg=f"Invalid strategy: {cmd.strategy}")
+
     async with puow:
         # Get user's wallet
         wallet = await puow.repo.get_wallet_by_userid(cmd.userid)
         if not wallet:
-            raise ValueError(f"Wallet not found for user {cmd.userid}")
+            raise WalletNotFoundError(loc=["userid"], msg=f"Wallet not found for user {cmd.userid}")
 
         if not wallet.is_active:
-            raise ValueError(f"Wallet is not active for user {cmd.userid}")
+            raise WalletInactiveError(msg=f"Wallet is not active for user {cmd.userid}")
 
         # Get latest transaction for nonce calculation
         latest_tx = await puow.repo.get_latest_transaction_by_wallet_id(wallet.wallet_id)
 
-        # Create TraderJoe protocol instance
-        from src.adapters.blockchain.protocols.traderjoe import TraderJoeProtocol
-        from src.domain.model import Address, ID, RPC
-
-        trader_joe = TraderJoeProtocol(
-            contract_address=Address(cmd.router_address),
-            chain_id=ID(cmd.chain_id),
-            rpc_url=RPC(f"https://api.avax.network/ext/bc/C/rpc"),  # This should come from config
-            factory_address=Address(cmd.factory_address)
-        )
-
-        # Execute swap based on strategy
-        if cmd.strategy == "fast":
-            result = await trader_joe.swap_fast(
-                token_from=cmd.token_from,
-                token_to=cmd.token_to,
-                amount_in=int(cmd.amount_in),
-                max_slippage_percent=cmd.max_slippage_percent,
-                to_address=wallet.address,
-                sender=wallet,
-                latest_tx=latest_tx
-            )
-        elif cmd.strategy == "cheap":
-            result = await trader_joe.swap_cheap(
-                token_from=cmd.token_from,
-                token_to=cmd.token_to,
-                amount_in=int(cmd.amount_in),
-                max_slippage_percent=cmd.max_slippage_percent,
-                to_address=wallet.address,
-                sender=wallet,
-                latest_tx=latest_tx
-            )
-        elif cmd.strategy == "secure":
-            result = await trader_joe.swap_secure(
-                token_from=cmd.token_from,
-                token_to=cmd.token_to,
-                amount_in=int(cmd.amount_in),
-                max_slippage_percent=cmd.max_slippage_percent,
-                to_address=wallet.address,
-                sender=wallet,
-                latest_tx=latest_tx
-            )
-        else:
-            raise ValueError(f"Invalid strategy: {cmd.strategy}")
+    trader_joe = _get_traderjoe_protocol(
+        cmd.router_address,
+        cmd.chain_id,
+        config.get_avalanche_rpc_url(),
+        cmd.factory_address
+    )
+
+    # Execute swap based on strategy, outside the unit of work: a synchronous
+    # send waits for the block, and no database transaction should stay open for that long
+    swap = getattr(trader_joe, swap_method_name)
+    result = await swap(
+        token_from=cmd.token_from,
+        token_to=cmd.token_to,
+        amount_in=int(cmd.amount_in),
+        max_slippage_percent=cmd.max_slippage_percent,
+        to_address=wallet.address,
+        sender=wallet,
+        latest_tx=latest_tx
+    )
 
+    async with puow:
         # Create transaction record
         transaction = Transaction.create(
-            transaction_id=ID(uuid4().hex),
+            transaction_id=ID(new_id()),
             wallet_id=wallet.wallet_id,
             chain_id=ID(cmd.chain_id),
-            transaction_type=TransactionType("TRADERJOE_SWAP"),
+            transaction_type=TransactionType.TRADERJOE_SWAP,
             transaction_hash=TransactionHash(result['txHash']),
-            transaction_status=TransactionStatus("PENDING"),
+            transaction_status=TransactionStatus.PENDING,
             gas=Gas(str(result['gas'])),
             gas_price=GasPrice(str(result['gasPrice'])),
             nonce=Nonce(str(result['nonce']))
         )
 
+        if 'receipt' in result:
+            # Mined during a synchronous send; no tracking needed
+            _record_receipt(transaction, result['receipt'])
         puow.repo.add_transaction(transaction)
         logger.info(f"TraderJoe {cmd.strategy} swap transaction created: {transaction.transaction_id.value}")
+    # The swap is tracked through its transaction record
+    return {"swap_id": transaction.transaction_id.value, "txHash": result['txHash']}
 
 
 # ===== EVENT HANDLERS =====
 # Internal Event Handlers - These handle business logic within the service
 
-async def handle_transaction_created(event: TransactionCreated, puow: unit_of_work.AbstractUnitOfWork):
+async def handle_transaction_created(
+        event: TransactionCreated,
+        puow: unit_of_work.AbstractUnitOfWork,
+        tracking_queue: asyncio.Queue = None,
+):
+    """Hand a pending transaction to the tracking workers instead of waiting on its receipt here."""
     async with puow:
         tx = await puow.repo.get_transaction(event.transaction_id)
         if not tx:
-            raise ValueError(f"Transaction not found for id {event.transaction_id}")
+            raise TransactionNotFoundError(msg=f"Transaction not found for id {event.transaction_id}")
         if tx.transaction_status != TransactionStatus.PENDING:
             logger.info(f"Transaction {event.transaction_id} already processed")
+            return
+
+    cmd = commands.TrackTransactionCommand(transaction_id=event.transaction_id)
+    if tracking_queue is None:
+        await track_transaction_handler(cmd, puow)
+    else:
+        await messagebus.submit(tracking_queue, cmd)
+
+
+def _record_receipt(tx: Transaction, tx_receipt) -> None:
+    if tx_receipt['status'] == 1:
+        tx.confirm(BlockNumber(tx_receipt['blockNumber']), GasUsed(tx_receipt['gasUsed']))
+    else:
+        tx.fail("Transaction reverted on blockchain")
+
+
+# rpc_url -> semaphore capping concurrent receipt polls against that endpoint
+_TRACKING_SLOTS: Dict[str, asyncio.Semaphore] = {}
+
+
+def _get_tracking_slot(rpc_url: str) -> asyncio.Semaphore:
+    slot = _TRACKING_SLOTS.get(rpc_url)
+    if slot is None:
+        slot = asyncio.Semaphore(config.get_tracking_concurrency_per_rpc())
+        _TRACKING_SLOTS[rpc_url] = slot
+    return slot
+
+
+# transaction ids whose receipt is currently being awaited in this process
+_TRACKING_IN_FLIGHT: Set[str] = set()
+
+
+async def track_transaction_handler(
+        cmd: commands.TrackTransactionCommand,
+        puow: unit_of_work.AbstractUnitOfWork,
+):
+    """Wait for a pending transaction's receipt and record the outcome.
+
+    Duplicate requests for a transaction already being tracked (redelivered or
+    repeated TransactionCreated events) return immediately, so each transaction
+    has at most one receipt poll in flight.
+    """
+    if cmd.transaction_id in _TRACKING_IN_FLIGHT:
+        logger.info(f"Transaction {cmd.transaction_id} is already being tracked")
+        return
+    _TRACKING_IN_FLIGHT.add(cmd.transaction_id)
+    try:
+        await _track_transaction(cmd.transaction_id, puow)
+    finally:
+        _TRACKING_IN_FLIGHT.discard(cmd.transaction_id)
+
+
+async def _track_transaction(transaction_id: str, puow: unit_of_work.AbstractUnitOfWork):
+    # No session is held while the receipt is awaited; the transaction is
+    # reloaded afterwards in a fresh unit of work.
+    async with puow:
+        tx = await puow.repo.get_transaction(transaction_id)
+        if not tx:
+            raise TransactionNotFoundError(msg=f"Transaction not found for id {transaction_id}")
+        if tx.transaction_status != TransactionStatus.PENDING:
+            logger.info(f"Transaction {transaction_id} already processed")
+            return
+        chain = await puow.repo.get_chain(tx.chain_id)
+        if not chain:
+            raise ChainNotFoundError(msg=f"Chain {tx.chain_id} not found")
+        rpc_url, tx_hash = chain.rpc_url, tx.transaction_hash
+
+    from src.adapters.blockchain.utils import track_transaction
+    tx_receipt, error = None, None
+    async with _get_tracking_slot(rpc_url.value):
+        try:
+            tx_receipt = await track_transaction(rpc_url, tx_hash)
+        except Exception as e:
+            error = e
+
+    async with puow:
+        tx = await puow.repo.get_transaction(transaction_id)
+        if not tx or tx.transaction_status != TransactionStatus.PENDING:
+            return
+        if error is not None:
+            tx.fail(f"Error occurred while tracking transaction: {error}")
         else:
-            chain = await puow.repo.get_chain(tx.chain_id)
-            if not chain:
-                raise ValueError(f"Chain {tx.chain_id} not found")
-            try:
-                tx_receipt = await track_transaction(chain.rpc_url, tx.transaction_hash)
-                if tx_receipt['status'] == 1:
-                    tx.confirm(BlockNumber(tx_receipt['blockNumber']), GasUsed(tx_receipt['gasUsed']))
-                else:
-                    tx.fail("Transaction reverted on blockchain")
-            except Exception as e:
-                tx.fail(f"Error occurred while tracking transaction: {e}")
+            _record_receipt(tx, tx_receipt)
 
 
 # External Event Handlers - Generalized for DRY principle
+# Event type -> (event name, attribute holding the aggregate id), resolved once at import
+_EVENT_LOG_KEYS = {
+    WalletCreated: ("WalletCreated", "wallet_id"),
+    WalletActivated: ("WalletActivated", "wallet_id"),
+    WalletDeactivated: ("WalletDeactivated", "wallet_id"),
+    TransactionCreated: ("TransactionCreated", "transaction_id"),
+    TransactionConfirmed: ("TransactionConfirmed", "transaction_id"),
+    TransactionFailed: ("TransactionFailed", "transaction_id"),
+    TokenAdded: ("TokenAdded", "token_id"),
+    ChainAdded: ("ChainAdded", "chain_id"),
+}
+
+
 async def publish_event_to_external_services(event, pub):
     """
     Generalized event publisher for external services.
@@ -273,10 +437,14 @@ async def publish_event_to_external_services(event, pub):
         event: Any domain event to be published
         pub: Event publisher instance
     """
-    event_type = type(event).__name__
-    event_id = getattr(event, 'wallet_id', None) or getattr(event, 'transaction_id', None) or getattr(event, 'swap_id', None)
-
-    logger.info(f"Publishing {event_type} event for {event_id}")
+    log_keys = _EVENT_LOG_KEYS.get(type(event))
+    if log_keys:
+        event_type, id_attr = log_keys
+        event_id = getattr(event, id_attr)
+    else:
+        event_type, event_id = type(event).__name__, None
+
+    logger.info("Publishing %s event for %s", event_type, event_id)
     await pub.publish_event(event)
 
 
@@ -323,4 +491,7 @@ COMMAND_HANDLERS = {
 
     # TraderJoe Commands
     commands.ExecuteSwapCommand: execute_traderjoe_swap_handler,
+
+    # Transaction Tracking Commands
+    commands.TrackTransactionCommand: track_transaction_handler,
 }
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from src.domain import commands
 from src.core.events import events
+from src.core.correlation.context import get_correlation_id, set_correlation_id
 from src.core.exceptions.exceptions import InvalidMessageTypeException
-from typing import Callable, Dict, List, Union, Type, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Type, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -10,6 +12,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 Message = Union[commands.Command, events.Event]
+QueuedMessage = Tuple[Optional[str], Message]
 
 
 class MessageBus:
@@ -39,75 +42,110 @@ class MessageBus:
         self.puow = puow
         self.event_handlers = event_handlers
         self.command_handlers = command_handlers
-        self.queue: List[Message] = [] # Initialize the internal message queue
 
-    async def handle(self, message: Message):
+    async def handle(self, message: Message, raise_event_errors: bool = False) -> Any:
         """
         Handles an incoming message, which can be either a Command or an Event.
 
-        This method places the initial message into an internal queue and then
-        processes messages one by one. If a handler generates new events,
-        those events are added to the queue for subsequent processing.
+        This method places the initial message into a queue local to this call and
+        then processes messages one by one. If a handler generates new events,
+        those events are added to the queue for subsequent processing. Keeping the
+        queue per call lets concurrent consumers share a single bus.
 
         Args:
             message (Message): The initial command or event to be processed.
+            raise_event_errors (bool): Re-raise the first failure of an event
+                handler instead of only logging it, for callers such as the
+                broker subscriber that retry the whole message on failure.
+
+        Returns:
+            Any: The return value of the handler for `message` when it is a
+                command, None for events.
 
         Raises:
             InvalidMessageTypeException: If the received message is neither
                                          a Command nor an Event.
         """
-        self.queue = [message] # Reset queue for each new top-level handle call
-        while self.queue:
-            current_message = self.queue.pop(0)
+        result = None
+        queue = [message]
+        while queue:
+            current_message = queue.pop(0)
             logger.info(f"Processing message: {type(current_message).__name__}")
 
             if isinstance(current_message, events.Event):
-                await self.handle_event(current_message)
+                queue.extend(await self.handle_event(current_message, raise_event_errors))
             elif isinstance(current_message, commands.Command):
-                await self.handle_command(current_message)
+                command_result, new_events = await self.handle_command(current_message)
+                if current_message is message:
+                    result = command_result
+                queue.extend(new_events)
             else:
                 logger.error(f"Received an invalid message type: {type(current_message).__name__}")
                 raise InvalidMessageTypeException(msg=f"{current_message} was not an Event or Command")
+        return result
 
-    async def handle_event(self, event: events.Event):
+    async def handle_event(self, event: events.Event, raise_errors: bool = False) -> List[events.Event]:
         """
         Dispatches an event to all of its registered handlers.
 
-        After each handler processes the event, any new domain events collected
-        by the Unit of Work are added to the message bus's internal queue
-        for further processing.
+        Handlers run concurrently, so an internal database handler and an
+        external publish overlap instead of running back to back. A failing
+        handler does not stop the others; every failure is logged once all of
+        them have finished. New domain events are collected inside each
+        handler's task, where its Unit of Work session is visible.
 
         Args:
             event (events.Event): The event instance to be handled.
+            raise_errors (bool): Re-raise the first handler failure after logging.
+
+        Returns:
+            List[events.Event]: New domain events raised by the handlers.
+
+        Raises:
+            Exception: The first handler failure, when `raise_errors` is set.
         """
         event_type_name = type(event).__name__
         logger.debug(f"Handling event: {event_type_name}")
 
+        new_events: List[events.Event] = []
         handlers_for_event = self.event_handlers.get(type(event), [])
         if not handlers_for_event:
             logger.warning(f"No handlers registered for event: {event_type_name}")
-            return
-
-        for handler in handlers_for_event:
-            try:
-                await handler(event)
-                # Collect and enqueue any new events raised by the handler
-                self.queue.extend(self.puow.collect_new_events())
-            except Exception as e:
-                logger.exception(f"Error handling event '{event_type_name}'")
-                # Depending on the error handling strategy, you might re-raise,
-                # publish a new error event, or log and continue.
-
-    async def handle_command(self, command: commands.Command):
+            return new_events
+
+        async def run(handler: Callable) -> List[events.Event]:
+            await handler(event)
+            # Collect any new events raised by the handler
+            return list(self.puow.collect_new_events())
+
+        results = await asyncio.gather(
+            *(run(handler) for handler in handlers_for_event),
+            return_exceptions=True
+        )
+        failures = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Error handling event '{event_type_name}'", exc_info=result)
+                failures.append(result)
+            else:
+                new_events.extend(result)
+        if failures and raise_errors:
+            raise failures[0]
+        return new_events
+
+    async def handle_command(self, command: commands.Command) -> Tuple[Any, List[events.Event]]:
         """
         Dispatches a command to its single registered handler.
 
         After the command handler processes the command, any new domain events
-        collected by the Unit of Work are added to the message bus's internal
-        queue for subsequent processing.
+        collected by the Unit of Work are returned for subsequent processing.
 
         Args:
             command (commands.Command): The command instance to be handled.
+
+        Returns:
+            Tuple[Any, List[events.Event]]: The handler's return value and the
+                new domain events raised by the handler.
         """
         command_type_name = type(command).__name__
         logger.debug(f"Handling command: {command_type_name}")
@@ -118,9 +156,55 @@ class MessageBus:
             raise ValueError(f"No handler registered for command type: {command_type_name}")
 
         try:
-            await handler(command)
-            # Collect and enqueue any new events raised by the handler
-            self.queue.extend(self.puow.collect_new_events())
+            result = await handler(command)
+            # Collect any new events raised by the handler
+            return result, list(self.puow.collect_new_events())
         except Exception as e:
             logger.error(f"Error handling command '{command_type_name}'")
-            raise # Re-raise the exception to be handled by higher layers (e.g., FastAPI exception handlers)
\ No newline at end of file
+            raise # Re-raise the exception to be handled by higher layers (e.g., FastAPI exception handlers)
+
+
+async def submit(queue: "asyncio.Queue[QueuedMessage]", message: Message, bus: Optional[MessageBus] = None):
+    """
+    Enqueues a message for background handling by a `command_worker`.
+
+    The caller's correlation ID travels with the message so logs and events
+    emitted by the worker stay attributable to the originating request.
+    When `bus` is given, a command it has no handler for is refused here,
+    while the caller can still report it, instead of being dropped by the worker.
+
+    Args:
+        queue (asyncio.Queue): The in-process command queue.
+        message (Message): The command or event to be handled.
+        bus (Optional[MessageBus]): The bus the workers dispatch through.
+
+    Raises:
+        ValueError: If `message` is a command `bus` has no handler for.
+    """
+    if bus is not None and isinstance(message, commands.Command) and type(message) not in bus.command_handlers:
+        command_type_name = type(message).__name__
+        logger.error(f"No handler registered for command: {command_type_name}")
+        raise ValueError(f"No handler registered for command type: {command_type_name}")
+    await queue.put((get_correlation_id(), message))
+
+
+async def command_worker(queue: "asyncio.Queue[QueuedMessage]", bus: MessageBus):
+    """
+    Drains the in-process command queue, dispatching each message through the bus.
+
+    Failures are logged and swallowed so a single bad command cannot take
+    the worker down. Runs until cancelled.
+
+    Args:
+        queue (asyncio.Queue): The in-process command queue.
+        bus (MessageBus): The message bus used to handle dequeued messages.
+    """
+    while True:
+        correlation_id, message = await queue.get()
+        set_correlation_id(correlation_id)
+        try:
+            await bus.handle(message)
+        except Exception:
+            logger.exception(f"Background handling failed for {type(message).__name__}")
+        finally:
+            queue.task_done()
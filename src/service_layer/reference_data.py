@@ -0,0 +1,75 @@
+"""
+In-process cache for chain and token reference data.
+
+Chains and tokens change only through the admin endpoints, yet every read
+path used to open a unit of work for them. Entries expire after a short TTL
+so other service instances pick up changes, and the add handlers invalidate
+the local copy immediately. A second, short-lived instance holds per-user
+wallet summaries under WALLETS; it is keyed by user, so it is also size-bounded.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+CHAINS = "chains"
+TOKENS = "tokens"
+WALLETS = "wallets"
+
+
+class ReferenceDataCache:
+    """
+    TTL cache for projected chain and token dicts, keyed by (namespace, lookup).
+
+    Cached values are the dicts the read services return, so a hit skips both
+    the database round-trip and the ORM-to-dict projection.
+
+    With `maxsize`, the least recently used entry is evicted once the cache is
+    full. Expired entries are only dropped when read, so keys that are never
+    read again would otherwise stay forever.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: Optional[int] = None):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, namespace: str, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value, or `default` when absent or expired.
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop((namespace, key), None)
+            return default
+        self._entries.move_to_end((namespace, key))
+        return value
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        """
+        Stores a value for `ttl` seconds, evicting the least recently used
+        entry when the cache is full.
+        """
+        self._entries[(namespace, key)] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end((namespace, key))
+        if self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, namespace: str, key: Hashable) -> None:
+        """
+        Drops a single entry, if present.
+        """
+        self._entries.pop((namespace, key), None)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        Drops every entry in `namespace`, or the whole cache when omitted.
+        """
+        if namespace is None:
+            self._entries.clear()
+            return
+        for cache_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[cache_key]
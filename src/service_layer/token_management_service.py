@@ -6,13 +6,14 @@ on the Avalanche network for TraderJoe swaps.
 """
 
 import logging
+import sys
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
-from uuid import uuid4
 
-from src.domain.model import Token
+from src.domain.model import Token, new_id
 from src.service_layer.unit_of_work import AbstractUnitOfWork
-from src.service_layer.validation import TokenValidationService
+from src.service_layer.reference_data import ReferenceDataCache, TOKENS
+from src.core.exceptions.exceptions import TokenAlreadyExistsError
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,16 @@ class TokenManagementService:
     Follows Single Responsibility Principle by handling only token management operations.
     """
 
-    def __init__(self, uow: AbstractUnitOfWork):
-        self.uow = uow
+    def __init__(
+        self,
+        puow: Optional[AbstractUnitOfWork] = None,
+        suow: Optional[AbstractUnitOfWork] = None,
+        cache: Optional[ReferenceDataCache] = None
+    ):
+        # Writes go to the primary; reads go to the standby, falling back to the primary
+        self.puow = puow
+        self.suow = suow or puow
+        self.cache = cache
 
     async def add_token(
         self,
@@ -48,20 +57,17 @@ class TokenManagementService:
             str: Token ID of the created token
 
         Raises:
-            ValueError: If token already exists or validation fails
+            ValueError: If validation fails
+            TokenAlreadyExistsError: If a token with the same symbol exists
         """
-        async with self.uow:
-            # Validate token doesn't already exist
-            existing_token = await self.uow.repo.get_token_by_symbol(symbol)
-            TokenValidationService.validate_token_not_exists(existing_token, symbol)
-
-            # Validate contract address for non-native tokens
-            if not contract_address:
-                raise ValueError("Contract address is required for non-native tokens")
+        # Validate contract address for non-native tokens
+        if not contract_address:
+            raise ValueError("Contract address is required for non-native tokens")
 
+        async with self.puow:
             # Create token using appropriate factory method
             token = Token.create(
-                token_id=uuid4().hex,
+                token_id=new_id(),
                 chain_id=chain_id,
                 symbol=symbol,
                 name=name,
@@ -69,9 +75,12 @@ class TokenManagementService:
                 decimals=decimals,
             )
 
-            self.uow.repo.add_token(token)
+            if not await self.puow.repo.add_token_if_absent(token):
+                raise TokenAlreadyExistsError(msg=f"Token {symbol} already exists")
             logger.info(f"Token {symbol} added successfully with ID {token.token_id}")
-            return token.token_id
+        if self.cache:
+            self.cache.invalidate(TOKENS)
+        return token.token_id
 
     async def get_supported_tokens(self) -> list[Dict[str, Any]]:
         """
@@ -80,21 +89,15 @@ class TokenManagementService:
         Returns:
             List of supported tokens on Avalanche network
         """
-        async with self.uow:
-            tokens = await self.uow.repo.get_supported_tokens()
-            return [
-                {
-                    "token_id": token.token_id.value,
-                    "chain_id": token.chain_id.value,
-                    "symbol": token.symbol.value,
-                    "name": token.name.value,
-                    "contract_address": token.contract_address.value if token.contract_address.value else None,
-                    "decimals": token.decimals.value,
-                }
-                for token in tokens
-            ]
-
-    async def get_token_by_symbol(self, symbol: str) -> Dict[str, Any]:
+        if self.cache and (cached := self.cache.get(TOKENS, "all")) is not None:
+            return cached
+        async with self.suow:
+            result = await self.suow.repo.list_tokens_projection()
+        if self.cache:
+            self.cache.set(TOKENS, "all", result)
+        return result
+
+    async def get_token_by_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get token by symbol on Avalanche network.
 
@@ -104,16 +107,24 @@ class TokenManagementService:
         Returns:
             Token if found, None otherwise
         """
-        async with self.uow:
-            token = await self.uow.repo.get_token_by_symbol(symbol)
-            return {
+        key = ("symbol", symbol)
+        if self.cache and (cached := self.cache.get(TOKENS, key)) is not None:
+            return cached
+        async with self.suow:
+            token = await self.suow.repo.get_token_by_symbol(symbol)
+            if not token:
+                return None
+            result = {
                 "token_id": token.token_id.value,
-                "chain_id": token.chain_id.value,
-                "symbol": token.symbol.value,
+                "chain_id": sys.intern(token.chain_id.value),
+                "symbol": sys.intern(token.symbol.value),
                 "name": token.name.value,
                 "contract_address": token.contract_address.value if token.contract_address.value else None,
-                "decimals": token.decimals.value,
+                "decimals": sys.intern(token.decimals.value),
             }
+        if self.cache:
+            self.cache.set(TOKENS, key, result)
+        return result
 
     async def get_token_by_contract(self, contract_address: str) -> Optional[Token]:
         """
@@ -125,5 +136,5 @@ class TokenManagementService:
         Returns:
             Token if found, None otherwise
         """
-        async with self.uow:
-            return await self.uow.repo.get_token_by_contract(contract_address)
+        async with self.suow:
+            return await self.suow.repo.get_token_by_contract(contract_address)
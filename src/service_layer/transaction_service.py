@@ -8,9 +8,8 @@ broadcasting, and status tracking.
 import logging
 from typing import Optional
 from datetime import datetime, timezone
-from uuid import uuid4
 
-from src.domain.model import Transaction, Swap, Token, Wallet
+from src.domain.model import Transaction, Swap, Token, Wallet, new_id
 from src.service_layer.unit_of_work import AbstractUnitOfWork
 from src.service_layer.blockchain_service import BlockchainService
 from src.adapters.blockchain.abstract import AbstractBlockchainAdapter
@@ -272,7 +271,7 @@ class TransactionService:
         Internal helper method to create related entities.
         """
         transaction = Transaction.create(
-            transaction_id=uuid4().hex,
+            transaction_id=new_id(),
             userid=userid,
             wallet_id=wallet_id,
             transaction_type="SWAP",
@@ -280,7 +279,7 @@ class TransactionService:
         )
 
         swap = Swap.create(
-            swap_id=uuid4().hex,
+            swap_id=new_id(),
             transaction_id=transaction.transaction_id.value,
             token_in_id=token_in_id,
             token_out_id=token_out_id,
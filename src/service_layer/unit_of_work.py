@@ -1,5 +1,7 @@
 import abc
-from sqlalchemy.orm.session import Session
+import contextlib
+from contextvars import ContextVar
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from src.adapters.database import repository
 
 
@@ -19,13 +21,27 @@ class AbstractUnitOfWork(abc.ABC):
         """
         await self._commit()
 
+    @contextlib.asynccontextmanager
+    async def readonly(self):
+        """
+        Opens the unit of work for reads only. Nothing is committed on exit.
+        Implementations may skip the database transaction entirely.
+        """
+        async with self:
+            yield self
+
     def collect_new_events(self):
         """
         Collects new domain events from tracked aggregates.
         """
-        for entity in self.repo.seen:
-            while entity.events:
-                yield entity.events.pop(0)
+        repo = getattr(self, "repo", None)
+        if repo is None:
+            return
+        for entity in repo.seen:
+            if entity.events:
+                # Swap in a fresh list rather than pop(0), which shifts the rest each time
+                new_events, entity.events = entity.events, []
+                yield from new_events
 
     @abc.abstractmethod
     async def _commit(self):
@@ -49,14 +65,34 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
     Provides access to all repositories through a single transaction context.
     All new repositories for TokenApproval, ApprovalTransaction, and SwapTransaction
     are accessible through the main repo instance.
+
+    A single instance is shared by every request and consumer task, so the
+    session and repo are held in context variables: each asyncio task sees
+    only the session it opened itself.
+
+    readonly() binds its session to an AUTOCOMMIT copy of the engine, so a
+    single-row lookup is sent without the BEGIN/COMMIT pair around it.
     """
 
-    def __init__(self, session_factory):
+    def __init__(self, session_factory: async_sessionmaker):
         self.session_factory = session_factory
+        bind = session_factory.kw.get("bind")
+        self._autocommit_bind = bind.execution_options(isolation_level="AUTOCOMMIT") if bind is not None else None
+        self._session: ContextVar = ContextVar(f"uow_session_{id(self)}", default=None)
+        self._repo: ContextVar = ContextVar(f"uow_repo_{id(self)}", default=None)
+
+    @property
+    def session(self) -> AsyncSession:
+        return self._session.get()
+
+    @property
+    def repo(self) -> repository.AbstractRepository:
+        return self._repo.get()
 
     async def __aenter__(self):
-        self.session = self.session_factory()
-        self.repo = repository.SqlAlchemyRepository(self.session)
+        session = self.session_factory()
+        self._session.set(session)
+        self._repo.set(repository.SqlAlchemyRepository(session))
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -66,6 +102,23 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
             await self.session.commit()
         await self.session.close()
 
+    @contextlib.asynccontextmanager
+    async def readonly(self):
+        if self._autocommit_bind is None:
+            async with super().readonly() as uow:
+                yield uow
+            return
+
+        session = self.session_factory(bind=self._autocommit_bind)
+        session_token = self._session.set(session)
+        repo_token = self._repo.set(repository.SqlAlchemyRepository(session))
+        try:
+            yield self
+        finally:
+            await session.close()
+            self._repo.reset(repo_token)
+            self._session.reset(session_token)
+
     async def _commit(self):
         await self.session.commit()
 
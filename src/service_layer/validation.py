@@ -5,7 +5,6 @@ This module provides validation logic that can be reused across handlers,
 following DRY principle and keeping validation logic centralized.
 """
 
-import re
 import logging
 import decimal
 from typing import Optional, Union
@@ -15,6 +14,23 @@ from src.core.exceptions.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+_SUPPORTED_NETWORKS = frozenset(("avalanche", "ethereum", "polygon"))
+_SUPPORTED_NETWORKS_MSG = f"Network must be one of: {', '.join(sorted(_SUPPORTED_NETWORKS))}"
+
+
+def is_hex_address(address: str) -> bool:
+    """
+    Check for a 0x-prefixed, 40 hex digit address.
+
+    Deleting every hex digit with bytes.translate runs as a single C loop, so the
+    check avoids the regex engine; anything left over is a non-hex character.
+    """
+    if len(address) != 42 or address[:2] != "0x" or not address.isascii():
+        return False
+    return not address[2:].encode("ascii").translate(None, _HEX_DIGITS)
+
 
 def validate_ethereum_address(address: str) -> None:
     """Validate Ethereum address format."""
@@ -24,7 +40,7 @@ def validate_ethereum_address(address: str) -> None:
             msg="Address is required and must be a string"
         )
 
-    if not re.match(r'^0x[a-fA-F0-9]{40}$', address):
+    if not is_hex_address(address):
         raise ValidationError(
             loc=["address"],
             msg="Invalid Ethereum address format"
@@ -39,13 +55,19 @@ def validate_transaction_amount(amount: Union[Decimal, int, float]) -> None:
             msg="Amount cannot be None"
         )
 
-    try:
-        decimal_amount = Decimal(str(amount))
-    except (ValueError, TypeError, decimal.InvalidOperation):
-        raise ValidationError(
-            loc=["amount"],
-            msg="Amount must be a valid number"
-        )
+    if isinstance(amount, Decimal):
+        decimal_amount = amount
+    elif type(amount) is int:
+        # Wei amounts arrive as ints; compare directly instead of round-tripping through str
+        decimal_amount = amount
+    else:
+        try:
+            decimal_amount = Decimal(str(amount))
+        except (ValueError, TypeError, decimal.InvalidOperation):
+            raise ValidationError(
+                loc=["amount"],
+                msg="Amount must be a valid number"
+            )
 
     if decimal_amount <= 0:
         raise ValidationError(
@@ -61,29 +83,32 @@ def validate_swap_parameters(
     slippage_tolerance: Union[Decimal, int, float]
 ) -> None:
     """Validate swap parameters."""
-    validate_ethereum_address(token_in)
-    validate_ethereum_address(token_out)
-    validate_transaction_amount(amount_in)
-
     if token_in == token_out:
         raise ValidationError(
             loc=["token_in", "token_out"],
             msg="Cannot swap token with itself"
         )
 
+    validate_ethereum_address(token_in)
+    validate_ethereum_address(token_out)
+    validate_transaction_amount(amount_in)
+
     if slippage_tolerance is None:
         raise ValidationError(
             loc=["slippage_tolerance"],
             msg="Slippage tolerance cannot be None"
         )
 
-    try:
-        decimal_slippage = Decimal(str(slippage_tolerance))
-    except (ValueError, TypeError, decimal.InvalidOperation):
-        raise ValidationError(
-            loc=["slippage_tolerance"],
-            msg="Slippage tolerance must be a valid number"
-        )
+    if isinstance(slippage_tolerance, Decimal) or type(slippage_tolerance) is int:
+        decimal_slippage = slippage_tolerance
+    else:
+        try:
+            decimal_slippage = Decimal(str(slippage_tolerance))
+        except (ValueError, TypeError, decimal.InvalidOperation):
+            raise ValidationError(
+                loc=["slippage_tolerance"],
+                msg="Slippage tolerance must be a valid number"
+            )
 
     if decimal_slippage <= 0 or decimal_slippage > 50:
         raise ValidationError(
@@ -100,11 +125,10 @@ def validate_wallet_network(network: str) -> None:
             msg="Network is required and must be a string"
         )
 
-    supported_networks = ["avalanche", "ethereum", "polygon"]
-    if network not in supported_networks:
+    if network not in _SUPPORTED_NETWORKS:
         raise ValidationError(
             loc=["network"],
-            msg=f"Network must be one of: {', '.join(supported_networks)}"
+            msg=_SUPPORTED_NETWORKS_MSG
         )
 
 
@@ -123,118 +147,124 @@ def validate_gas_parameters(gas_limit: int, gas_price: int) -> None:
         )
 
 
-class TransactionValidationService:
+def validate_wallet_ownership(wallet: Optional[Wallet], userid: str, wallet_id: str) -> Wallet:
     """
-    Centralized validation service for transaction-related operations.
+    Validate wallet exists and belongs to user.
 
-    Follows Single Responsibility Principle by handling only validation logic.
-    Implements DRY by providing reusable validation methods.
+    Args:
+        wallet: Wallet entity or None
+        userid: Expected owner user ID
+        wallet_id: Wallet ID for error messages
+
+    Returns:
+        Wallet: Validated wallet entity
+
+    Raises:
+        ValueError: If wallet doesn't exist or doesn't belong to user
     """
+    if not wallet:
+        raise ValueError(f"Wallet {wallet_id} not found")
+
+    if wallet.userid.value != userid:
+        raise ValueError("Wallet does not belong to user")
 
-    @staticmethod
-    def validate_wallet_ownership(wallet: Optional[Wallet], userid: str, wallet_id: str) -> Wallet:
-        """
-        Validate wallet exists and belongs to user.
+    return wallet
 
-        Args:
-            wallet: Wallet entity or None
-            userid: Expected owner user ID
-            wallet_id: Wallet ID for error messages
 
-        Returns:
-            Wallet: Validated wallet entity
+def validate_tokens_exist(token_in: Optional[Token], token_out: Optional[Token]) -> tuple[Token, Token]:
+    """
+    Validate both tokens exist.
 
-        Raises:
-            ValueError: If wallet doesn't exist or doesn't belong to user
-        """
-        if not wallet:
-            raise ValueError(f"Wallet {wallet_id} not found")
+    Args:
+        token_in: Input token or None
+        token_out: Output token or None
 
-        if wallet.userid.value != userid:
-            raise ValueError("Wallet does not belong to user")
+    Returns:
+        tuple[Token, Token]: Validated token entities
 
-        return wallet
+    Raises:
+        ValueError: If either token doesn't exist
+    """
+    if not token_in or not token_out:
+        raise ValueError("Invalid token(s)")
 
-    @staticmethod
-    def validate_tokens_exist(token_in: Optional[Token], token_out: Optional[Token]) -> tuple[Token, Token]:
-        """
-        Validate both tokens exist.
+    return token_in, token_out
 
-        Args:
-            token_in: Input token or None
-            token_out: Output token or None
 
-        Returns:
-            tuple[Token, Token]: Validated token entities
+def validate_transaction_exists(transaction: Optional[Transaction], transaction_id: str) -> Transaction:
+    """
+    Validate transaction exists.
 
-        Raises:
-            ValueError: If either token doesn't exist
-        """
-        if not token_in or not token_out:
-            raise ValueError("Invalid token(s)")
+    Args:
+        transaction: Transaction entity or None
+        transaction_id: Transaction ID for error messages
 
-        return token_in, token_out
+    Returns:
+        Transaction: Validated transaction entity
 
-    @staticmethod
-    def validate_transaction_exists(transaction: Optional[Transaction], transaction_id: str) -> Transaction:
-        """
-        Validate transaction exists.
+    Raises:
+        ValueError: If transaction doesn't exist
+    """
+    if not transaction:
+        raise ValueError(f"Transaction {transaction_id} not found")
 
-        Args:
-            transaction: Transaction entity or None
-            transaction_id: Transaction ID for error messages
+    return transaction
 
-        Returns:
-            Transaction: Validated transaction entity
 
-        Raises:
-            ValueError: If transaction doesn't exist
-        """
-        if not transaction:
-            raise ValueError(f"Transaction {transaction_id} not found")
+def validate_swap_exists(swap: Optional[Swap], transaction_id: str) -> Swap:
+    """
+    Validate swap exists for transaction.
 
-        return transaction
+    Args:
+        swap: Swap entity or None
+        transaction_id: Transaction ID for error messages
 
-    @staticmethod
-    def validate_swap_exists(swap: Optional[Swap], transaction_id: str) -> Swap:
-        """
-        Validate swap exists for transaction.
+    Returns:
+        Swap: Validated swap entity
 
-        Args:
-            swap: Swap entity or None
-            transaction_id: Transaction ID for error messages
+    Raises:
+        ValueError: If swap doesn't exist
+    """
+    if not swap:
+        raise ValueError(f"No swap found for transaction {transaction_id}")
 
-        Returns:
-            Swap: Validated swap entity
+    return swap
 
-        Raises:
-            ValueError: If swap doesn't exist
-        """
-        if not swap:
-            raise ValueError(f"No swap found for transaction {transaction_id}")
 
-        return swap
+def validate_token_not_exists(existing_token: Optional[Token], symbol: str) -> None:
+    """
+    Validate token doesn't already exist.
 
+    Args:
+        existing_token: Existing token or None
+        symbol: Token symbol
+        network: Network name
 
-class TokenValidationService:
+    Raises:
+        ValueError: If token already exists
     """
-    Validation service for token-related operations.
+    if existing_token:
+        raise ValueError(f"Token {symbol} already exists!")
 
-    Follows Single Responsibility Principle.
+
+class TransactionValidationService:
+    """
+    Centralized validation service for transaction-related operations.
+
+    Kept for existing callers; the checks are the module-level functions above.
     """
 
-    @staticmethod
-    def validate_token_not_exists(existing_token: Optional[Token], symbol: str) -> None:
-        """
-        Validate token doesn't already exist.
+    validate_wallet_ownership = staticmethod(validate_wallet_ownership)
+    validate_tokens_exist = staticmethod(validate_tokens_exist)
+    validate_transaction_exists = staticmethod(validate_transaction_exists)
+    validate_swap_exists = staticmethod(validate_swap_exists)
+
 
-        Args:
-            existing_token: Existing token or None
-            symbol: Token symbol
-            network: Network name
+class TokenValidationService:
+    """
+    Validation service for token-related operations.
+
+    Kept for existing callers; the checks are the module-level functions above.
+    """
 
-        Raises:
-            ValueError: If token already exists
-        """
-        if existing_token:
-            raise ValueError(f"Token {symbol} already exists!")
+    validate_token_not_exists = staticmethod(validate_token_not_exists)
@@ -1,141 +1,142 @@
 from typing import List, Dict, Any, Optional
 from src.service_layer import unit_of_work
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 import time
-from pydantic.dataclasses import dataclass
+from src.core.serialization.encoder import dumps
 from src.adapters.message_broker.connection_manager import AbstractConnectionManager, ConnectionMetrics, HealthMetrics
 from src.service_layer.blockchain_service import BlockchainService
+from src.service_layer.reference_data import CHAINS, TOKENS, ReferenceDataCache
 from src.service_layer.token_management_service import TokenManagementService
 from src.service_layer.wallet_service import WalletService
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlertsResponse:
     timestamp: datetime
     critical_alerts: List[str]
     warning_alerts: List[str]
     info_alerts: List[str]
 
+_iso = datetime.isoformat
+
+
+def _maybe_iso(value: Optional[datetime]) -> Optional[str]:
+    return _iso(value) if value is not None else None
+
+
+# Row builders for list views: one C-level attrgetter call per entity instead of
+# a dict display re-resolving every attribute chain in bytecode.
+_WALLET_KEYS = ("wallet_id", "userid", "address", "is_active", "created_at")
+_WALLET_GETTER = attrgetter("wallet_id.value", "userid.value", "address.value", "is_active", "created_at")
+
+_TX_KEYS = (
+    "transaction_id", "transaction_hash", "transaction_type", "status", "network",
+    "gas_limit", "gas_price", "gas_used", "created_at", "updated_at", "confirmed_at", "error_message"
+)
+_TX_GETTER = attrgetter(
+    "transaction_id.value", "transaction_hash", "transaction_type.value", "status.value", "network",
+    "gas_limit", "gas_price", "gas_used", "created_at", "updated_at", "confirmed_at", "error_message"
+)
+
+_FULL_TX_KEYS = (
+    "transaction_id", "userid", "wallet_id", "transaction_type", "status", "transaction_hash",
+    "gas_limit", "gas_price", "gas_used", "network", "created_at", "updated_at", "confirmed_at", "error_message"
+)
+_FULL_TX_GETTER = attrgetter(
+    "transaction_id.value", "userid.value", "wallet_id.value", "transaction_type.value", "status.value",
+    "transaction_hash", "gas_limit", "gas_price", "gas_used", "network", "created_at", "updated_at",
+    "confirmed_at", "error_message"
+)
+
+_TOKEN_KEYS = ("token_id", "symbol", "name", "contract_address", "decimals", "network", "is_native")
+_TOKEN_GETTER = attrgetter(
+    "token_id.value", "symbol.value", "name.value", "contract_address.value", "decimals.value", "network", "is_native"
+)
+
+_SWAP_TX_KEYS = (
+    "swap_transaction_id", "transaction_id", "swap_type", "token_in_id", "token_out_id", "amount_in",
+    "amount_out_expected", "amount_out_actual", "slippage_tolerance", "deadline", "router_address"
+)
+_SWAP_TX_GETTER = attrgetter(
+    "swap_transaction_id.value", "transaction_id.value", "swap_type.value", "token_in_id.value", "token_out_id.value",
+    "amount_in.value", "amount_out_expected.value", "amount_out_actual", "slippage_tolerance.value", "deadline",
+    "router_address.value"
+)
+
+
+def _wallet_rows(wallets) -> List[Dict[str, Any]]:
+    rows = [dict(zip(_WALLET_KEYS, values)) for values in map(_WALLET_GETTER, wallets)]
+    for row in rows:
+        row["created_at"] = _maybe_iso(row["created_at"])
+    return rows
+
+
+def _transaction_rows(transactions, *, full: bool = False) -> List[Dict[str, Any]]:
+    """
+    Status rows keep datetimes as-is; full rows add ownership fields and render datetimes as ISO strings.
+    """
+    keys, getter = (_FULL_TX_KEYS, _FULL_TX_GETTER) if full else (_TX_KEYS, _TX_GETTER)
+    rows = [dict(zip(keys, values)) for values in map(getter, transactions)]
+    for row in rows:
+        if row["transaction_hash"] is not None:
+            row["transaction_hash"] = row["transaction_hash"].value
+        if full:
+            for key in ("created_at", "updated_at", "confirmed_at"):
+                row[key] = _maybe_iso(row[key])
+    return rows
+
+
+def _swap_tx_rows(swap_txs) -> List[Dict[str, Any]]:
+    rows = [dict(zip(_SWAP_TX_KEYS, values)) for values in map(_SWAP_TX_GETTER, swap_txs)]
+    for row in rows:
+        if row["amount_out_actual"] is not None:
+            row["amount_out_actual"] = row["amount_out_actual"].value
+        row["deadline"] = _maybe_iso(row["deadline"])
+    return rows
+
+
 async def get_user_wallets(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get all wallets for a user (should return only one wallet per user)."""
-    with suow:
-        wallets = suow.repo.get_user_wallets(userid)
-        return [
-            {
-                "wallet_id": wallet.wallet_id.value,
-                "userid": wallet.userid.value,
-                "address": wallet.address.value,
-                "is_active": wallet.is_active,
-                "created_at": wallet.created_at.isoformat() if wallet.created_at else None
-                # Removed network field - wallet works across all networks
-            }
-            for wallet in wallets
-        ]
+    async with suow:
+        wallets = await suow.repo.get_user_wallets(userid)
+        return _wallet_rows(wallets)
 
 
 async def get_supported_tokens(network: str, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get all supported tokens for a network."""
-    with suow:
-        tokens = suow.repo.get_active_tokens(network)
-        return [
-            {
-                "token_id": token.token_id.value,
-                "symbol": token.symbol.value,
-                "name": token.name.value,
-                "contract_address": token.contract_address.value,
-                "decimals": token.decimals.value,
-                "network": token.network,
-                "is_native": token.is_native
-            }
-            for token in tokens
-        ]
+    async with suow:
+        tokens = await suow.repo.get_active_tokens(network)
+        return [dict(zip(_TOKEN_KEYS, values)) for values in map(_TOKEN_GETTER, tokens)]
 
 
 async def get_user_transactions(userid: str, limit: int, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get transaction history for a user."""
-    with suow:
-        transactions = suow.repo.get_user_transactions(userid, limit)
-        return [
-            {
-                "transaction_id": tx.transaction_id.value,
-                "transaction_hash": tx.transaction_hash.value if tx.transaction_hash else None,
-                "transaction_type": tx.transaction_type.value,
-                "status": tx.status.value,
-                "network": tx.network,
-                "gas_limit": tx.gas_limit,
-                "gas_price": tx.gas_price,
-                "gas_used": tx.gas_used,
-                "created_at": tx.created_at,
-                "updated_at": tx.updated_at,
-                "confirmed_at": tx.confirmed_at,
-                "error_message": tx.error_message
-            }
-            for tx in transactions
-        ]
+    async with suow:
+        transactions = await suow.repo.get_user_transactions(userid, limit)
+        return _transaction_rows(transactions)
 
 
 async def get_transaction_status(transaction_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
     """Get status of a specific transaction."""
-    with suow:
-        transaction = suow.repo.get_transaction(transaction_id)
+    async with suow:
+        transaction = await suow.repo.get_transaction(transaction_id)
         if not transaction:
             return None
 
-        return {
-            "transaction_id": transaction.transaction_id.value,
-            "transaction_hash": transaction.transaction_hash.value if transaction.transaction_hash else None,
-            "transaction_type": transaction.transaction_type.value,
-            "status": transaction.status.value,
-            "network": transaction.network,
-            "gas_limit": transaction.gas_limit,
-            "gas_price": transaction.gas_price,
-            "gas_used": transaction.gas_used,
-            "created_at": transaction.created_at,
-            "updated_at": transaction.updated_at,
-            "confirmed_at": transaction.confirmed_at,
-            "error_message": transaction.error_message
-        }
-
-
-async def get_user_swap_history(userid: str, limit: int, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
-    """Get swap history for a user."""
-    with suow:
-        transactions = suow.repo.get_user_transactions(userid, limit)
-        swap_transactions = [tx for tx in transactions if tx.transaction_type.value == "SWAP"]
-
-        swaps = []
-        for tx in swap_transactions:
-            swap = suow.repo.get_swap_by_transaction(tx.transaction_id.value)
-            if swap:
-                # Get token details
-                token_in = suow.repo.get_token(swap.token_in_id.value)
-                token_out = suow.repo.get_token(swap.token_out_id.value)
-
-                swaps.append({
-                    "swap_id": swap.swap_id.value,
-                    "transaction_id": swap.transaction_id.value,
-                    "token_in_symbol": token_in.symbol.value if token_in else "UNKNOWN",
-                    "token_out_symbol": token_out.symbol.value if token_out else "UNKNOWN",
-                    "amount_in": swap.amount_in.value,
-                    "amount_out_expected": swap.amount_out_expected.value,
-                    "amount_out_actual": swap.amount_out_actual.value if swap.amount_out_actual else None,
-                    "slippage_tolerance": swap.slippage_tolerance.value,
-                    "deadline": swap.deadline,
-                    "status": tx.status.value,
-                    "transaction_hash": tx.transaction_hash.value if tx.transaction_hash else None
-                })
-
-        return swaps
+        return _transaction_rows([transaction])[0]
 
 
 async def get_wallet_balance(wallet_id: str, token_id: Optional[str], suow: unit_of_work.AbstractUnitOfWork) -> Dict[str, Any]:
     """Get balance for a specific wallet and token."""
-    with suow:
-        wallet = suow.repo.get_wallet(wallet_id)
+    async with suow:
+        wallet = await suow.repo.get_wallet(wallet_id)
         if not wallet:
             raise ValueError("Wallet not found")
 
         if token_id:
-            token = suow.repo.get_token(token_id)
+            token = await suow.repo.get_token(token_id)
             if not token:
                 raise ValueError("Token not found")
 
@@ -157,90 +158,44 @@ async def get_wallet_balance(wallet_id: str, token_id: Optional[str], suow: unit
             }
 
 
-def get_wallet_by_id(wallet_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
+async def get_wallet_by_id(wallet_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
     """Get wallet by ID."""
-    with suow:
-        wallet = suow.repo.get_wallet(wallet_id)
+    async with suow:
+        wallet = await suow.repo.get_wallet(wallet_id)
         if not wallet:
             return None
 
-        return {
-            "wallet_id": wallet.wallet_id.value,
-            "userid": wallet.userid.value,
-            "address": wallet.address.value,
-            "is_active": wallet.is_active,
-            "created_at": wallet.created_at.isoformat() if wallet.created_at else None
-            # Removed network field - wallet works across all networks
-        }
+        return _wallet_rows([wallet])[0]
 
 
-def get_wallets_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
+async def get_wallets_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get all wallets for a user."""
-    with suow:
-        wallets = suow.repo.get_wallets_by_user(userid)
-        return [
-            {
-                "wallet_id": wallet.wallet_id.value,
-                "userid": wallet.userid.value,
-                "address": wallet.address.value,
-                "is_active": wallet.is_active,
-                "created_at": wallet.created_at.isoformat() if wallet.created_at else None
-                # Removed network field - wallet works across all networks
-            }
-            for wallet in wallets
-        ]
+    async with suow:
+        wallets = await suow.repo.get_wallets_by_user(userid)
+        return _wallet_rows(wallets)
 
 
-def get_transaction_by_id(transaction_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
+async def get_transaction_by_id(transaction_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
     """Get transaction by ID."""
-    with suow:
-        transaction = suow.repo.get_transaction(transaction_id)
+    async with suow:
+        transaction = await suow.repo.get_transaction(transaction_id)
         if not transaction:
             return None
 
-        return {
-            "transaction_id": transaction.transaction_id.value,
-            "userid": transaction.userid.value,
-            "wallet_id": transaction.wallet_id.value,
-            "transaction_type": transaction.transaction_type.value,
-            "status": transaction.status.value,
-            "transaction_hash": transaction.transaction_hash.value if transaction.transaction_hash else None,
-            "gas_limit": transaction.gas_limit,
-            "gas_price": transaction.gas_price,
-            "gas_used": transaction.gas_used,
-            "network": transaction.network,
-            "created_at": transaction.created_at.isoformat() if transaction.created_at else None,
-            "updated_at": transaction.updated_at.isoformat() if transaction.updated_at else None,
-            "confirmed_at": transaction.confirmed_at.isoformat() if transaction.confirmed_at else None,
-            "error_message": transaction.error_message
-        }
+        return _transaction_rows([transaction], full=True)[0]
 
 
-def get_transactions_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork, limit: int = 50) -> List[Dict[str, Any]]:
+async def get_transactions_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork, limit: int = 50) -> List[Dict[str, Any]]:
     """Get transactions for a user with pagination."""
-    with suow:
-        transactions = suow.repo.get_user_transactions(userid, limit)
-        return [
-            {
-                "transaction_id": tx.transaction_id.value,
-                "userid": tx.userid.value,
-                "wallet_id": tx.wallet_id.value,
-                "transaction_type": tx.transaction_type.value,
-                "status": tx.status.value,
-                "transaction_hash": tx.transaction_hash.value if tx.transaction_hash else None,
-                "gas_limit": tx.gas_limit,
-                "gas_price": tx.gas_price,
-                "network": tx.network,
-                "created_at": tx.created_at.isoformat() if tx.created_at else None
-            }
-            for tx in transactions
-        ]
+    async with suow:
+        transactions = await suow.repo.get_user_transactions(userid, limit)
+        return _transaction_rows(transactions, full=True)
 
 
-def get_swap_by_id(swap_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
+async def get_swap_by_id(swap_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
     """Get swap by ID."""
-    with suow:
-        swap = suow.repo.get_swap(swap_id)
+    async with suow:
+        swap = await suow.repo.get_swap(swap_id)
         if not swap:
             return None
 
@@ -254,14 +209,14 @@ def get_swap_by_id(swap_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optio
             "amount_out_actual": swap.amount_out_actual.value if swap.amount_out_actual else None,
             "slippage_tolerance": swap.slippage_tolerance.value,
             "trader_joe_router": swap.trader_joe_router,
-            "deadline": swap.deadline.isoformat() if swap.deadline else None
+            "deadline": _maybe_iso(swap.deadline)
         }
 
 
-def get_swaps_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+async def get_swaps_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
     """Get swaps for a user with pagination."""
-    with suow:
-        swaps = suow.repo.get_swaps_by_user(userid, limit=limit, offset=offset)
+    async with suow:
+        swaps = await suow.repo.get_swaps_by_user(userid, limit=limit, offset=offset)
         return [
             {
                 "swap_id": swap.swap_id.value,
@@ -272,28 +227,28 @@ def get_swaps_by_user(userid: str, suow: unit_of_work.AbstractUnitOfWork, limit:
                 "amount_in": str(swap.amount_in),
                 "amount_out": str(swap.amount_out),
                 "slippage_tolerance": str(swap.slippage_tolerance),
-                "created_at": swap.created_at.isoformat() if swap.created_at else None
+                "created_at": _maybe_iso(swap.created_at)
             }
             for swap in swaps
         ]
 
 
-def get_wallet_balance_summary(wallet_id: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
-    """Get wallet balance summary including all tokens across all networks."""
-    with suow:
-        wallet = suow.repo.get_wallet(wallet_id)
+async def get_wallet_balance_summary(
+    wallet_id: str,
+    suow: unit_of_work.AbstractUnitOfWork,
+    network: str = "avalanche",
+    include_tokens: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Get wallet balance summary; the token list for `network` is only loaded when `include_tokens` is set."""
+    async with suow:
+        wallet = await suow.repo.get_wallet(wallet_id)
         if not wallet:
             return None
 
-        # Get all active tokens for all networks since wallet works across networks
-        # For now, we'll default to avalanche but this could be parameterized
-        active_tokens = suow.repo.get_active_tokens("avalanche")  # Could be parameterized
-
-        return {
-            "wallet_id": wallet.wallet_id.value,
-            "address": wallet.address.value,
-            "network": "multi-chain",  # Indicate this wallet works across networks
-            "tokens": [
+        tokens = []
+        if include_tokens:
+            active_tokens = await suow.repo.get_active_tokens(network)
+            tokens = [
                 {
                     "token_id": token.token_id.value,
                     "symbol": token.symbol.value,
@@ -304,121 +259,136 @@ def get_wallet_balance_summary(wallet_id: str, suow: unit_of_work.AbstractUnitOf
                 }
                 for token in active_tokens
             ]
+
+        return {
+            "wallet_id": wallet.wallet_id.value,
+            "address": wallet.address.value,
+            "network": "multi-chain",  # Indicate this wallet works across networks
+            "tokens": tokens
         }
 
 
-def get_transaction_history_summary(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> Dict[str, Any]:
+async def get_transaction_history_summary(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> Dict[str, Any]:
     """Get transaction history summary with counts and recent transactions."""
-    with suow:
-        transactions = suow.repo.get_user_transactions(userid, limit=100)
-
-        # Count by status
-        status_counts = {}
-        for tx in transactions:
-            status = tx.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-        # Get recent transactions (last 10)
-        recent_transactions = transactions[:10]
-
-        return {
-            "userid": userid,
-            "total_transactions": len(transactions),
-            "status_counts": status_counts,
-            "recent_transactions": [
-                {
+    async with suow:
+        # Stream the rows: only the counts and the first 10 are needed
+        status_counts = Counter()
+        recent_transactions = []
+        total_transactions = 0
+        async for tx in suow.repo.iter_user_transactions(userid, limit=100):
+            total_transactions += 1
+            status_counts[tx.transaction_status.value] += 1
+            if len(recent_transactions) < 10:
+                recent_transactions.append({
                     "transaction_id": tx.transaction_id.value,
                     "transaction_type": tx.transaction_type.value,
-                    "status": tx.status.value,
+                    "status": tx.transaction_status.value,
                     "transaction_hash": tx.transaction_hash.value if tx.transaction_hash else None,
-                    "created_at": tx.created_at.isoformat() if tx.created_at else None
-                }
-                for tx in recent_transactions
-            ]
-        }
-
-
-async def get_health_status(conn: AbstractConnectionManager) -> HealthMetrics:
-    """Get comprehensive health check status"""
-    return await conn.health_check()
-
-
-async def get_metrics(conn: AbstractConnectionManager) -> ConnectionMetrics:
-    """Get detailed metrics for monitoring"""
-    return conn.get_metrics()
+                    "created_at": _maybe_iso(tx.created_at)
+                })
 
+        return {
+            "userid": userid,
+            "total_transactions": total_transactions,
+            "status_counts": dict(status_counts),
+            "recent_transactions": recent_transactions
+        }
 
-async def get_prometheus_metrics(conn: AbstractConnectionManager) -> str:
-    """Generate Prometheus-compatible metrics"""
-    status = await conn.health_check()
 
-    return f"""
+_PROMETHEUS_TEMPLATE = """
     # HELP rabbitmq_connections_total Total number of connections created
     # TYPE rabbitmq_connections_total counter
-    rabbitmq_connections_total {status.metrics.total_connections_created}
+    rabbitmq_connections_total {total_connections_created}
 
     # HELP rabbitmq_channels_total Total number of channels created
     # TYPE rabbitmq_channels_total counter
-    rabbitmq_channels_total {status.metrics.total_channels_created}
+    rabbitmq_channels_total {total_channels_created}
 
     # HELP rabbitmq_connections_active Current number of active connections
     # TYPE rabbitmq_connections_active gauge
-    rabbitmq_connections_active {status.metrics.active_connections}
+    rabbitmq_connections_active {active_connections}
 
     # HELP rabbitmq_channels_active Current number of active channels
     # TYPE rabbitmq_channels_active gauge
-    rabbitmq_channels_active {status.metrics.active_channels}
+    rabbitmq_channels_active {active_channels}
 
     # HELP rabbitmq_connection_errors_total Total number of connection errors
     # TYPE rabbitmq_connection_errors_total counter
-    rabbitmq_connection_errors_total {status.metrics.connection_errors}
+    rabbitmq_connection_errors_total {connection_errors}
 
     # HELP rabbitmq_channel_errors_total Total number of channel errors
     # TYPE rabbitmq_channel_errors_total counter  
-    rabbitmq_channel_errors_total {status.metrics.channel_errors}
+    rabbitmq_channel_errors_total {channel_errors}
 
     # HELP rabbitmq_messages_published_total Total number of messages published
     # TYPE rabbitmq_messages_published_total counter
-    rabbitmq_messages_published_total {status.metrics.total_messages_published}
+    rabbitmq_messages_published_total {total_messages_published}
 
     # HELP rabbitmq_messages_consumed_total Total number of messages consumed
     # TYPE rabbitmq_messages_consumed_total counter
-    rabbitmq_messages_consumed_total {status.metrics.total_messages_consumed}
+    rabbitmq_messages_consumed_total {total_messages_consumed}
 
     # HELP rabbitmq_last_error_timestamp_seconds Timestamp of last error
     # TYPE rabbitmq_last_error_timestamp_seconds gauge
-    rabbitmq_last_error_timestamp_seconds {status.metrics.last_error_time or 0}
+    rabbitmq_last_error_timestamp_seconds {last_error_time}
 
     # HELP rabbitmq_last_error_message message of last error
     # TYPE rabbitmq_last_error_message gauge
-    rabbitmq_last_error_message {status.metrics.last_error_message or ""}
+    rabbitmq_last_error_message {last_error_message}
 
     # HELP rabbitmq_connection_pool_utilization Connection pool utilization ratio
     # TYPE rabbitmq_connection_pool_utilization gauge
-    rabbitmq_connection_pool_utilization {status.metrics.connection_pool_utilization:.4f}
+    rabbitmq_connection_pool_utilization {connection_pool_utilization:.4f}
 
     # HELP rabbitmq_channel_pool_utilization Channel pool utilization ratio
     # TYPE rabbitmq_channel_pool_utilization gauge
-    rabbitmq_channel_pool_utilization {status.metrics.channel_pool_utilization:.4f}
+    rabbitmq_channel_pool_utilization {channel_pool_utilization:.4f}
 
     # HELP rabbitmq_circuit_breaker_open Circuit breaker status (1 = open, 0 = closed)
     # TYPE rabbitmq_circuit_breaker_open gauge
-    rabbitmq_circuit_breaker_open {status.circuit_breaker_open}
+    rabbitmq_circuit_breaker_open {circuit_breaker_open}
 
     # HELP rabbitmq_circuit_breaker_failures Circuit breaker failure count
     # TYPE rabbitmq_circuit_breaker_failures gauge
-    rabbitmq_circuit_breaker_failures {status.circuit_breaker_failures}
+    rabbitmq_circuit_breaker_failures {circuit_breaker_failures}
 
     # HELP rabbitmq_circuit_breaker_last_failure Circuit breaker last failure timestamp
     # TYPE rabbitmq_circuit_breaker_last_failure gauge
-    rabbitmq_circuit_breaker_last_failure {status.circuit_breaker_last_failure}
+    rabbitmq_circuit_breaker_last_failure {circuit_breaker_last_failure}
 
     # HELP rabbitmq_errors Circuit breaker last failure timestamp
     # TYPE rabbitmq_errors gauge
-    rabbitmq_errors {status.errors}
+    rabbitmq_errors {errors}
 """
 
 
+async def get_health_status(conn: AbstractConnectionManager) -> HealthMetrics:
+    """Get comprehensive health check status"""
+    return await conn.health_check()
+
+
+async def get_metrics(conn: AbstractConnectionManager) -> ConnectionMetrics:
+    """Get detailed metrics for monitoring"""
+    return conn.get_metrics()
+
+
+async def get_prometheus_metrics(conn: AbstractConnectionManager) -> str:
+    """Generate Prometheus-compatible metrics"""
+    status = await conn.health_check()
+    metrics = status.metrics
+
+    fields = dict(metrics.__dict__)
+    fields["connection_pool_utilization"] = metrics.connection_pool_utilization
+    fields["channel_pool_utilization"] = metrics.channel_pool_utilization
+    fields["last_error_time"] = metrics.last_error_time or 0
+    fields["last_error_message"] = metrics.last_error_message or ""
+    fields["circuit_breaker_open"] = int(status.circuit_breaker_open)
+    fields["circuit_breaker_failures"] = status.circuit_breaker_failures
+    fields["circuit_breaker_last_failure"] = status.circuit_breaker_last_failure
+    fields["errors"] = status.errors
+    return _PROMETHEUS_TEMPLATE.format_map(fields)
+
+
 async def get_alerts(conn: AbstractConnectionManager) -> AlertsResponse:
     """Get current alerts based on system status"""
     status = await conn.health_check()
@@ -466,27 +436,27 @@ async def get_alerts(conn: AbstractConnectionManager) -> AlertsResponse:
 # Views for read-only operations using standby database (suow)
 async def get_user_approvals_view(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get all current token approvals for a user."""
-    with suow:
-        approvals = suow.repo.get_user_approvals(userid)
+    async with suow:
+        approvals = await suow.repo.get_user_approvals(userid)
         return [
             {
                 "approval_id": approval.approval_id.value,
                 "wallet_id": approval.wallet_id.value,
                 "token_id": approval.token_id.value,
                 "approved_amount": approval.approved_amount.value,
-                "updated_at": approval.updated_at.isoformat() if approval.updated_at else None
+                "updated_at": _maybe_iso(approval.updated_at)
             }
             for approval in approvals
         ]
 
 async def get_approval_history_view(userid: str, token_id: str = None, suow: unit_of_work.AbstractUnitOfWork = None) -> List[Dict[str, Any]]:
     """Get approval transaction history for a user."""
-    with suow:
-        wallet = suow.repo.get_user_wallet(userid)
+    async with suow:
+        wallet = await suow.repo.get_user_wallet(userid)
         if not wallet:
             return []
 
-        approval_history = suow.repo.get_approval_history(token_id, wallet.wallet_id.value)
+        approval_history = await suow.repo.get_approval_history(token_id, wallet.wallet_id.value)
         return [
             {
                 "approval_transaction_id": approval_tx.approval_transaction_id.value,
@@ -502,94 +472,116 @@ async def get_approval_history_view(userid: str, token_id: str = None, suow: uni
 
 async def get_user_swap_history_view(userid: str, limit: int, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get swap transaction history for a user."""
-    with suow:
-        swap_txs = suow.repo.get_user_swap_history(userid, limit)
-        return [
-            {
-                "swap_transaction_id": swap_tx.swap_transaction_id.value,
-                "transaction_id": swap_tx.transaction_id.value,
-                "swap_type": swap_tx.swap_type.value,
-                "token_in_id": swap_tx.token_in_id.value,
-                "token_out_id": swap_tx.token_out_id.value,
-                "amount_in": swap_tx.amount_in.value,
-                "amount_out_expected": swap_tx.amount_out_expected.value,
-                "amount_out_actual": swap_tx.amount_out_actual.value if swap_tx.amount_out_actual else None,
-                "slippage_tolerance": swap_tx.slippage_tolerance.value,
-                "deadline": swap_tx.deadline.isoformat() if swap_tx.deadline else None,
-                "router_address": swap_tx.router_address.value
-            }
-            for swap_tx in swap_txs
-        ]
+    async with suow:
+        rows = await suow.repo.get_user_swap_history(userid, limit)
+    # Numeric(78, 0) columns come back as Decimal; wei amounts are served as integers
+    return [
+        {
+            **row,
+            "swap_type": row["swap_type"].value,
+            "amount_in": int(row["amount_in"]),
+            "amount_out_expected": int(row["amount_out_expected"]),
+            "amount_out_actual": int(row["amount_out_actual"]) if row["amount_out_actual"] is not None else None,
+            "deadline": _maybe_iso(row["deadline"]),
+        }
+        for row in rows
+    ]
 
 async def get_token_swap_history_view(token_id: str, limit: int, suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
     """Get swap history for a specific token."""
-    with suow:
-        swap_txs = suow.repo.get_token_swap_history(token_id, limit)
-        return [
-            {
-                "swap_transaction_id": swap_tx.swap_transaction_id.value,
-                "transaction_id": swap_tx.transaction_id.value,
-                "swap_type": swap_tx.swap_type.value,
-                "token_in_id": swap_tx.token_in_id.value,
-                "token_out_id": swap_tx.token_out_id.value,
-                "amount_in": swap_tx.amount_in.value,
-                "amount_out_expected": swap_tx.amount_out_expected.value,
-                "amount_out_actual": swap_tx.amount_out_actual.value if swap_tx.amount_out_actual else None,
-                "slippage_tolerance": swap_tx.slippage_tolerance.value,
-                "deadline": swap_tx.deadline.isoformat() if swap_tx.deadline else None,
-                "router_address": swap_tx.router_address.value
-            }
-            for swap_tx in swap_txs
-        ]
+    async with suow:
+        swap_txs = await suow.repo.get_token_swap_history(token_id, limit)
+        return _swap_tx_rows(swap_txs)
 
-async def get_supported_tokens_view(suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
+async def get_supported_tokens_view(suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> List[Dict[str, Any]]:
     """Get all supported tokens for TraderJoe swaps."""
-    token_service = TokenManagementService(suow)
+    token_service = TokenManagementService(suow=suow, cache=cache)
     return await token_service.get_supported_tokens()
 
-async def get_token_by_symbol_view(symbol: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
+async def get_token_by_symbol_view(symbol: str, suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> Optional[Dict[str, Any]]:
     """Get token by symbol."""
-    token_service = TokenManagementService(suow)
+    token_service = TokenManagementService(suow=suow, cache=cache)
     return await token_service.get_token_by_symbol(symbol)
 
-async def get_supported_chains_view(suow: unit_of_work.AbstractUnitOfWork) -> List[Dict[str, Any]]:
+async def get_supported_chains_view(suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> List[Dict[str, Any]]:
     """Get all supported chains."""
-    chain_service = BlockchainService(suow)
+    chain_service = BlockchainService(suow=suow, cache=cache)
     return await chain_service.get_supported_chains()
 
-async def get_chain_by_symbol_view(symbol: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
+async def get_chain_by_symbol_view(symbol: str, suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> Optional[Dict[str, Any]]:
     """Get chain by symbol."""
-    chain_service = BlockchainService(suow)
+    chain_service = BlockchainService(suow=suow, cache=cache)
     return await chain_service.get_chain_by_symbol(symbol)
 
-async def get_user_wallet_view(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> Optional[Dict[str, Any]]:
+async def get_user_wallet_view(userid: str, suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> Optional[Dict[str, Any]]:
     """Get user's wallet."""
-    wallet_service = WalletService(suow)  # No blockchain adapter needed for read operations
+    wallet_service = WalletService(suow, cache)  # No blockchain adapter needed for read operations
     return await wallet_service.get_user_wallet(userid)
 
 async def check_approval_status_view(
     userid: str,
     token_id: str,
-    required_amount: str,
+    required_amount: int,
     suow: unit_of_work.AbstractUnitOfWork
 ) -> Dict[str, Any]:
     """Check if user has sufficient approval for a token amount."""
-    with suow:
-        wallet = suow.repo.get_user_wallet(userid)
-        if not wallet:
-            return {"sufficient": False, "error": "User wallet not found"}
-
-        approval = suow.repo.get_token_approval_by_wallet_token(wallet.wallet_id, token_id)
-        if not approval:
-            return {
-                "sufficient": False,
-                "current_amount": "0",
-                "required_amount": required_amount
-            }
+    async with suow:
+        wallet_found, approved_amount = await suow.repo.get_user_approved_amount(userid, token_id)
+    if not wallet_found:
+        return {"sufficient": False, "error": "User wallet not found"}
 
-        is_sufficient = approval.has_sufficient_approval(required_amount)
+    if approved_amount is None:
         return {
-            "sufficient": is_sufficient,
-            "current_amount": approval.approved_amount.value,
+            "sufficient": False,
+            "current_amount": 0,
             "required_amount": required_amount
         }
+
+    return {
+        "sufficient": approved_amount >= required_amount,
+        "current_amount": approved_amount,
+        "required_amount": required_amount
+    }
+
+
+# Pre-serialized variants for list endpoints; they hand JSON bytes straight to the
+# response and skip FastAPI's jsonable_encoder pass over every row.
+
+async def get_supported_tokens_json(suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> bytes:
+    """Get all supported tokens as JSON bytes; the encoded body is cached alongside the token list."""
+    if cache and (cached := cache.get(TOKENS, "all_json")) is not None:
+        return cached
+    content = dumps(await get_supported_tokens_view(suow, cache))
+    if cache:
+        cache.set(TOKENS, "all_json", content)
+    return content
+
+async def get_supported_chains_json(suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> bytes:
+    """Get all supported chains as JSON bytes; the encoded body is cached alongside the chain list."""
+    if cache and (cached := cache.get(CHAINS, "all_json")) is not None:
+        return cached
+    content = dumps(await get_supported_chains_view(suow, cache))
+    if cache:
+        cache.set(CHAINS, "all_json", content)
+    return content
+
+async def get_user_wallet_json(userid: str, suow: unit_of_work.AbstractUnitOfWork, cache: Optional[ReferenceDataCache] = None) -> Optional[bytes]:
+    """Get user's wallet as JSON bytes, or None when the user has no wallet."""
+    wallet = await get_user_wallet_view(userid, suow, cache)
+    return dumps(wallet) if wallet else None
+
+async def get_user_approvals_json(userid: str, suow: unit_of_work.AbstractUnitOfWork) -> bytes:
+    """Get all current token approvals for a user as JSON bytes."""
+    return dumps(await get_user_approvals_view(userid, suow))
+
+async def get_approval_history_json(userid: str, token_id: str = None, suow: unit_of_work.AbstractUnitOfWork = None) -> bytes:
+    """Get approval transaction history for a user as JSON bytes."""
+    return dumps(await get_approval_history_view(userid, token_id, suow))
+
+async def get_user_swap_history_json(userid: str, limit: int, suow: unit_of_work.AbstractUnitOfWork) -> bytes:
+    """Get swap transaction history for a user as JSON bytes."""
+    return dumps(await get_user_swap_history_view(userid, limit, suow))
+
+async def get_token_swap_history_json(token_id: str, limit: int, suow: unit_of_work.AbstractUnitOfWork) -> bytes:
+    """Get swap history for a specific token as JSON bytes."""
+    return dumps(await get_token_swap_history_view(token_id, limit, suow))
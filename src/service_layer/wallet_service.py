@@ -4,14 +4,15 @@ Wallet Management Service for handling wallet operations.
 This service encapsulates all wallet-related business logic and blockchain interactions.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Tuple, Dict, Any
-from uuid import uuid4
 
-from eth_account import Account
-
-from src.domain.model import Wallet
+from src.core.exceptions.exceptions import WalletAlreadyExistsError
+from src.domain.model import Wallet, new_id
+from src.service_layer.account_pool import AccountPool, generate_account
+from src.service_layer.reference_data import ReferenceDataCache, WALLETS
 from src.service_layer.unit_of_work import AbstractUnitOfWork
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,15 @@ class WalletService:
     Follows Single Responsibility Principle by handling only wallet management operations.
     """
 
-    def __init__(self, uow: AbstractUnitOfWork):
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        cache: Optional[ReferenceDataCache] = None,
+        account_pool: Optional[AccountPool] = None
+    ):
         self.uow = uow
+        self.cache = cache
+        self.account_pool = account_pool
 
     async def create_wallet(self, userid: str):
         """
@@ -34,30 +42,30 @@ class WalletService:
             userid: User ID to create wallet for
 
         Raises:
-            ValueError: If user already has a wallet
+            WalletAlreadyExistsError: If user already has a wallet
         """
+        # Key derivation is CPU work: take a pre-generated account, or derive one off the event loop
+        if self.account_pool:
+            acct = await self.account_pool.get()
+        else:
+            acct = await asyncio.to_thread(generate_account)
+
+        # Create wallet domain entity
+        wallet = Wallet.create(
+            wallet_id=new_id(),
+            userid=userid,
+            address=acct.address,
+            account=acct,
+            created_at=datetime.now(timezone.utc)
+        )
+
         async with self.uow:
-            # Check if user already has a wallet
-            existing_wallet = await self.uow.repo.get_wallet_by_userid(userid)
-            if existing_wallet:
-                raise ValueError(f"User {userid} already has a wallet. Only one wallet per user is allowed.")
-
-            # Create wallet on blockchain
-            acct = Account.create()
-
-            # Create wallet domain entity
-            wallet = Wallet.create(
-                wallet_id=uuid4().hex,
-                userid=userid,
-                address=acct.address,
-                account=acct,
-                created_at=datetime.now()
-            )
-
-            self.uow.repo.add_wallet(wallet)
+            # The unique userid column enforces one wallet per user in the same statement
+            if not await self.uow.repo.add_wallet_if_absent(wallet):
+                raise WalletAlreadyExistsError(msg=f"User {userid} already has a wallet. Only one wallet per user is allowed.")
             await self.uow.commit()
 
-            logger.info(f"Wallet created for user {userid}: {acct.address}")
+            logger.info("Wallet created for user %s: %s", userid, acct.address)
 
     async def activate_wallet(self, userid: str) -> None:
         """
@@ -75,7 +83,9 @@ class WalletService:
                 raise ValueError(f"Wallet not found")
 
             wallet.activate()
-            logger.info(f"Wallet {wallet.wallet_id} activated for user {wallet.userid}")
+            logger.info("Wallet %s activated for user %s", wallet.wallet_id, wallet.userid)
+        if self.cache:
+            self.cache.discard(WALLETS, userid)
 
     async def deactivate_wallet(self, userid: str) -> None:
         """
@@ -93,7 +103,9 @@ class WalletService:
                 raise ValueError(f"Wallet not found")
 
             wallet.deactivate()
-            logger.info(f"Wallet {wallet.wallet_id} deactivated for user {wallet.userid}")
+            logger.info("Wallet %s deactivated for user %s", wallet.wallet_id, wallet.userid)
+        if self.cache:
+            self.cache.discard(WALLETS, userid)
 
     async def get_user_wallet(self, userid: str) -> Optional[Dict[str, Any]]:
         """
@@ -105,17 +117,17 @@ class WalletService:
         Returns:
             User's wallet if exists, None otherwise
         """
-        async with self.uow:
-            wallet = await self.uow.repo.get_wallet_by_userid(userid)
-            if not wallet:
-                return None
-            return {
-        "wallet_id": wallet.wallet_id.value,
-        "userid": wallet.userid.value,
-        "address": wallet.address.value,
-        "is_active": wallet.is_active,
-        "created_at": wallet.created_at.isoformat() if wallet.created_at else None
-    }
+        if self.cache and (cached := self.cache.get(WALLETS, userid)) is not None:
+            return cached
+        async with self.uow.readonly():
+            result = await self.uow.repo.get_wallet_summary_by_userid(userid)
+        if not result:
+            return None
+        if result["created_at"] is not None:
+            result["created_at"] = result["created_at"].isoformat()
+        if self.cache:
+            self.cache.set(WALLETS, userid, result)
+        return result
 
     async def get_wallet_by_id(self, wallet_id: str) -> Optional[Wallet]:
         """
@@ -127,7 +139,7 @@ class WalletService:
         Returns:
             Wallet if exists, None otherwise
         """
-        async with self.uow:
+        async with self.uow.readonly():
             return await self.uow.repo.get_wallet(wallet_id)
 
     async def get_wallet_by_address(self, address: str) -> Optional[Wallet]:
@@ -140,5 +152,5 @@ class WalletService:
         Returns:
             Wallet if exists, None otherwise
         """
-        async with self.uow:
+        async with self.uow.readonly():
             return await self.uow.repo.get_wallet_by_address(address)
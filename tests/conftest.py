@@ -0,0 +1,7 @@
+import os
+
+from cryptography.fernet import Fernet
+
+# The ORM encrypts wallet keys with ENCRYPTION_KEY, read when orm is imported;
+# unit tests import it through handlers and bootstrap as well
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
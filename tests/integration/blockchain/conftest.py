@@ -1,53 +1,70 @@
+import os
+
 import pytest
-from web3 import AsyncWeb3
-from src.adapters.blockchain.chains.avalanche import AvalancheFuji
+from eth_account import Account
+from src.adapters.blockchain import clients
 from src.adapters.blockchain.protocols.erc20 import ERC20Protocol
-from src.adapters.blockchain.protocols.traderjoe import TraderJoeV2Protocol
+from src.adapters.blockchain.protocols.traderjoe import TraderJoeProtocol
+from src.domain.model import Address, ID, RPC, Wallet, new_id
 
 # Test constants for Avalanche Fuji testnet
-TEST_RPC_URL = "https://api.avax-test.network/ext/bc/C/rpc"
-TEST_ACCOUNT = "0x0000000000000000000000000000000000000000"  # Replace with a test account
+# Comma-separated FUJI_RPC_URL entries are tried in order; the public endpoint throttles under load
+TEST_RPC_URLS = [
+    url.strip()
+    for url in os.environ.get("FUJI_RPC_URL", "https://api.avax-test.network/ext/bc/C/rpc").split(",")
+    if url.strip()
+]
+TEST_RPC_URL = TEST_RPC_URLS[0]
+TEST_CHAIN_ID = ID("43113")
 TEST_PRIVATE_KEY = "your_private_key_here"  # Replace with test private key
 
 # Test token addresses on Fuji
 TEST_USDC_ADDRESS = "0x5425890298aed601595a70AB815c96711a31Bc65"  # Fuji USDC
 TEST_WAVAX_ADDRESS = "0xd00ae08403B9bbb9124bB305C09058E32C39A48c"  # Fuji WAVAX
-TEST_JOE_ROUTER_ADDRESS = "0xd7f655E3376cE2D7A2b08fF01Eb3B1023191A901"  # TraderJoe V2.2 Router
+# TraderJoe LB router and factory, the same deployments the swap endpoints default to
+TEST_JOE_ROUTER_ADDRESS = "0xb4315e873dBcf96Ffd0acd8EA43f689D8c20fB30"
+TEST_JOE_FACTORY_ADDRESS = "0x8e42f2F4101563bF679975178e880FD87d3eFd4e"
+
+@pytest.fixture(scope="session", autouse=True)
+async def shared_web3_clients():
+    """Keep one keep-alive HTTP session per RPC endpoint for the whole run and close them at the end."""
+    yield
+    await clients.close_all()
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    import asyncio
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+async def fuji_rpc():
+    """Return the first of TEST_RPC_URLS that answers; the tests are skipped when none does."""
+    errors = []
+    for rpc_url in TEST_RPC_URLS:
+        try:
+            if await clients.get_web3(RPC(rpc_url)).is_connected(show_traceback=True):
+                return RPC(rpc_url)
+        except Exception as e:
+            errors.append(f"{rpc_url}: {e}")
+    pytest.skip(f"No Fuji RPC endpoint reachable ({'; '.join(errors) or 'not connected'})")
 
 @pytest.fixture(scope="session")
-async def fuji_chain():
-    """Create an instance of AvalancheFuji chain for testing."""
-    chain = AvalancheFuji(rpc_url=TEST_RPC_URL)
-    await chain.connect()
-    return chain
+async def fuji_web3(fuji_rpc):
+    """Return the shared Web3 client for the Fuji endpoint."""
+    return clients.get_web3(fuji_rpc)
 
 @pytest.fixture(scope="session")
-async def usdc_contract(fuji_chain):
+async def usdc_contract(fuji_rpc):
     """Create an instance of USDC token contract for testing."""
-    return ERC20Protocol(contract_address=TEST_USDC_ADDRESS).bind(fuji_chain)
+    return ERC20Protocol(Address(TEST_USDC_ADDRESS), TEST_CHAIN_ID, fuji_rpc)
 
 @pytest.fixture(scope="session")
-async def wavax_contract(fuji_chain):
+async def wavax_contract(fuji_rpc):
     """Create an instance of WAVAX token contract for testing."""
-    return ERC20Protocol(contract_address=TEST_WAVAX_ADDRESS).bind(fuji_chain)
+    return ERC20Protocol(Address(TEST_WAVAX_ADDRESS), TEST_CHAIN_ID, fuji_rpc)
 
 @pytest.fixture(scope="session")
-async def trader_joe_contract(fuji_chain):
-    """Create an instance of TraderJoe V2.2 contract for testing."""
-    return TraderJoeV2Protocol(contract_address=TEST_JOE_ROUTER_ADDRESS).bind(fuji_chain)
+async def trader_joe_contract(fuji_rpc):
+    """Create an instance of the TraderJoe router protocol for testing."""
+    return TraderJoeProtocol(Address(TEST_JOE_ROUTER_ADDRESS), TEST_CHAIN_ID, fuji_rpc, Address(TEST_JOE_FACTORY_ADDRESS))
 
 @pytest.fixture(scope="session")
 def sender_wallet():
-    """Return sender wallet information for testing."""
-    return {
-        "address": TEST_ACCOUNT,
-        "private_key": TEST_PRIVATE_KEY
-    }
+    """Return the funded sender wallet for testing."""
+    account = Account.from_key(TEST_PRIVATE_KEY)
+    return Wallet.create(wallet_id=new_id(), userid=new_id(), address=account.address, account=account)
@@ -0,0 +1,24 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.adapters.database import orm
+from src.service_layer import unit_of_work
+
+
+@pytest.fixture(scope="session")
+async def engine():
+    """In-memory SQLite database with the service schema, shared by every test in the run."""
+    orm.init_orm_mappers()
+    # One connection, so every session sees the same in-memory database
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(orm.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def uow(engine):
+    """Unit of work over the test database, configured like the application's."""
+    return unit_of_work.SqlAlchemyUnitOfWork(async_sessionmaker(bind=engine, expire_on_commit=False))
@@ -0,0 +1,145 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import bootstrap
+from src.core.exceptions.exceptions import WalletInactiveError, WalletNotFoundError
+from src.entrypoints import transaction_app
+
+from src.domain.model import (
+    Address, Amount, Gas, GasPrice, ID, Nonce, SlippageTolerance, SwapTransaction, Transaction, TransactionHash,
+    TransactionStatus, TransactionType, Wallet, new_id,
+)
+from src.service_layer import views
+from src.service_layer.account_pool import generate_account
+
+
+async def add_wallet_with_transactions(uow, statuses):
+    """Store a wallet for a new user with one transaction per status, created a minute apart."""
+    account = generate_account()
+    wallet = Wallet.create(wallet_id=new_id(), userid=new_id(), address=account.address, account=account)
+    started_at = datetime.now(timezone.utc)
+    async with uow:
+        uow.session.add(wallet)
+        for nonce, status in enumerate(statuses):
+            transaction = Transaction.create(
+                transaction_id=ID(new_id()),
+                wallet_id=wallet.wallet_id,
+                chain_id=ID("43114"),
+                transaction_type=TransactionType.TRADERJOE_SWAP,
+                transaction_hash=TransactionHash(f"0x{new_id()}{new_id()}"),
+                transaction_status=status,
+                gas=Gas(21000),
+                gas_price=GasPrice(25_000_000_000),
+                nonce=Nonce(nonce),
+            )
+            transaction.created_at = started_at + timedelta(minutes=nonce)
+            uow.repo.add_transaction(transaction)
+    return wallet
+
+
+async def test_iter_user_transactions_streams_only_the_users_transactions_newest_first(uow):
+    wallet = await add_wallet_with_transactions(
+        uow, [TransactionStatus.CONFIRMED, TransactionStatus.PENDING, TransactionStatus.FAILED]
+    )
+    await add_wallet_with_transactions(uow, [TransactionStatus.PENDING])
+
+    async with uow:
+        transactions = [tx async for tx in uow.repo.iter_user_transactions(wallet.userid.value)]
+
+    assert [tx.nonce.value for tx in transactions] == [2, 1, 0]
+    assert {tx.wallet_id for tx in transactions} == {wallet.wallet_id}
+
+
+async def test_iter_user_transactions_respects_the_limit(uow):
+    wallet = await add_wallet_with_transactions(uow, [TransactionStatus.CONFIRMED] * 3)
+
+    async with uow:
+        transactions = [tx async for tx in uow.repo.iter_user_transactions(wallet.userid.value, limit=2)]
+
+    assert [tx.nonce.value for tx in transactions] == [2, 1]
+
+
+async def test_get_transaction_history_summary_counts_by_status(uow):
+    wallet = await add_wallet_with_transactions(
+        uow, [TransactionStatus.CONFIRMED, TransactionStatus.PENDING, TransactionStatus.PENDING]
+    )
+
+    summary = await views.get_transaction_history_summary(wallet.userid.value, uow)
+
+    assert summary["total_transactions"] == 3
+    assert summary["status_counts"] == {"CONFIRMED": 1, "PENDING": 2}
+    assert [tx["status"] for tx in summary["recent_transactions"]] == ["PENDING", "PENDING", "CONFIRMED"]
+
+
+async def test_get_pending_transactions_returns_only_pending(uow):
+    wallet = await add_wallet_with_transactions(
+        uow, [TransactionStatus.CONFIRMED, TransactionStatus.PENDING, TransactionStatus.FAILED]
+    )
+
+    async with uow:
+        pending = await uow.repo.get_pending_transactions()
+
+    assert all(tx.transaction_status == TransactionStatus.PENDING for tx in pending)
+    assert [tx.nonce.value for tx in pending if tx.wallet_id == wallet.wallet_id] == [1]
+
+
+async def test_resume_transaction_tracking_queues_every_pending_transaction(uow):
+    await add_wallet_with_transactions(uow, [TransactionStatus.PENDING, TransactionStatus.CONFIRMED])
+    async with uow:
+        pending_ids = {tx.transaction_id.value for tx in await uow.repo.get_pending_transactions()}
+    tracking_queue = asyncio.Queue()
+
+    queued = await bootstrap.resume_transaction_tracking(uow, tracking_queue)
+
+    assert queued == len(pending_ids) == tracking_queue.qsize()
+    assert {tracking_queue.get_nowait()[1].transaction_id for _ in range(queued)} == pending_ids
+
+
+async def test_user_swap_history_serves_only_the_users_swaps_newest_first(uow):
+    wallet = await add_wallet_with_transactions(uow, [TransactionStatus.CONFIRMED, TransactionStatus.PENDING])
+    other_wallet = await add_wallet_with_transactions(uow, [TransactionStatus.CONFIRMED])
+    deadline = datetime(2026, 1, 1, 12, 0)
+    async with uow:
+        for owner in (wallet, other_wallet):
+            async for tx in uow.repo.iter_user_transactions(owner.userid.value):
+                uow.session.add(SwapTransaction(
+                    swap_transaction_id=ID(new_id()),
+                    transaction_id=tx.transaction_id,
+                    token_in_id=ID(new_id()),
+                    token_out_id=ID(new_id()),
+                    amount_in=Amount(10 ** 15 + tx.nonce.value),
+                    amount_out_expected=Amount(5 * 10 ** 14),
+                    slippage_tolerance=SlippageTolerance("0.5"),
+                    deadline=deadline,
+                    router_address=Address("0xb4315e873dBcf96Ffd0acd8EA43f689D8c20fB30"),
+                ))
+
+    history = await views.get_user_swap_history_view(wallet.userid.value, 50, uow)
+
+    assert [row["amount_in"] for row in history] == [10 ** 15 + 1, 10 ** 15]
+    assert all(type(row["amount_in"]) is int for row in history)
+    assert history[0]["swap_type"] == TransactionType.TRADERJOE_SWAP.value
+    assert history[0]["amount_out_expected"] == 5 * 10 ** 14 and history[0]["amount_out_actual"] is None
+    assert history[0]["deadline"] == views._maybe_iso(deadline)
+
+
+async def test_check_approval_status_compares_integer_amounts(uow):
+    wallet = await add_wallet_with_transactions(uow, [])
+
+    status = await views.check_approval_status_view(wallet.userid.value, new_id(), 2 ** 200, uow)
+
+    assert status == {"sufficient": False, "current_amount": 0, "required_amount": 2 ** 200}
+
+
+async def test_queued_commands_are_refused_without_an_active_wallet(uow):
+    wallet = await add_wallet_with_transactions(uow, [])
+
+    await transaction_app.ensure_active_wallet(wallet.userid.value, uow, None)
+    with pytest.raises(WalletNotFoundError):
+        await transaction_app.ensure_active_wallet(new_id(), uow, None)
+    async with uow:
+        (await uow.repo.get_wallet_by_userid(wallet.userid.value)).is_active = False
+    with pytest.raises(WalletInactiveError):
+        await transaction_app.ensure_active_wallet(wallet.userid.value, uow, None)
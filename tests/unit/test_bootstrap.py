@@ -0,0 +1,20 @@
+from src import bootstrap
+
+
+class UnusableUnitOfWork:
+    async def __aenter__(self):
+        raise AssertionError("the database must not be touched")
+
+    async def __aexit__(self, *args):
+        pass
+
+
+async def test_seed_reference_data_skips_a_missing_file(tmp_path):
+    await bootstrap.seed_reference_data(UnusableUnitOfWork(), str(tmp_path / "seed.json"))
+
+
+async def test_seed_reference_data_skips_a_malformed_file(tmp_path):
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text("{not json")
+
+    await bootstrap.seed_reference_data(UnusableUnitOfWork(), str(seed_path))
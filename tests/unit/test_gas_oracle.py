@@ -0,0 +1,47 @@
+from src.adapters.blockchain.gas_oracle import GasOracle
+
+KEY = ("0xb4315e873dBcf96Ffd0acd8EA43f689D8c20fB30", "swapExactTokensForNATIVE")
+
+
+def test_no_answer_until_enough_samples():
+    oracle = GasOracle(min_samples=3)
+    oracle.record(KEY, 100_000)
+    oracle.record(KEY, 100_000)
+
+    assert oracle.get(KEY) is None
+    assert oracle.get("other") is None
+
+
+def test_answers_with_the_95th_percentile_plus_headroom():
+    oracle = GasOracle(min_samples=20, headroom=1.5)
+    for gas in range(100_000, 120_000, 1_000):
+        oracle.record(KEY, gas)
+
+    assert oracle.get(KEY) == int(118_000 * 1.5)
+
+
+def test_every_nth_lookup_goes_back_to_the_node():
+    oracle = GasOracle(min_samples=1, refresh_every=3)
+    oracle.record(KEY, 100_000)
+
+    assert [oracle.get(KEY) is None for _ in range(6)] == [False, False, True, False, False, True]
+
+
+def test_old_samples_leave_the_window():
+    oracle = GasOracle(window=2, min_samples=2, headroom=1.0)
+    oracle.record(KEY, 300_000)
+    oracle.record(KEY, 100_000)
+    oracle.record(KEY, 100_000)
+
+    assert oracle.get(KEY) == 100_000
+
+
+def test_least_recently_used_keys_are_evicted():
+    oracle = GasOracle(min_samples=1, headroom=1.0, maxsize=2)
+    oracle.record("a", 100_000)
+    oracle.record("b", 200_000)
+    oracle.get("a")
+
+    oracle.record("c", 300_000)
+
+    assert [oracle.get(key) for key in ("a", "b", "c")] == [100_000, None, 300_000]
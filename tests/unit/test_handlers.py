@@ -0,0 +1,24 @@
+from collections import OrderedDict
+
+from src.service_layer import handlers
+
+RPC_URL = "https://rpc.invalid/ext/bc/C/rpc"
+FACTORY = "0x8e42f2F4101563bF679975178e880FD87d3eFd4e"
+ROUTERS = [
+    "0xb4315e873dBcf96Ffd0acd8EA43f689D8c20fB30",
+    "0x18556DA13313f3532c54711497A8FedAC273220E",
+    "0x60aE616a2155Ee3d9A68541Ba4544862310933d4",
+]
+
+
+def test_traderjoe_protocols_are_reused_and_bounded(monkeypatch):
+    monkeypatch.setattr(handlers, "_TRADERJOE_PROTOCOLS", OrderedDict())
+    monkeypatch.setattr(handlers, "_TRADERJOE_PROTOCOLS_MAXSIZE", 2)
+
+    first = handlers._get_traderjoe_protocol(ROUTERS[0], "43114", RPC_URL, FACTORY)
+    handlers._get_traderjoe_protocol(ROUTERS[1], "43114", RPC_URL, FACTORY)
+    assert handlers._get_traderjoe_protocol(ROUTERS[0], "43114", RPC_URL, FACTORY) is first
+
+    handlers._get_traderjoe_protocol(ROUTERS[2], "43114", RPC_URL, FACTORY)
+
+    assert [key[0] for key in handlers._TRADERJOE_PROTOCOLS] == [ROUTERS[0], ROUTERS[2]]
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from src.core.events import events
+from src.domain import commands
+from src.service_layer.messagebus import MessageBus, submit
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.pending_events = []
+
+    def collect_new_events(self):
+        new_events, self.pending_events = self.pending_events, []
+        yield from new_events
+
+
+async def test_handle_returns_the_command_handlers_result():
+    puow = FakeUnitOfWork()
+    handled_events = []
+
+    async def create_wallet(cmd):
+        puow.pending_events.append(events.WalletActivated(wallet_id="w1", userid=cmd.userid))
+        return {"wallet_id": "w1"}
+
+    async def on_activated(event):
+        handled_events.append(event)
+        return "ignored"
+
+    bus = MessageBus(
+        puow=puow,
+        event_handlers={events.WalletActivated: [on_activated]},
+        command_handlers={commands.CreateWalletCommand: create_wallet},
+    )
+
+    result = await bus.handle(commands.CreateWalletCommand(userid="u1"))
+
+    assert result == {"wallet_id": "w1"}
+    assert [event.userid for event in handled_events] == ["u1"]
+
+
+async def test_handle_returns_none_for_events():
+    async def on_activated(event):
+        return "ignored"
+
+    bus = MessageBus(
+        puow=FakeUnitOfWork(),
+        event_handlers={events.WalletActivated: [on_activated]},
+        command_handlers={},
+    )
+
+    assert await bus.handle(events.WalletActivated(wallet_id="w1", userid="u1")) is None
+
+
+async def test_submit_refuses_commands_without_a_handler():
+    queue = asyncio.Queue()
+    bus = MessageBus(puow=FakeUnitOfWork(), event_handlers={}, command_handlers={commands.CreateWalletCommand: None})
+
+    with pytest.raises(ValueError, match="RevokeApprovalCommand"):
+        await submit(queue, commands.RevokeApprovalCommand(userid="u1", token_id="t1"), bus)
+    await submit(queue, commands.CreateWalletCommand(userid="u1"), bus)
+
+    assert [type(message) for _, message in [queue.get_nowait()]] == [commands.CreateWalletCommand]
+    assert queue.empty()
+
+
+async def test_event_handler_failures_are_raised_on_request_after_every_handler_ran():
+    handled = []
+
+    async def fails(event):
+        raise RuntimeError("tracking failed")
+
+    async def publishes(event):
+        handled.append(event.userid)
+
+    bus = MessageBus(
+        puow=FakeUnitOfWork(),
+        event_handlers={events.WalletActivated: [fails, publishes]},
+        command_handlers={},
+    )
+    event = events.WalletActivated(wallet_id="w1", userid="u1")
+
+    assert await bus.handle(event) is None
+    with pytest.raises(RuntimeError, match="tracking failed"):
+        await bus.handle(event, raise_event_errors=True)
+    assert handled == ["u1", "u1"]
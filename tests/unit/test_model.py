@@ -0,0 +1,27 @@
+import time
+import uuid
+
+from src.domain import model
+from src.domain.model import ID, new_id
+
+
+def test_new_id_is_a_valid_uuid7_hex_id():
+    value = new_id()
+
+    parsed = uuid.UUID(hex=value)
+    assert ID(value).value == value == parsed.hex
+    assert (parsed.version, parsed.variant) == (7, uuid.RFC_4122)
+
+
+def test_new_ids_are_unique():
+    assert len({new_id() for _ in range(1000)}) == 1000
+
+
+def test_new_ids_sort_by_creation_time(monkeypatch):
+    now_ns = time.time_ns()
+    monkeypatch.setattr(model.time, "time_ns", lambda: now_ns)
+    earlier = new_id()
+    monkeypatch.setattr(model.time, "time_ns", lambda: now_ns + 1_000_000)
+
+    assert all(new_id() > earlier for _ in range(100))
+    assert int(earlier[:12], 16) == now_ns // 1_000_000
@@ -0,0 +1,127 @@
+import asyncio
+from collections import OrderedDict
+
+import pytest
+from web3.exceptions import TransactionNotFound
+
+from src.adapters.blockchain import base
+from src.adapters.blockchain.protocols.erc20 import ERC20Protocol
+from src.domain.model import Address, ID, RPC
+
+TOKEN = "0x5425890298aed601595a70AB815c96711a31Bc65"
+SPENDER = "0xd7f655E3376cE2D7A2b08fF01Eb3B1023191A901"
+OTHER_TOKEN = "0xB31f66AA3C1e785363F0875A1B74E27b85FD66c7"
+
+
+@pytest.fixture
+def protocol(monkeypatch):
+    protocol = ERC20Protocol(Address(TOKEN), ID("43113"), RPC("https://rpc.invalid/ext/bc/C/rpc"))
+    calls = []
+
+    async def estimate_gas(tx):
+        calls.append(("estimate_gas", dict(tx)))
+        return 46_000
+
+    async def get_gas_price():
+        calls.append(("get_gas_price", None))
+        return 27_500_000_000
+
+    monkeypatch.setattr(protocol.chain.eth, "estimate_gas", estimate_gas)
+    monkeypatch.setattr(protocol, "get_gas_price", get_gas_price)
+    protocol.calls = calls
+    return protocol
+
+
+async def test_prepare_transaction_encodes_the_call_and_fetches_gas_once(protocol):
+    tx = await protocol.prepare_transaction('approve', (SPENDER, 5), {'from': SPENDER, 'nonce': 3, 'chainId': 43113})
+
+    assert tx['to'] == TOKEN
+    assert tx['data'] == protocol.contract.encode_abi('approve', args=(SPENDER, 5))
+    assert tx['value'] == 0
+    assert (tx['nonce'], tx['gas'], tx['gasPrice']) == (3, 46_000, 27_500_000_000)
+    assert sorted(name for name, _ in protocol.calls) == ["estimate_gas", "get_gas_price"]
+    # The estimate is made on the final call, without placeholder gas fields
+    estimated = protocol.calls[[name for name, _ in protocol.calls].index("estimate_gas")][1]
+    assert 'gas' not in estimated and 'gasPrice' not in estimated
+
+
+async def test_prepare_transaction_uses_the_callers_gas_price(protocol):
+    tx = await protocol.prepare_transaction(
+        'approve', (SPENDER, 5), {'from': SPENDER, 'nonce': 0, 'chainId': 43113}, gas_price=30_000_000_000
+    )
+
+    assert tx['gasPrice'] == 30_000_000_000
+    assert [name for name, _ in protocol.calls] == ["estimate_gas"]
+
+
+async def test_contracts_are_reused_and_bounded(monkeypatch):
+    monkeypatch.setattr(base, "_CONTRACTS", OrderedDict())
+    monkeypatch.setattr(base, "_CONTRACTS_MAXSIZE", 2)
+    rpc_url = RPC("https://rpc.invalid/ext/bc/C/rpc")
+
+    first = ERC20Protocol(Address(TOKEN), ID("43113"), rpc_url)
+    ERC20Protocol(Address(SPENDER), ID("43113"), rpc_url)
+    assert ERC20Protocol(Address(TOKEN), ID("43113"), rpc_url).contract is first.contract
+
+    ERC20Protocol(Address(OTHER_TOKEN), ID("43113"), rpc_url)
+
+    assert [key[2] for key in base._CONTRACTS] == [TOKEN, OTHER_TOKEN]
+
+
+@pytest.fixture
+def node(protocol, monkeypatch):
+    """Fakes the node behind `protocol`; `node.sync_send` sets how eth_sendRawTransactionSync answers."""
+    monkeypatch.setattr(base, "_SYNC_SEND_UNSUPPORTED", set())
+
+    class Node:
+        sync_send = None
+        known = False
+        sent = []
+
+    async def make_request(method, params):
+        if isinstance(Node.sync_send, Exception):
+            raise Node.sync_send
+        return Node.sync_send
+
+    async def get_transaction(tx_hash):
+        if not Node.known:
+            raise TransactionNotFound(f"{tx_hash.hex()} not found")
+        return {"hash": tx_hash}
+
+    async def send_raw_transaction(raw_transaction):
+        Node.sent.append(raw_transaction)
+
+    monkeypatch.setattr(protocol.chain.provider, "make_request", make_request)
+    monkeypatch.setattr(protocol.chain.eth, "get_transaction", get_transaction)
+    monkeypatch.setattr(protocol.chain.eth, "send_raw_transaction", send_raw_transaction)
+    return Node
+
+
+async def test_send_raw_transaction_falls_back_when_the_method_is_unsupported(protocol, node):
+    node.sync_send = {"error": {"code": -32601, "message": "the method eth_sendRawTransactionSync does not exist"}}
+
+    assert await protocol.send_raw_transaction(b"\x01") is None
+    assert await protocol.send_raw_transaction(b"\x02") is None
+
+    assert node.sent == [b"\x01", b"\x02"]
+    assert base._SYNC_SEND_UNSUPPORTED == {protocol.chain.provider.endpoint_uri}
+
+
+async def test_send_raw_transaction_raises_when_the_node_rejects_the_transaction(protocol, node):
+    node.sync_send = {"error": {"code": -32000, "message": "nonce too low"}}
+
+    with pytest.raises(ValueError, match="nonce too low"):
+        await protocol.send_raw_transaction(b"\x01")
+
+    assert node.sent == [] and base._SYNC_SEND_UNSUPPORTED == set()
+
+
+@pytest.mark.parametrize("known, resent", [(True, []), (False, [b"\x01"])])
+async def test_send_raw_transaction_resends_after_a_transport_error_only_when_unknown(protocol, node, known, resent):
+    node.sync_send = asyncio.TimeoutError()
+    node.known = known
+
+    assert await protocol.send_raw_transaction(b"\x01") is None
+
+    assert node.sent == resent
+    assert base._SYNC_SEND_UNSUPPORTED == set()
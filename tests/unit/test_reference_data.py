@@ -0,0 +1,47 @@
+from src.service_layer import reference_data
+from src.service_layer.reference_data import ReferenceDataCache, CHAINS, WALLETS
+
+
+def test_expired_entries_are_not_returned(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(reference_data.time, "monotonic", lambda: now[0])
+    cache = ReferenceDataCache(ttl=5)
+    cache.set(WALLETS, "u1", {"wallet_id": "w1"})
+
+    now[0] += 4
+    assert cache.get(WALLETS, "u1") == {"wallet_id": "w1"}
+    now[0] += 2
+    assert cache.get(WALLETS, "u1") is None
+
+
+def test_maxsize_evicts_the_least_recently_used_entry():
+    cache = ReferenceDataCache(ttl=60, maxsize=2)
+    cache.set(WALLETS, "u1", 1)
+    cache.set(WALLETS, "u2", 2)
+    cache.get(WALLETS, "u1")
+
+    cache.set(WALLETS, "u3", 3)
+
+    assert [cache.get(WALLETS, user) for user in ("u1", "u2", "u3")] == [1, None, 3]
+
+
+def test_invalidate_drops_only_the_namespace():
+    cache = ReferenceDataCache()
+    cache.set(CHAINS, "all", [1])
+    cache.set(WALLETS, "u1", 1)
+
+    cache.invalidate(CHAINS)
+
+    assert cache.get(CHAINS, "all") is None
+    assert cache.get(WALLETS, "u1") == 1
+
+
+def test_discard_drops_a_single_entry():
+    cache = ReferenceDataCache()
+    cache.set(WALLETS, "u1", 1)
+    cache.set(WALLETS, "u2", 2)
+
+    cache.discard(WALLETS, "u1")
+    cache.discard(WALLETS, "missing")
+
+    assert (cache.get(WALLETS, "u1"), cache.get(WALLETS, "u2")) == (None, 2)
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+from src.adapters.message_broker.subscriber import EventSubscriber, ProcessingResult
+from src.core.events import events
+from src.service_layer.messagebus import MessageBus
+
+
+class FakeMessage:
+    def __init__(self, delivery_tag, settled, body=b"{}"):
+        self.delivery_tag = delivery_tag
+        self.headers = {"x-correlation-id": f"cid-{delivery_tag}"}
+        self.body = body
+        self.correlation_id = self.headers["x-correlation-id"]
+        self._settled = settled
+
+    async def ack(self, multiple=False):
+        self._settled.append(("ack", self.delivery_tag, multiple))
+
+    async def reject(self, requeue=False):
+        self._settled.append(("reject", self.delivery_tag, requeue))
+
+
+class Deliveries:
+    """Runs messages through the subscriber, finishing each with the result it is given."""
+
+    def __init__(self, subscriber):
+        self.settled = []
+        self._results = {}
+        self._tasks = {}
+        subscriber._process_message = self._process_message
+        self._subscriber = subscriber
+
+    async def _process_message(self, body, headers):
+        return await self._results[headers["x-correlation-id"]]
+
+    async def deliver(self, *tags):
+        for tag in tags:
+            self._results[f"cid-{tag}"] = asyncio.get_running_loop().create_future()
+            self._tasks[tag] = asyncio.create_task(self._subscriber._handle_message(FakeMessage(tag, self.settled)))
+        await asyncio.sleep(0)
+
+    async def finish(self, tag, result=ProcessingResult.SUCCESS):
+        self._results[f"cid-{tag}"].set_result(result)
+        await self._tasks.pop(tag)
+
+
+@pytest.fixture
+def subscriber():
+    return EventSubscriber(
+        connection_manager=None, messagebus=None, queue_name="test", retry_delay=0, ack_batch_size=100
+    )
+
+
+async def test_acks_wait_for_earlier_deliveries_and_the_watermark_moves_forward(subscriber):
+    deliveries = Deliveries(subscriber)
+    await deliveries.deliver(1, 2, 3)
+
+    await deliveries.finish(3)
+    await subscriber._flush_acks()
+    assert deliveries.settled == []
+
+    await deliveries.finish(1)
+    await subscriber._flush_acks()
+    assert deliveries.settled == [("ack", 1, True)]
+
+    await deliveries.finish(2)
+    await subscriber._flush_acks()
+    assert deliveries.settled == [("ack", 1, True), ("ack", 3, True)]
+    assert subscriber._pending_acks == {}
+
+
+async def test_a_nack_inside_the_window_is_settled_alone_before_the_multi_ack(subscriber):
+    deliveries = Deliveries(subscriber)
+    await deliveries.deliver(1, 2, 3)
+
+    await deliveries.finish(1)
+    await deliveries.finish(2, ProcessingResult.FAILED)
+    await deliveries.finish(3)
+    await subscriber._flush_acks()
+
+    assert deliveries.settled == [("reject", 2, True), ("ack", 3, True)]
+
+
+async def test_a_full_batch_is_acked_without_waiting_for_the_flusher(subscriber):
+    subscriber._ack_batch_size = 2
+    deliveries = Deliveries(subscriber)
+    await deliveries.deliver(1, 2)
+
+    await deliveries.finish(1)
+    assert deliveries.settled == []
+
+    await deliveries.finish(2)
+    assert deliveries.settled == [("ack", 2, True)]
+
+
+async def test_a_failing_event_handler_fails_the_delivery():
+    async def track(event):
+        raise RuntimeError("tracking failed")
+
+    async def publish(event):
+        pass
+
+    class FakeUnitOfWork:
+        def collect_new_events(self):
+            return iter([])
+
+    bus = MessageBus(
+        puow=FakeUnitOfWork(), event_handlers={events.WalletActivated: [track, publish]}, command_handlers={}
+    )
+    subscriber = EventSubscriber(
+        connection_manager=None, messagebus=bus, queue_name="test", retry_delay=0,
+        event_registry={"WalletActivated": events.WalletActivated}
+    )
+    settled = []
+    body = json.dumps({"event_type": "WalletActivated", "wallet_id": "w1", "userid": "u1"}).encode()
+
+    await subscriber._handle_message(FakeMessage(1, settled, body))
+    await subscriber._flush_acks()
+
+    assert settled == [("reject", 1, True)]